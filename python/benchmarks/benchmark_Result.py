@@ -0,0 +1,297 @@
+"""
+Benchmarks for damask.Result on synthetic DADF5 files.
+
+The synthetic files mimic the layout written by the DAMASK solvers
+(including chunking, shuffle/gzip compression, and checksums of large
+datasets) but can be scaled independently in terms of cells, increments,
+phases, and constituents.
+
+The benchmarks follow the conventions of airspeed velocity (asv):
+methods prefixed by 'time_' are timed, methods prefixed by 'peakmem_'
+report the peak resident set size.
+They can also be run without asv by executing this module, e.g.
+
+    python -m benchmarks.benchmark_Result
+
+from within the 'python' directory.
+"""
+import sys
+import time
+import shutil
+import tempfile
+import itertools
+import multiprocessing
+import queue as queue_
+from pathlib import Path
+from typing import Sequence, Tuple, Dict, Any
+
+import h5py
+import numpy as np
+
+import damask
+from damask import util
+
+try:
+    import resource
+except ImportError:
+    resource = None                                                                                 # type: ignore
+
+
+chunk_size = 1024**2//8                                                                             # as in DAMASK's HDF5_utilities
+
+
+def write_DADF5(fname,
+                cells: Tuple[int, int, int] = (32,32,32),
+                N_increments: int = 4,
+                phases: Sequence[str] = ('alpha','beta'),
+                N_constituents: int = 1,
+                rng_seed = None):
+    """
+    Write a synthetic DADF5 file.
+
+    Parameters
+    ----------
+    fname : str or pathlib.Path
+        Name of the DADF5 file to be created.
+    cells : sequence of int, len (3), optional
+        Number of cells in x,y,z direction. Defaults to (32,32,32).
+    N_increments : int, optional
+        Number of increments. Defaults to 4.
+    phases : sequence of str, optional
+        Names of the phases. Defaults to ('alpha','beta').
+    N_constituents : int, optional
+        Number of constituents per material point. Defaults to 1.
+    rng_seed : {None, int, array_like[ints], SeedSequence, BitGenerator, Generator}, optional
+        A seed to initialize the BitGenerator.
+
+    """
+    rng = np.random.default_rng(rng_seed)
+    stamp = util.time_stamp()
+    N_cells = int(np.prod(cells))
+
+    def add(group, name, data, unit, description, **kwargs):
+        shape = data.shape
+        if compress := data.size >= chunk_size*2:
+            chunks = (chunk_size//int(np.prod(shape[1:])),)+shape[1:]
+        dataset = group.create_dataset(name,data=data,
+                                       chunks=chunks if compress else shape,
+                                       compression='gzip' if compress else None,
+                                       compression_opts=6 if compress else None,
+                                       shuffle=compress,fletcher32=True)
+        dataset.attrs.update({'unit':unit,'description':description,
+                              'created':stamp,'creator':'benchmark_Result'},**kwargs)
+
+    phase = rng.integers(len(phases),size=(N_cells,N_constituents))
+    entry = np.empty_like(phase)
+    N_entries = []
+    for p in range(len(phases)):
+        m = phase == p
+        entry[m] = np.arange(np.count_nonzero(m))
+        N_entries.append(np.count_nonzero(m))
+
+    with h5py.File(fname,'w') as f:
+        f.attrs.update({'DADF5_version_major':1,'DADF5_version_minor':0,
+                        'creator':'benchmark_Result','created':stamp,'call':'write_DADF5'})
+
+        f.create_group('geometry').attrs.update({'cells':np.array(cells,dtype=np.int32),
+                                                 'size':np.array(cells)*1.e-6,
+                                                 'origin':np.zeros(3)})
+
+        label = max(map(len,phases))
+        cell_to = f.create_group('cell_to')
+        mapping = np.empty((N_cells,N_constituents),dtype=[('label',f'S{label}'),('entry','<i8')])
+        mapping['label'] = np.array(phases,dtype=f'S{label}')[phase]
+        mapping['entry'] = entry
+        cell_to.create_dataset('phase',data=mapping)
+        mapping = np.empty(N_cells,dtype=[('label','S2'),('entry','<i8')])
+        mapping['label'] = b'SX'
+        mapping['entry'] = np.arange(N_cells)
+        cell_to.create_dataset('homogenization',data=mapping)
+
+        f.create_group('setup').attrs['description'] = 'input data used to run the simulation'
+
+        N_nodes = int(np.prod(np.array(cells)+1))
+        for inc in range(N_increments):
+            g = f.create_group(f'increment_{inc}')
+            g.attrs['t/s'] = float(inc)
+            add(g.create_group('geometry'),'u_n',rng.random((N_nodes,3))*1.e-8,'m','displacements of the nodes')
+            add(g['geometry'],'u_p',rng.random((N_cells,3))*1.e-8,'m','displacements of the materialpoints')
+
+            for p,N in zip(phases,N_entries):
+                m = g.create_group(f'phase/{p}/mechanical')
+                F = np.eye(3) + rng.random((N,3,3))*1.e-2*inc
+                add(m,'F',F,'1','deformation gradient')
+                add(m,'P',rng.random((N,3,3))*1.e8,'Pa','first Piola-Kirchhoff stress')
+                add(m,'O',damask.Rotation.from_random(N,rng_seed=rng).quaternion,'1',
+                    'crystal orientation as quaternion q_0 (q_1 q_2 q_3)',lattice='cF')
+                add(m,'xi_sl',rng.random((N,12))*1.e7,'Pa','resistance against plastic slip')
+
+            m = g.create_group('homogenization/SX/mechanical')
+            add(m,'F',np.eye(3) + rng.random((N_cells,3,3))*1.e-2*inc,'1','deformation gradient')
+            add(m,'P',rng.random((N_cells,3,3))*1.e8,'Pa','first Piola-Kirchhoff stress')
+
+
+def synthetic(cells: int, N_constituents: int, phases: Sequence[str] = ('alpha','beta')) -> Path:
+    """Return the name of a synthetic DADF5 file, which is created if not existing."""
+    fname = Path(tempfile.gettempdir())/'damask_benchmarks'/ \
+            'synthetic_{}x{}_{}.hdf5'.format(cells,N_constituents,'_'.join(phases))
+    if not fname.exists():
+        fname.parent.mkdir(parents=True,exist_ok=True)
+        write_DADF5(fname.with_suffix('.tmp'),(cells,)*3,phases=phases,N_constituents=N_constituents,
+                    rng_seed=20191102)
+        fname.with_suffix('.tmp').rename(fname)
+    return fname
+
+
+class Result:
+    """Reading and placing data."""
+
+    params = ([16,48],[1,2])
+    param_names = ['cells','N_constituents']
+
+    def setup(self, cells, N_constituents):
+        self.fname = synthetic(cells,N_constituents)
+        self.result = damask.Result(self.fname)
+
+    def time_init(self, cells, N_constituents):
+        damask.Result(self.fname)
+
+    def time_view(self, cells, N_constituents):
+        self.result.view(increments=-1).view_more(increments=0).view_less(phases='beta')
+
+    def time_get(self, cells, N_constituents):
+        self.result.get()
+
+    def peakmem_get(self, cells, N_constituents):
+        self.result.get()
+
+    def time_place(self, cells, N_constituents):
+        self.result.place()
+
+    def peakmem_place(self, cells, N_constituents):
+        self.result.place()
+
+
+class ResultAdd:
+    """Adding derived quantities."""
+
+    params = ([16,48],)
+    param_names = ['cells']
+    number = 1                                                                                      # time creation, not overwrite, of datasets
+    warmup_time = 0
+
+    def setup(self, cells):
+        self.tmp = Path(tempfile.mkdtemp())
+        shutil.copy(synthetic(cells,1),self.tmp/'result.hdf5')
+        self.result = damask.Result(self.tmp/'result.hdf5').view(protected=False)
+
+    def teardown(self, cells):
+        shutil.rmtree(self.tmp,ignore_errors=True)
+
+    def time_add_stress_Cauchy(self, cells):
+        self.result.add_stress_Cauchy()
+
+    def time_add_equivalent_Mises(self, cells):
+        self.result.add_equivalent_Mises('P')
+
+    def time_add_IPF_color(self, cells):
+        self.result.add_IPF_color([0,0,1])
+
+    def time_add_calculation(self, cells):
+        self.result.add_calculation('np.linalg.norm(#F#,axis=(1,2))','norm_F')
+
+    def peakmem_add_stress_Cauchy(self, cells):
+        self.result.add_stress_Cauchy()
+
+
+class ResultExport:
+    """Exporting to other formats."""
+
+    params = ([16,48],)
+    param_names = ['cells']
+
+    def setup(self, cells):
+        self.tmp = Path(tempfile.mkdtemp())
+        self.result = damask.Result(synthetic(cells,1))
+        self.single = damask.Result(synthetic(cells,1,['alpha']))
+
+    def teardown(self, cells):
+        shutil.rmtree(self.tmp,ignore_errors=True)
+
+    def time_export_VTK(self, cells):
+        self.result.export_VTK(target_dir=self.tmp,parallel=False)
+
+    def peakmem_export_VTK(self, cells):
+        self.result.export_VTK(target_dir=self.tmp,parallel=False)
+
+    def time_export_XDMF(self, cells):
+        self.single.export_XDMF(target_dir=self.tmp)
+
+    def time_export_DADF5(self, cells):
+        self.result.view(increments=[0,-1]).export_DADF5(self.tmp/'export.hdf5')
+
+
+def _peak_RSS() -> float:
+    """Peak resident set size of the current process in MiB."""
+    if resource is None: return np.nan
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss/1024**2 if sys.platform == 'darwin' else rss/1024                                   # bytes on macOS, KiB else
+
+
+def _measure(cls_name: str, method: str, param: Tuple, queue):
+    """Run a single benchmark (in a fresh process) and report wall time and peak RSS."""
+    bench = globals()[cls_name]()
+    bench.setup(*param)
+    RSS_setup = _peak_RSS()
+    tic = time.perf_counter()
+    getattr(bench,method)(*param)
+    toc = time.perf_counter()
+    queue.put((toc-tic,_peak_RSS(),RSS_setup))
+    if hasattr(bench,'teardown'): bench.teardown(*param)
+
+
+def run(benchmarks: Sequence[str] = ('Result','ResultAdd','ResultExport')) -> Dict[str, Any]:
+    """
+    Run benchmarks without asv.
+
+    Every benchmark is executed in a separate process so that the
+    peak resident set size (RSS) is not influenced by other benchmarks.
+
+    Parameters
+    ----------
+    benchmarks : sequence of str, optional
+        Names of the benchmark classes to run.
+        Defaults to all.
+
+    Returns
+    -------
+    results : dict
+        Wall time in s, peak RSS in MiB, and peak RSS after setup
+        in MiB per benchmark and parameter combination.
+
+    """
+    ctx = multiprocessing.get_context('spawn')
+    results = {}
+    for cls_name in benchmarks:
+        cls = globals()[cls_name]
+        for param in itertools.product(*cls.params):
+            for method in [m for m in dir(cls) if m.startswith(('time_','peakmem_'))]:
+                queue = ctx.Queue()
+                p = ctx.Process(target=_measure,args=(cls_name,method,param,queue))
+                p.start()
+                while True:
+                    try:
+                        results[f'{cls_name}.{method}{param}'] = queue.get(timeout=1.)
+                        break
+                    except queue_.Empty:
+                        if p.exitcode not in (None,0):
+                            raise RuntimeError(f'{cls_name}.{method}{param} failed with exit code {p.exitcode}')
+                p.join()
+    return results
+
+
+if __name__ == '__main__':
+    print(f'{"benchmark":<52} {"time/s":>10} {"RSS/MiB":>10} {"(setup)":>10}')
+    for name,(t,RSS,RSS_setup) in run(sys.argv[1:] if len(sys.argv)>1 else
+                                      ('Result','ResultAdd','ResultExport')).items():
+        print(f'{name:<52} {t:10.4f} {RSS:10.1f} {RSS_setup:10.1f}')
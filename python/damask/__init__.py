@@ -20,6 +20,9 @@ from .                 import grid_filters     # noqa
 from ._rotation        import Rotation         # noqa
 from ._crystal         import Crystal          # noqa
 from ._orientation     import Orientation      # noqa
+from ._rotationindex   import RotationIndex    # noqa
+from ._rotationaverager import RotationAverager # noqa
+from ._odf             import ODF              # noqa
 from ._table           import Table            # noqa
 from ._colormap        import Colormap         # noqa
 from ._vtk             import VTK              # noqa
@@ -28,3 +31,4 @@ from ._configmaterial  import ConfigMaterial   # noqa
 from ._loadcasegrid    import LoadcaseGrid     # noqa
 from ._geomgrid        import GeomGrid         # noqa
 from ._result          import Result           # noqa
+from ._resultcatalog   import ResultCatalog    # noqa
@@ -131,12 +131,12 @@ class ConfigMaterial(YAML):
 
             if grain_data is None:
                 phase = f['/'.join([b,c,phases])][()].flatten()
-                O = Rotation.from_Euler_angles(f['/'.join([b,c,Euler_angles])]).as_quaternion().reshape(-1,4) # noqa
+                O = Rotation.from_Euler_angles(f['/'.join([b,c,Euler_angles])][()].astype(float)).as_quaternion().reshape(-1,4) # noqa
                 _,idx = np.unique(np.hstack([O,phase.reshape(-1,1)]),return_index=True,axis=0)
                 idx = np.sort(idx)
             else:
                 phase = f['/'.join([b,grain_data,phases])][()]
-                O = Rotation.from_Euler_angles(f['/'.join([b,grain_data,Euler_angles])]).as_quaternion() # noqa
+                O = Rotation.from_Euler_angles(f['/'.join([b,grain_data,Euler_angles])][()].astype(float)).as_quaternion() # noqa
                 idx = np.arange(phase.size)
 
             if cell_ensemble_data is not None and phase_names is not None:
@@ -1,4 +1,4 @@
-from typing import Optional, Union, Dict, List, Tuple
+from typing import Optional, Union, Dict, List, Tuple, Any, Callable
 
 import numpy as np
 
@@ -429,6 +429,379 @@ orientation_relationships: Dict[str, Dict[str,List[np.ndarray]]] = {
   },
 }
 
+_standard_triangles: Dict[CrystalFamily, Dict[str, np.ndarray]] = {
+            'cubic':    {'improper':np.array([ [-1.            ,  0.            ,  1. ],
+                                               [ np.sqrt(2.)   , -np.sqrt(2.)   ,  0. ],
+                                               [ 0.            ,  np.sqrt(3.)   ,  0. ] ]),
+                           'proper':np.array([ [ 0.            , -1.            ,  1. ],
+                                               [-np.sqrt(2.)   , np.sqrt(2.)    ,  0. ],
+                                               [ np.sqrt(3.)   ,  0.            ,  0. ] ]),
+                        },
+            'hexagonal':
+                        {'improper':np.array([ [ 0.            ,  0.            ,  1. ],
+                                               [ 1.            , -np.sqrt(3.)   ,  0. ],
+                                               [ 0.            ,  2.            ,  0. ] ]),
+                           'proper':np.array([ [ 0.            ,  0.            ,  1. ],
+                                               [-1.            ,  np.sqrt(3.)   ,  0. ],
+                                               [ np.sqrt(3.)   , -1.            ,  0. ] ]),
+                        },
+            'tetragonal':
+                        {'improper':np.array([ [ 0.            ,  0.            ,  1. ],
+                                               [ 1.            , -1.            ,  0. ],
+                                               [ 0.            ,  np.sqrt(2.)   ,  0. ] ]),
+                           'proper':np.array([ [ 0.            ,  0.            ,  1. ],
+                                               [-1.            ,  1.            ,  0. ],
+                                               [ np.sqrt(2.)   ,  0.            ,  0. ] ]),
+                        },
+            'orthorhombic':
+                        {'improper':np.array([ [ 0., 0., 1.],
+                                               [ 1., 0., 0.],
+                                               [ 0., 1., 0.] ]),
+                           'proper':np.array([ [ 0., 0., 1.],
+                                               [-1., 0., 0.],
+                                               [ 0., 1., 0.] ]),
+                        }}
+
+_symmetry_operations: Dict[CrystalFamily, List] = {
+            'cubic':         [
+                              [ 1.0,            0.0,            0.0,            0.0            ],
+                              [ 0.0,            1.0,            0.0,            0.0            ],
+                              [ 0.0,            0.0,            1.0,            0.0            ],
+                              [ 0.0,            0.0,            0.0,            1.0            ],
+                              [ 0.0,            0.0,            0.5*np.sqrt(2), 0.5*np.sqrt(2) ],
+                              [ 0.0,            0.0,            0.5*np.sqrt(2),-0.5*np.sqrt(2) ],
+                              [ 0.0,            0.5*np.sqrt(2), 0.0,            0.5*np.sqrt(2) ],
+                              [ 0.0,            0.5*np.sqrt(2), 0.0,           -0.5*np.sqrt(2) ],
+                              [ 0.0,            0.5*np.sqrt(2),-0.5*np.sqrt(2), 0.0            ],
+                              [ 0.0,           -0.5*np.sqrt(2),-0.5*np.sqrt(2), 0.0            ],
+                              [ 0.5,            0.5,            0.5,            0.5            ],
+                              [-0.5,            0.5,            0.5,            0.5            ],
+                              [-0.5,            0.5,            0.5,           -0.5            ],
+                              [-0.5,            0.5,           -0.5,            0.5            ],
+                              [-0.5,           -0.5,            0.5,            0.5            ],
+                              [-0.5,           -0.5,            0.5,           -0.5            ],
+                              [-0.5,           -0.5,           -0.5,            0.5            ],
+                              [-0.5,            0.5,           -0.5,           -0.5            ],
+                              [-0.5*np.sqrt(2), 0.0,            0.0,            0.5*np.sqrt(2) ],
+                              [ 0.5*np.sqrt(2), 0.0,            0.0,            0.5*np.sqrt(2) ],
+                              [-0.5*np.sqrt(2), 0.0,            0.5*np.sqrt(2), 0.0            ],
+                              [-0.5*np.sqrt(2), 0.0,           -0.5*np.sqrt(2), 0.0            ],
+                              [-0.5*np.sqrt(2), 0.5*np.sqrt(2), 0.0,            0.0            ],
+                              [-0.5*np.sqrt(2),-0.5*np.sqrt(2), 0.0,            0.0            ],
+                            ], # 432
+            'hexagonal':    [
+                              [ 1.0,            0.0,            0.0,            0.0            ],
+                              [-0.5*np.sqrt(3), 0.0,            0.0,           -0.5            ],
+                              [ 0.5,            0.0,            0.0,            0.5*np.sqrt(3) ],
+                              [ 0.0,            0.0,            0.0,            1.0            ],
+                              [-0.5,            0.0,            0.0,            0.5*np.sqrt(3) ],
+                              [-0.5*np.sqrt(3), 0.0,            0.0,            0.5            ],
+                              [ 0.0,            1.0,            0.0,            0.0            ],
+                              [ 0.0,           -0.5*np.sqrt(3), 0.5,            0.0            ],
+                              [ 0.0,            0.5,           -0.5*np.sqrt(3), 0.0            ],
+                              [ 0.0,            0.0,            1.0,            0.0            ],
+                              [ 0.0,           -0.5,           -0.5*np.sqrt(3), 0.0            ],
+                              [ 0.0,            0.5*np.sqrt(3), 0.5,            0.0            ],
+                            ], # 622
+            'tetragonal':   [
+                              [ 1.0,            0.0,            0.0,            0.0            ],
+                              [ 0.0,            1.0,            0.0,            0.0            ],
+                              [ 0.0,            0.0,            1.0,            0.0            ],
+                              [ 0.0,            0.0,            0.0,            1.0            ],
+                              [ 0.0,            0.5*np.sqrt(2), 0.5*np.sqrt(2), 0.0            ],
+                              [ 0.0,           -0.5*np.sqrt(2), 0.5*np.sqrt(2), 0.0            ],
+                              [ 0.5*np.sqrt(2), 0.0,            0.0,            0.5*np.sqrt(2) ],
+                              [-0.5*np.sqrt(2), 0.0,            0.0,            0.5*np.sqrt(2) ],
+                            ], # 422
+            'orthorhombic': [
+                              [ 1.0,0.0,0.0,0.0 ],
+                              [ 0.0,1.0,0.0,0.0 ],
+                              [ 0.0,0.0,1.0,0.0 ],
+                              [ 0.0,0.0,0.0,1.0 ],
+                            ], # 222
+            'monoclinic':   [
+                              [ 1.0,0.0,0.0,0.0 ],
+                              [ 0.0,0.0,1.0,0.0 ],
+                            ], # 2
+            'triclinic':    [
+                              [ 1.0,0.0,0.0,0.0 ],
+                            ]} # 1
+
+_kinematics: Dict[Optional[BravaisLattice], Dict[CrystalKinematics, List[np.ndarray]]] = {
+            'cF': {
+                'slip': [np.array([
+                           [ 0,+1,-1, +1,+1,+1],
+                           [-1, 0,+1, +1,+1,+1],
+                           [+1,-1, 0, +1,+1,+1],
+                           [ 0,-1,-1, -1,-1,+1],
+                           [+1, 0,+1, -1,-1,+1],
+                           [-1,+1, 0, -1,-1,+1],
+                           [ 0,-1,+1, +1,-1,-1],
+                           [-1, 0,-1, +1,-1,-1],
+                           [+1,+1, 0, +1,-1,-1],
+                           [ 0,+1,+1, -1,+1,-1],
+                           [+1, 0,-1, -1,+1,-1],
+                           [-1,-1, 0, -1,+1,-1]]),
+                         np.array([
+                           [+1,+1, 0, +1,-1, 0],
+                           [+1,-1, 0, +1,+1, 0],
+                           [+1, 0,+1, +1, 0,-1],
+                           [+1, 0,-1, +1, 0,+1],
+                           [ 0,+1,+1,  0,+1,-1],
+                           [ 0,+1,-1,  0,+1,+1]])],
+                'twin': [np.array([
+                           [-2, 1, 1,  1, 1, 1],
+                           [ 1,-2, 1,  1, 1, 1],
+                           [ 1, 1,-2,  1, 1, 1],
+                           [ 2,-1, 1, -1,-1, 1],
+                           [-1, 2, 1, -1,-1, 1],
+                           [-1,-1,-2, -1,-1, 1],
+                           [-2,-1,-1,  1,-1,-1],
+                           [ 1, 2,-1,  1,-1,-1],
+                           [ 1,-1, 2,  1,-1,-1],
+                           [ 2, 1,-1, -1, 1,-1],
+                           [-1,-2,-1, -1, 1,-1],
+                           [-1, 1, 2, -1, 1,-1]])]
+            },
+            'cI': {
+                'slip': [np.array([
+                           [+1,-1,+1, +0,+1,+1],
+                           [+1,-1,+1, +1,+0,-1],
+                           [+1,-1,+1, -1,-1,+0],
+                           [-1,-1,+1, +0,-1,-1],
+                           [-1,-1,+1, +1,+0,+1],
+                           [-1,-1,+1, -1,+1,+0],
+                           [+1,+1,+1, +0,+1,-1],
+                           [+1,+1,+1, -1,+0,+1],
+                           [+1,+1,+1, +1,-1,+0],
+                           [-1,+1,+1, +0,-1,+1],
+                           [-1,+1,+1, -1,+0,-1],
+                           [-1,+1,+1, +1,+1,+0]]),
+                         np.array([
+                           [+1,-1,+1, +2,+1,-1],
+                           [+1,-1,+1, -1,+1,+2],
+                           [+1,-1,+1, +1,+2,+1],
+                           [-1,-1,+1, +2,-1,+1],
+                           [-1,-1,+1, +1,+1,+2],
+                           [-1,-1,+1, -1,+2,+1],
+                           [+1,+1,+1, +1,+1,-2],
+                           [+1,+1,+1, +1,-2,+1],
+                           [+1,+1,+1, -2,+1,+1],
+                           [-1,+1,+1, +1,-1,+2],
+                           [-1,+1,+1, +1,+2,-1],
+                           [-1,+1,+1, +2,+1,+1]]),
+                         np.array([
+                           [+1,-1,+1, -1,+2,+3],
+                           [+1,-1,+1, +1,+3,+2],
+                           [+1,-1,+1, -2,+1,+3],
+                           [+1,-1,+1, +2,+3,+1],
+                           [+1,-1,+1, +3,+1,-2],
+                           [+1,-1,+1, +3,+2,-1],
+                           [-1,-1,+1, +1,+2,+3],
+                           [-1,-1,+1, -1,+3,+2],
+                           [-1,-1,+1, +2,+1,+3],
+                           [-1,-1,+1, -2,+3,+1],
+                           [-1,-1,+1, +3,-1,+2],
+                           [-1,-1,+1, +3,-2,+1],
+                           [+1,+1,+1, +1,+2,-3],
+                           [+1,+1,+1, +1,-3,+2],
+                           [+1,+1,+1, +2,+1,-3],
+                           [+1,+1,+1, +2,-3,+1],
+                           [+1,+1,+1, -3,+1,+2],
+                           [+1,+1,+1, -3,+2,+1],
+                           [-1,+1,+1, +1,-2, 3],
+                           [-1,+1,+1, +1,+3,-2],
+                           [-1,+1,+1, +2,-1,+3],
+                           [-1,+1,+1, +2,+3,-1],
+                           [-1,+1,+1, +3,+1,+2],
+                           [-1,+1,+1, +3,+2,+1]])],
+                'twin': [np.array([
+                           [+1,-1,+1, +2,+1,-1],
+                           [+1,-1,+1, -1,+1,+2],
+                           [+1,-1,+1, +1,+2,+1],
+                           [-1,-1,+1, +2,-1,+1],
+                           [-1,-1,+1, +1,+1,+2],
+                           [-1,-1,+1, -1,+2,+1],
+                           [+1,+1,+1, +1,+1,-2],
+                           [+1,+1,+1, +1,-2,+1],
+                           [+1,+1,+1, -2,+1,+1],
+                           [-1,+1,+1, +1,-1,+2],
+                           [-1,+1,+1, +1,+2,-1],
+                           [-1,+1,+1, +2,+1,+1]])]
+            },
+            'hP': {
+                'slip': [np.array([
+                           [+2,-1,-1, 0,  0, 0, 0,+1],
+                           [-1,+2,-1, 0,  0, 0, 0,+1],
+                           [-1,-1,+2, 0,  0, 0, 0,+1]]),
+                         np.array([
+                           [+2,-1,-1, 0,  0,+1,-1, 0],
+                           [-1,+2,-1, 0, -1, 0,+1, 0],
+                           [-1,-1,+2, 0, +1,-1, 0, 0]]),
+                         np.array([
+                           [-1,+2,-1, 0, +1, 0,-1,+1],
+                           [-2,+1,+1, 0,  0,+1,-1,+1],
+                           [-1,-1,+2, 0, -1,+1, 0,+1],
+                           [+1,-2,+1, 0, -1, 0,+1,+1],
+                           [+2,-1,-1, 0,  0,-1,+1,+1],
+                           [+1,+1,-2, 0, +1,-1, 0,+1]]),
+                         np.array([
+                           [-2,+1,+1,+3, +1, 0,-1,+1],
+                           [-1,-1,+2,+3, +1, 0,-1,+1],
+                           [-1,-1,+2,+3,  0,+1,-1,+1],
+                           [+1,-2,+1,+3,  0,+1,-1,+1],
+                           [+1,-2,+1,+3, -1,+1, 0,+1],
+                           [+2,-1,-1,+3, -1,+1, 0,+1],
+                           [+2,-1,-1,+3, -1, 0,+1,+1],
+                           [+1,+1,-2,+3, -1, 0,+1,+1],
+                           [+1,+1,-2,+3,  0,-1,+1,+1],
+                           [-1,+2,-1,+3,  0,-1,+1,+1],
+                           [-1,+2,-1,+3, +1,-1, 0,+1],
+                           [-2,+1,+1,+3, +1,-1, 0,+1]]),
+                         np.array([
+                           [-1,-1,+2,+3, +1,+1,-2,+2],
+                           [+1,-2,+1,+3, -1,+2,-1,+2],
+                           [+2,-1,-1,+3, -2,+1,+1,+2],
+                           [+1,+1,-2,+3, -1,-1,+2,+2],
+                           [-1,+2,-1,+3, +1,-2,+1,+2],
+                           [-2,+1,+1,+3, +2,-1,-1,+2]])],
+                'twin': [np.array([
+                           [-1, 0, 1, 1,  1, 0,-1, 2],   # shear = (3-(c/a)^2)/(sqrt(3) c/a) <-10.1>{10.2}
+                           [ 0,-1, 1, 1,  0, 1,-1, 2],
+                           [ 1,-1, 0, 1, -1, 1, 0, 2],
+                           [ 1, 0,-1, 1, -1, 0, 1, 2],
+                           [ 0, 1,-1, 1,  0,-1, 1, 2],
+                           [-1, 1, 0, 1,  1,-1, 0, 2]]),
+                         np.array([
+                           [-1,-1, 2, 6,  1, 1,-2, 1],   # shear = 1/(c/a) <11.6>{-1-1.1}
+                           [ 1,-2, 1, 6, -1, 2,-1, 1],
+                           [ 2,-1,-1, 6, -2, 1, 1, 1],
+                           [ 1, 1,-2, 6, -1,-1, 2, 1],
+                           [-1, 2,-1, 6,  1,-2, 1, 1],
+                           [-2, 1, 1, 6,  2,-1,-1, 1]]),
+                         np.array([
+                           [ 1, 0,-1,-2,  1, 0,-1, 1],   # shear = (4(c/a)^2-9)/(4 sqrt(3) c/a)  <10.-2>{10.1}
+                           [ 0, 1,-1,-2,  0, 1,-1, 1],
+                           [-1, 1, 0,-2, -1, 1, 0, 1],
+                           [-1, 0, 1,-2, -1, 0, 1, 1],
+                           [ 0,-1, 1,-2,  0,-1, 1, 1],
+                           [ 1,-1, 0,-2,  1,-1, 0, 1]]),
+                         np.array([
+                           [ 1, 1,-2,-3,  1, 1,-2, 2],   # shear = 2((c/a)^2-2)/(3 c/a)  <11.-3>{11.2}
+                           [-1, 2,-1,-3, -1, 2,-1, 2],
+                           [-2, 1, 1,-3, -2, 1, 1, 2],
+                           [-1,-1, 2,-3, -1,-1, 2, 2],
+                           [ 1,-2, 1,-3,  1,-2, 1, 2],
+                           [ 2,-1,-1,-3,  2,-1,-1, 2]])]
+            },
+            'tI': {
+                'slip': [np.array([
+                           [ 0, 0,+1, +1, 0, 0],
+                           [ 0, 0,+1,  0,+1, 0]]),
+                         np.array([
+                           [ 0, 0,+1, +1,+1, 0],
+                           [ 0, 0,+1, -1,+1, 0]]),
+                         np.array([
+                           [ 0,+1, 0, +1, 0, 0],
+                           [+1, 0, 0,  0,+1, 0]]),
+                         np.array([
+                           [+1,-1,+1, +1,+1, 0],
+                           [+1,-1,-1, +1,+1, 0],
+                           [-1,-1,-1, -1,+1, 0],
+                           [-1,-1,+1, -1,+1, 0]]),
+                         np.array([
+                           [+1,-1, 0, +1,+1, 0],
+                           [+1,+1, 0, +1,-1, 0]]),
+                         np.array([
+                           [ 0,+1,+1, +1, 0, 0],
+                           [ 0,-1,+1, +1, 0, 0],
+                           [-1, 0,+1,  0,+1, 0],
+                           [+1, 0,+1,  0,+1, 0]]),
+                         np.array([
+                           [ 0,+1, 0,  0, 0,+1],
+                           [+1, 0, 0,  0, 0,+1]]),
+                         np.array([
+                           [+1,+1, 0,  0, 0,+1],
+                           [-1,+1, 0,  0, 0,+1]]),
+                         np.array([
+                           [ 0,+1,-1,  0,+1,+1],
+                           [ 0,-1,-1,  0,-1,+1],
+                           [-1, 0,-1, -1, 0,+1],
+                           [+1, 0,-1, +1, 0,+1]]),
+                         np.array([
+                           [+1,-1,+1,  0,+1,+1],
+                           [+1,+1,-1,  0,+1,+1],
+                           [+1,+1,+1,  0,+1,-1],
+                           [-1,+1,+1,  0,+1,-1],
+                           [+1,-1,-1, +1, 0,+1],
+                           [-1,-1,+1, +1, 0,+1],
+                           [+1,+1,+1, +1, 0,-1],
+                           [+1,-1,+1, +1, 0,-1]]),
+                         np.array([
+                           [+1, 0, 0,  0,+1,+1],
+                           [+1, 0, 0,  0,+1,-1],
+                           [ 0,+1, 0, +1, 0,+1],
+                           [ 0,+1, 0, +1, 0,-1]]),
+                         np.array([
+                           [ 0,+1,-1, +2,+1,+1],
+                           [ 0,-1,-1, +2,-1,+1],
+                           [+1, 0,-1, +1,+2,+1],
+                           [-1, 0,-1, -1,+2,+1],
+                           [ 0,+1,-1, -2,+1,+1],
+                           [ 0,-1,-1, -2,-1,+1],
+                           [-1, 0,-1, -1,-2,+1],
+                           [+1, 0,-1, +1,-2,+1]]),
+                         np.array([
+                           [-1,+1,+1, +2,+1,+1],
+                           [-1,-1,+1, +2,-1,+1],
+                           [+1,-1,+1, +1,+2,+1],
+                           [-1,-1,+1, -1,+2,+1],
+                           [+1,+1,+1, -2,+1,+1],
+                           [+1,-1,+1, -2,-1,+1],
+                           [-1,+1,+1, -1,-2,+1],
+                           [+1,+1,+1, +1,-2,+1]])]
+                }
+}
+
+_cache: Dict[tuple, Any] = {}
+_cache_size = 1024                                                                                  # number of cached results
+
+def _cached(key: tuple,
+            compute: Callable[[], Any]) -> Any:
+    """
+    Evaluate only once per key and share the result.
+
+    Arrays, also when contained in lists or dictionaries, are set to read-only.
+    The least recently used result is discarded if the cache is full.
+
+    Parameters
+    ----------
+    key : tuple
+        Identifier of the result, e.g. quantity name and crystal family.
+    compute : callable
+        Function without arguments that evaluates the result.
+
+    Returns
+    -------
+    result : any
+        Result of compute, stored in the module-level cache.
+
+    """
+    def freeze(v):
+        if isinstance(v,np.ndarray):
+            v.flags.writeable = False
+        elif isinstance(v,(list,dict)):
+            for v_ in (v.values() if isinstance(v,dict) else v): freeze(v_)
+        return v
+
+    if key in _cache:
+        _cache[key] = _cache.pop(key)                                                               # mark as most recently used
+    else:
+        if len(_cache) >= _cache_size: del _cache[next(iter(_cache))]
+        _cache[key] = freeze(compute())
+    return _cache[key]
+
+
 class Crystal():
     """
     Representation of a crystal as (general) crystal family or (more specific) as a scaled Bravais lattice.
@@ -645,39 +1018,8 @@ class Crystal():
         ...    }
 
         """
-        _basis: Dict[CrystalFamily, Dict[str, np.ndarray]]  = {
-            'cubic':    {'improper':np.array([ [-1.            ,  0.            ,  1. ],
-                                               [ np.sqrt(2.)   , -np.sqrt(2.)   ,  0. ],
-                                               [ 0.            ,  np.sqrt(3.)   ,  0. ] ]),
-                           'proper':np.array([ [ 0.            , -1.            ,  1. ],
-                                               [-np.sqrt(2.)   , np.sqrt(2.)    ,  0. ],
-                                               [ np.sqrt(3.)   ,  0.            ,  0. ] ]),
-                        },
-            'hexagonal':
-                        {'improper':np.array([ [ 0.            ,  0.            ,  1. ],
-                                               [ 1.            , -np.sqrt(3.)   ,  0. ],
-                                               [ 0.            ,  2.            ,  0. ] ]),
-                           'proper':np.array([ [ 0.            ,  0.            ,  1. ],
-                                               [-1.            ,  np.sqrt(3.)   ,  0. ],
-                                               [ np.sqrt(3.)   , -1.            ,  0. ] ]),
-                        },
-            'tetragonal':
-                        {'improper':np.array([ [ 0.            ,  0.            ,  1. ],
-                                               [ 1.            , -1.            ,  0. ],
-                                               [ 0.            ,  np.sqrt(2.)   ,  0. ] ]),
-                           'proper':np.array([ [ 0.            ,  0.            ,  1. ],
-                                               [-1.            ,  1.            ,  0. ],
-                                               [ np.sqrt(2.)   ,  0.            ,  0. ] ]),
-                        },
-            'orthorhombic':
-                        {'improper':np.array([ [ 0., 0., 1.],
-                                               [ 1., 0., 0.],
-                                               [ 0., 1., 0.] ]),
-                           'proper':np.array([ [ 0., 0., 1.],
-                                               [-1., 0., 0.],
-                                               [ 0., 1., 0.] ]),
-                        }}
-        return _basis.get(self.family, None)
+        basis = _standard_triangles.get(self.family,None)
+        return None if basis is None else {k:v.copy() for k,v in basis.items()}
 
 
     @property
@@ -694,90 +1036,28 @@ class Crystal():
         the highest order is chosen:
 
         Overview of crystal classes and point group in Hermann-Mauguin
-        notation used for definition of symmetry operations.
-        - tricinic: 1
-        - monoclinic: 2
-        - orthorhombic: 222
-        - tetragonal: 422
-        - hexagonal: 622
-        - cubic: 432
-
-
-        References
-        ----------
-        U.F. Kocks et al.,
-        Texture and Anisotropy: Preferred Orientations in Polycrystals
-        and their Effect on Materials Properties.
-        Cambridge University Press 1998. Table II
-
-        https://en.wikipedia.org/wiki/Crystal_system#Crystal_classes
-
-        """
-        _symmetry_operations: Dict[CrystalFamily, List]  = {
-            'cubic':         [
-                              [ 1.0,            0.0,            0.0,            0.0            ],
-                              [ 0.0,            1.0,            0.0,            0.0            ],
-                              [ 0.0,            0.0,            1.0,            0.0            ],
-                              [ 0.0,            0.0,            0.0,            1.0            ],
-                              [ 0.0,            0.0,            0.5*np.sqrt(2), 0.5*np.sqrt(2) ],
-                              [ 0.0,            0.0,            0.5*np.sqrt(2),-0.5*np.sqrt(2) ],
-                              [ 0.0,            0.5*np.sqrt(2), 0.0,            0.5*np.sqrt(2) ],
-                              [ 0.0,            0.5*np.sqrt(2), 0.0,           -0.5*np.sqrt(2) ],
-                              [ 0.0,            0.5*np.sqrt(2),-0.5*np.sqrt(2), 0.0            ],
-                              [ 0.0,           -0.5*np.sqrt(2),-0.5*np.sqrt(2), 0.0            ],
-                              [ 0.5,            0.5,            0.5,            0.5            ],
-                              [-0.5,            0.5,            0.5,            0.5            ],
-                              [-0.5,            0.5,            0.5,           -0.5            ],
-                              [-0.5,            0.5,           -0.5,            0.5            ],
-                              [-0.5,           -0.5,            0.5,            0.5            ],
-                              [-0.5,           -0.5,            0.5,           -0.5            ],
-                              [-0.5,           -0.5,           -0.5,            0.5            ],
-                              [-0.5,            0.5,           -0.5,           -0.5            ],
-                              [-0.5*np.sqrt(2), 0.0,            0.0,            0.5*np.sqrt(2) ],
-                              [ 0.5*np.sqrt(2), 0.0,            0.0,            0.5*np.sqrt(2) ],
-                              [-0.5*np.sqrt(2), 0.0,            0.5*np.sqrt(2), 0.0            ],
-                              [-0.5*np.sqrt(2), 0.0,           -0.5*np.sqrt(2), 0.0            ],
-                              [-0.5*np.sqrt(2), 0.5*np.sqrt(2), 0.0,            0.0            ],
-                              [-0.5*np.sqrt(2),-0.5*np.sqrt(2), 0.0,            0.0            ],
-                            ], # 432
-            'hexagonal':    [
-                              [ 1.0,            0.0,            0.0,            0.0            ],
-                              [-0.5*np.sqrt(3), 0.0,            0.0,           -0.5            ],
-                              [ 0.5,            0.0,            0.0,            0.5*np.sqrt(3) ],
-                              [ 0.0,            0.0,            0.0,            1.0            ],
-                              [-0.5,            0.0,            0.0,            0.5*np.sqrt(3) ],
-                              [-0.5*np.sqrt(3), 0.0,            0.0,            0.5            ],
-                              [ 0.0,            1.0,            0.0,            0.0            ],
-                              [ 0.0,           -0.5*np.sqrt(3), 0.5,            0.0            ],
-                              [ 0.0,            0.5,           -0.5*np.sqrt(3), 0.0            ],
-                              [ 0.0,            0.0,            1.0,            0.0            ],
-                              [ 0.0,           -0.5,           -0.5*np.sqrt(3), 0.0            ],
-                              [ 0.0,            0.5*np.sqrt(3), 0.5,            0.0            ],
-                            ], # 622
-            'tetragonal':   [
-                              [ 1.0,            0.0,            0.0,            0.0            ],
-                              [ 0.0,            1.0,            0.0,            0.0            ],
-                              [ 0.0,            0.0,            1.0,            0.0            ],
-                              [ 0.0,            0.0,            0.0,            1.0            ],
-                              [ 0.0,            0.5*np.sqrt(2), 0.5*np.sqrt(2), 0.0            ],
-                              [ 0.0,           -0.5*np.sqrt(2), 0.5*np.sqrt(2), 0.0            ],
-                              [ 0.5*np.sqrt(2), 0.0,            0.0,            0.5*np.sqrt(2) ],
-                              [-0.5*np.sqrt(2), 0.0,            0.0,            0.5*np.sqrt(2) ],
-                            ], # 422
-            'orthorhombic': [
-                              [ 1.0,0.0,0.0,0.0 ],
-                              [ 0.0,1.0,0.0,0.0 ],
-                              [ 0.0,0.0,1.0,0.0 ],
-                              [ 0.0,0.0,0.0,1.0 ],
-                            ], # 222
-            'monoclinic':   [
-                              [ 1.0,0.0,0.0,0.0 ],
-                              [ 0.0,0.0,1.0,0.0 ],
-                            ], # 2
-            'triclinic':    [
-                              [ 1.0,0.0,0.0,0.0 ],
-                            ]} # 1
-        return Rotation.from_quaternion(_symmetry_operations[self.family],accept_homomorph=True)
+        notation used for definition of symmetry operations.
+        - tricinic: 1
+        - monoclinic: 2
+        - orthorhombic: 222
+        - tetragonal: 422
+        - hexagonal: 622
+        - cubic: 432
+
+
+        References
+        ----------
+        U.F. Kocks et al.,
+        Texture and Anisotropy: Preferred Orientations in Polycrystals
+        and their Effect on Materials Properties.
+        Cambridge University Press 1998. Table II
+
+        https://en.wikipedia.org/wiki/Crystal_system#Crystal_classes
+
+        """
+        return Rotation(_cached(('symmetry_operations',self.family),
+                                lambda: Rotation.from_quaternion(_symmetry_operations[self.family],
+                                                                 accept_homomorph=True).quaternion))
 
 
     @property
@@ -807,7 +1087,8 @@ class Crystal():
         """
         if self.parameters is None:
             raise KeyError('missing crystal lattice parameters')
-        return np.array([
+        return _cached(('basis_real',)+tuple(self.parameters.values()),
+                       lambda: np.array([
                           [1,0,0],
                           [np.cos(self.gamma),np.sin(self.gamma),0],
                           [np.cos(self.beta),
@@ -815,13 +1096,16 @@ class Crystal():
                            np.sqrt(1 - np.cos(self.alpha)**2 - np.cos(self.beta)**2 - np.cos(self.gamma)**2
                                  + 2 * np.cos(self.alpha)    * np.cos(self.beta)    * np.cos(self.gamma))/np.sin(self.gamma)],
                          ]).T \
-             * np.array([self.a,self.b,self.c])
+             * np.array([self.a,self.b,self.c])).copy()
 
 
     @property
     def basis_reciprocal(self) -> np.ndarray:
         """Return reciprocal (dual) crystal basis."""
-        return np.linalg.inv(self.basis_real.T)
+        if self.parameters is None:
+            raise KeyError('missing crystal lattice parameters')
+        return _cached(('basis_reciprocal',)+tuple(self.parameters.values()),
+                       lambda: np.linalg.inv(self.basis_real.T)).copy()
 
 
     @property
@@ -938,246 +1222,15 @@ class Crystal():
             Directions and planes of deformation mode families.
 
         """
-        _kinematics: Dict[Optional[BravaisLattice], Dict[CrystalKinematics, List[np.ndarray]]] = {
-            'cF': {
-                'slip': [np.array([
-                           [ 0,+1,-1, +1,+1,+1],
-                           [-1, 0,+1, +1,+1,+1],
-                           [+1,-1, 0, +1,+1,+1],
-                           [ 0,-1,-1, -1,-1,+1],
-                           [+1, 0,+1, -1,-1,+1],
-                           [-1,+1, 0, -1,-1,+1],
-                           [ 0,-1,+1, +1,-1,-1],
-                           [-1, 0,-1, +1,-1,-1],
-                           [+1,+1, 0, +1,-1,-1],
-                           [ 0,+1,+1, -1,+1,-1],
-                           [+1, 0,-1, -1,+1,-1],
-                           [-1,-1, 0, -1,+1,-1]]),
-                         np.array([
-                           [+1,+1, 0, +1,-1, 0],
-                           [+1,-1, 0, +1,+1, 0],
-                           [+1, 0,+1, +1, 0,-1],
-                           [+1, 0,-1, +1, 0,+1],
-                           [ 0,+1,+1,  0,+1,-1],
-                           [ 0,+1,-1,  0,+1,+1]])],
-                'twin': [np.array([
-                           [-2, 1, 1,  1, 1, 1],
-                           [ 1,-2, 1,  1, 1, 1],
-                           [ 1, 1,-2,  1, 1, 1],
-                           [ 2,-1, 1, -1,-1, 1],
-                           [-1, 2, 1, -1,-1, 1],
-                           [-1,-1,-2, -1,-1, 1],
-                           [-2,-1,-1,  1,-1,-1],
-                           [ 1, 2,-1,  1,-1,-1],
-                           [ 1,-1, 2,  1,-1,-1],
-                           [ 2, 1,-1, -1, 1,-1],
-                           [-1,-2,-1, -1, 1,-1],
-                           [-1, 1, 2, -1, 1,-1]])]
-            },
-            'cI': {
-                'slip': [np.array([
-                           [+1,-1,+1, +0,+1,+1],
-                           [+1,-1,+1, +1,+0,-1],
-                           [+1,-1,+1, -1,-1,+0],
-                           [-1,-1,+1, +0,-1,-1],
-                           [-1,-1,+1, +1,+0,+1],
-                           [-1,-1,+1, -1,+1,+0],
-                           [+1,+1,+1, +0,+1,-1],
-                           [+1,+1,+1, -1,+0,+1],
-                           [+1,+1,+1, +1,-1,+0],
-                           [-1,+1,+1, +0,-1,+1],
-                           [-1,+1,+1, -1,+0,-1],
-                           [-1,+1,+1, +1,+1,+0]]),
-                         np.array([
-                           [+1,-1,+1, +2,+1,-1],
-                           [+1,-1,+1, -1,+1,+2],
-                           [+1,-1,+1, +1,+2,+1],
-                           [-1,-1,+1, +2,-1,+1],
-                           [-1,-1,+1, +1,+1,+2],
-                           [-1,-1,+1, -1,+2,+1],
-                           [+1,+1,+1, +1,+1,-2],
-                           [+1,+1,+1, +1,-2,+1],
-                           [+1,+1,+1, -2,+1,+1],
-                           [-1,+1,+1, +1,-1,+2],
-                           [-1,+1,+1, +1,+2,-1],
-                           [-1,+1,+1, +2,+1,+1]]),
-                         np.array([
-                           [+1,-1,+1, -1,+2,+3],
-                           [+1,-1,+1, +1,+3,+2],
-                           [+1,-1,+1, -2,+1,+3],
-                           [+1,-1,+1, +2,+3,+1],
-                           [+1,-1,+1, +3,+1,-2],
-                           [+1,-1,+1, +3,+2,-1],
-                           [-1,-1,+1, +1,+2,+3],
-                           [-1,-1,+1, -1,+3,+2],
-                           [-1,-1,+1, +2,+1,+3],
-                           [-1,-1,+1, -2,+3,+1],
-                           [-1,-1,+1, +3,-1,+2],
-                           [-1,-1,+1, +3,-2,+1],
-                           [+1,+1,+1, +1,+2,-3],
-                           [+1,+1,+1, +1,-3,+2],
-                           [+1,+1,+1, +2,+1,-3],
-                           [+1,+1,+1, +2,-3,+1],
-                           [+1,+1,+1, -3,+1,+2],
-                           [+1,+1,+1, -3,+2,+1],
-                           [-1,+1,+1, +1,-2, 3],
-                           [-1,+1,+1, +1,+3,-2],
-                           [-1,+1,+1, +2,-1,+3],
-                           [-1,+1,+1, +2,+3,-1],
-                           [-1,+1,+1, +3,+1,+2],
-                           [-1,+1,+1, +3,+2,+1]])],
-                'twin': [np.array([
-                           [+1,-1,+1, +2,+1,-1],
-                           [+1,-1,+1, -1,+1,+2],
-                           [+1,-1,+1, +1,+2,+1],
-                           [-1,-1,+1, +2,-1,+1],
-                           [-1,-1,+1, +1,+1,+2],
-                           [-1,-1,+1, -1,+2,+1],
-                           [+1,+1,+1, +1,+1,-2],
-                           [+1,+1,+1, +1,-2,+1],
-                           [+1,+1,+1, -2,+1,+1],
-                           [-1,+1,+1, +1,-1,+2],
-                           [-1,+1,+1, +1,+2,-1],
-                           [-1,+1,+1, +2,+1,+1]])]
-            },
-            'hP': {
-                'slip': [np.array([
-                           [+2,-1,-1, 0,  0, 0, 0,+1],
-                           [-1,+2,-1, 0,  0, 0, 0,+1],
-                           [-1,-1,+2, 0,  0, 0, 0,+1]]),
-                         np.array([
-                           [+2,-1,-1, 0,  0,+1,-1, 0],
-                           [-1,+2,-1, 0, -1, 0,+1, 0],
-                           [-1,-1,+2, 0, +1,-1, 0, 0]]),
-                         np.array([
-                           [-1,+2,-1, 0, +1, 0,-1,+1],
-                           [-2,+1,+1, 0,  0,+1,-1,+1],
-                           [-1,-1,+2, 0, -1,+1, 0,+1],
-                           [+1,-2,+1, 0, -1, 0,+1,+1],
-                           [+2,-1,-1, 0,  0,-1,+1,+1],
-                           [+1,+1,-2, 0, +1,-1, 0,+1]]),
-                         np.array([
-                           [-2,+1,+1,+3, +1, 0,-1,+1],
-                           [-1,-1,+2,+3, +1, 0,-1,+1],
-                           [-1,-1,+2,+3,  0,+1,-1,+1],
-                           [+1,-2,+1,+3,  0,+1,-1,+1],
-                           [+1,-2,+1,+3, -1,+1, 0,+1],
-                           [+2,-1,-1,+3, -1,+1, 0,+1],
-                           [+2,-1,-1,+3, -1, 0,+1,+1],
-                           [+1,+1,-2,+3, -1, 0,+1,+1],
-                           [+1,+1,-2,+3,  0,-1,+1,+1],
-                           [-1,+2,-1,+3,  0,-1,+1,+1],
-                           [-1,+2,-1,+3, +1,-1, 0,+1],
-                           [-2,+1,+1,+3, +1,-1, 0,+1]]),
-                         np.array([
-                           [-1,-1,+2,+3, +1,+1,-2,+2],
-                           [+1,-2,+1,+3, -1,+2,-1,+2],
-                           [+2,-1,-1,+3, -2,+1,+1,+2],
-                           [+1,+1,-2,+3, -1,-1,+2,+2],
-                           [-1,+2,-1,+3, +1,-2,+1,+2],
-                           [-2,+1,+1,+3, +2,-1,-1,+2]])],
-                'twin': [np.array([
-                           [-1, 0, 1, 1,  1, 0,-1, 2],   # shear = (3-(c/a)^2)/(sqrt(3) c/a) <-10.1>{10.2}
-                           [ 0,-1, 1, 1,  0, 1,-1, 2],
-                           [ 1,-1, 0, 1, -1, 1, 0, 2],
-                           [ 1, 0,-1, 1, -1, 0, 1, 2],
-                           [ 0, 1,-1, 1,  0,-1, 1, 2],
-                           [-1, 1, 0, 1,  1,-1, 0, 2]]),
-                         np.array([
-                           [-1,-1, 2, 6,  1, 1,-2, 1],   # shear = 1/(c/a) <11.6>{-1-1.1}
-                           [ 1,-2, 1, 6, -1, 2,-1, 1],
-                           [ 2,-1,-1, 6, -2, 1, 1, 1],
-                           [ 1, 1,-2, 6, -1,-1, 2, 1],
-                           [-1, 2,-1, 6,  1,-2, 1, 1],
-                           [-2, 1, 1, 6,  2,-1,-1, 1]]),
-                         np.array([
-                           [ 1, 0,-1,-2,  1, 0,-1, 1],   # shear = (4(c/a)^2-9)/(4 sqrt(3) c/a)  <10.-2>{10.1}
-                           [ 0, 1,-1,-2,  0, 1,-1, 1],
-                           [-1, 1, 0,-2, -1, 1, 0, 1],
-                           [-1, 0, 1,-2, -1, 0, 1, 1],
-                           [ 0,-1, 1,-2,  0,-1, 1, 1],
-                           [ 1,-1, 0,-2,  1,-1, 0, 1]]),
-                         np.array([
-                           [ 1, 1,-2,-3,  1, 1,-2, 2],   # shear = 2((c/a)^2-2)/(3 c/a)  <11.-3>{11.2}
-                           [-1, 2,-1,-3, -1, 2,-1, 2],
-                           [-2, 1, 1,-3, -2, 1, 1, 2],
-                           [-1,-1, 2,-3, -1,-1, 2, 2],
-                           [ 1,-2, 1,-3,  1,-2, 1, 2],
-                           [ 2,-1,-1,-3,  2,-1,-1, 2]])]
-            },
-            'tI': {
-                'slip': [np.array([
-                           [ 0, 0,+1, +1, 0, 0],
-                           [ 0, 0,+1,  0,+1, 0]]),
-                         np.array([
-                           [ 0, 0,+1, +1,+1, 0],
-                           [ 0, 0,+1, -1,+1, 0]]),
-                         np.array([
-                           [ 0,+1, 0, +1, 0, 0],
-                           [+1, 0, 0,  0,+1, 0]]),
-                         np.array([
-                           [+1,-1,+1, +1,+1, 0],
-                           [+1,-1,-1, +1,+1, 0],
-                           [-1,-1,-1, -1,+1, 0],
-                           [-1,-1,+1, -1,+1, 0]]),
-                         np.array([
-                           [+1,-1, 0, +1,+1, 0],
-                           [+1,+1, 0, +1,-1, 0]]),
-                         np.array([
-                           [ 0,+1,+1, +1, 0, 0],
-                           [ 0,-1,+1, +1, 0, 0],
-                           [-1, 0,+1,  0,+1, 0],
-                           [+1, 0,+1,  0,+1, 0]]),
-                         np.array([
-                           [ 0,+1, 0,  0, 0,+1],
-                           [+1, 0, 0,  0, 0,+1]]),
-                         np.array([
-                           [+1,+1, 0,  0, 0,+1],
-                           [-1,+1, 0,  0, 0,+1]]),
-                         np.array([
-                           [ 0,+1,-1,  0,+1,+1],
-                           [ 0,-1,-1,  0,-1,+1],
-                           [-1, 0,-1, -1, 0,+1],
-                           [+1, 0,-1, +1, 0,+1]]),
-                         np.array([
-                           [+1,-1,+1,  0,+1,+1],
-                           [+1,+1,-1,  0,+1,+1],
-                           [+1,+1,+1,  0,+1,-1],
-                           [-1,+1,+1,  0,+1,-1],
-                           [+1,-1,-1, +1, 0,+1],
-                           [-1,-1,+1, +1, 0,+1],
-                           [+1,+1,+1, +1, 0,-1],
-                           [+1,-1,+1, +1, 0,-1]]),
-                         np.array([
-                           [+1, 0, 0,  0,+1,+1],
-                           [+1, 0, 0,  0,+1,-1],
-                           [ 0,+1, 0, +1, 0,+1],
-                           [ 0,+1, 0, +1, 0,-1]]),
-                         np.array([
-                           [ 0,+1,-1, +2,+1,+1],
-                           [ 0,-1,-1, +2,-1,+1],
-                           [+1, 0,-1, +1,+2,+1],
-                           [-1, 0,-1, -1,+2,+1],
-                           [ 0,+1,-1, -2,+1,+1],
-                           [ 0,-1,-1, -2,-1,+1],
-                           [-1, 0,-1, -1,-2,+1],
-                           [+1, 0,-1, +1,-2,+1]]),
-                         np.array([
-                           [-1,+1,+1, +2,+1,+1],
-                           [-1,-1,+1, +2,-1,+1],
-                           [+1,-1,+1, +1,+2,+1],
-                           [-1,-1,+1, -1,+2,+1],
-                           [+1,+1,+1, -2,+1,+1],
-                           [+1,-1,+1, -2,-1,+1],
-                           [-1,+1,+1, -1,-2,+1],
-                           [+1,+1,+1, +1,-2,+1]])]
-                }
-        }
-        master = _kinematics[self.lattice][mode]
-        return {'direction':[util.Bravais_to_Miller(uvtw=m[:,0:4]) if self.lattice == 'hP'
-                                                    else m[:,0:3] for m in master],
-                'plane':    [util.Bravais_to_Miller(hkil=m[:,4:8]) if self.lattice == 'hP'
-                                                    else m[:,3:6] for m in master]}
+        def compute():
+            master = _kinematics[self.lattice][mode]
+            return {'direction':[util.Bravais_to_Miller(uvtw=m[:,0:4]) if self.lattice == 'hP'
+                                                        else m[:,0:3] for m in master],
+                    'plane':    [util.Bravais_to_Miller(hkil=m[:,4:8]) if self.lattice == 'hP'
+                                                        else m[:,3:6] for m in master]}
+
+        kinematics = _cached(('kinematics',self.lattice,mode),compute)
+        return {k:[m.copy() for m in v] for k,v in kinematics.items()}
 
 
     def relation_operations(self,
@@ -1232,13 +1285,20 @@ class Crystal():
             raise ValueError(f'invalid target lattice "{search.split(sep)[1]}"')
 
         m_l,o_l = transform[0].split(sep)                                                           # type: ignore
-        m_p,o_p = orientation_relationships[model][m_l+sep+o_l]
-        m = Crystal(lattice=m_l) if self.parameters is None else Crystal(lattice=m_l,**self.parameters) # type: ignore
-        o = Crystal(lattice=o_l) if target is None else target
-        m_p = np.stack((m.to_frame(uvw=m_p[:,0] if m_l != 'hP' else util.Bravais_to_Miller(uvtw=m_p[:,0])),
-                        m.to_frame(hkl=m_p[:,1] if m_l != 'hP' else util.Bravais_to_Miller(hkil=m_p[:,1]))),
-                        axis=-2)
-        o_p = np.stack((o.to_frame(uvw=o_p[:,0] if o_l != 'hP' else util.Bravais_to_Miller(uvtw=o_p[:,0])),
-                        o.to_frame(hkl=o_p[:,1] if o_l != 'hP' else util.Bravais_to_Miller(hkil=o_p[:,1]))),
-                        axis=-2)
-        return (o_l,Rotation.from_parallel(a=m_p,b=o_p,active=True))
+
+        def compute():
+            m_p,o_p = orientation_relationships[model][m_l+sep+o_l]
+            m = Crystal(lattice=m_l) if self.parameters is None else Crystal(lattice=m_l,**self.parameters) # type: ignore
+            o = Crystal(lattice=o_l) if target is None else target
+            m_p = np.stack((m.to_frame(uvw=m_p[:,0] if m_l != 'hP' else util.Bravais_to_Miller(uvtw=m_p[:,0])),
+                            m.to_frame(hkl=m_p[:,1] if m_l != 'hP' else util.Bravais_to_Miller(hkil=m_p[:,1]))),
+                            axis=-2)
+            o_p = np.stack((o.to_frame(uvw=o_p[:,0] if o_l != 'hP' else util.Bravais_to_Miller(uvtw=o_p[:,0])),
+                            o.to_frame(hkl=o_p[:,1] if o_l != 'hP' else util.Bravais_to_Miller(hkil=o_p[:,1]))),
+                            axis=-2)
+            return Rotation.from_parallel(a=m_p,b=o_p,active=True).quaternion
+
+        key = ('relation_operations',model,m_l,o_l,
+               None if self.parameters is None else tuple(self.parameters.values()),
+               None if target is None else tuple(target.parameters.values()))
+        return (o_l,Rotation(_cached(key,compute)))
@@ -2,7 +2,7 @@ import os
 import copy
 import multiprocessing as mp
 from functools import partial
-from typing import Optional, Union, Sequence, Dict
+from typing import Optional, Union, Sequence, Dict, cast
 from pathlib import Path
 
 import numpy as np
@@ -14,16 +14,11 @@ from . import VTK
 from . import util
 from . import grid_filters
 from . import Rotation
+from . import Orientation
 from . import Table
 from . import Colormap
 from ._typehints import FloatSequence, IntSequence, NumpyRngSeed
-try:
-    import numba as nb                                                                              # type: ignore
-except ImportError:
-    nb = False
-
-def numba_njit_wrapper(**kwargs):
-    return (lambda function: nb.njit(function) if nb else function)
+from ._numba import nb, numba_njit_wrapper
 
 
 class GeomGrid:
@@ -389,7 +384,7 @@ class GeomGrid:
 
             if feature_IDs is None:
                 phase = f['/'.join([b,c,phases])][()].reshape(-1,1)
-                O = Rotation.from_Euler_angles(f['/'.join([b,c,Euler_angles])]).as_quaternion().reshape(-1,4) # noqa
+                O = Rotation.from_Euler_angles(f['/'.join([b,c,Euler_angles])][()].astype(float)).as_quaternion().reshape(-1,4) # noqa
                 unique,unique_inverse = np.unique(np.hstack([O,phase]),return_inverse=True,axis=0)
                 ma = np.arange(cells.prod()) if len(unique) == cells.prod() else \
                      np.arange(unique.size)[np.argsort(pd.unique(unique_inverse.squeeze()))][unique_inverse]
@@ -1369,6 +1364,38 @@ class GeomGrid:
                        )
 
 
+    def _boundary_faces(self,
+                        periodic: bool,
+                        directions: Sequence[str]) -> Dict[int,np.ndarray]:
+        """
+        Identify cells whose material differs from the preceding cell along each direction.
+
+        Parameters
+        ----------
+        periodic : bool
+            Assume grid to be periodic.
+        directions : (sequence of) {'x', 'y', 'z'}
+            Direction(s) along which the boundaries are determined.
+
+        Returns
+        -------
+        faces : dict of {int : numpy.ndarray of bool, shape (self.cells)}
+            Cells with a boundary at the lower face normal to the given axis.
+
+        """
+        if not set(directions).issubset(valid := ['x', 'y', 'z']):
+            raise ValueError(f'invalid direction "{set(directions).difference(valid)}" specified')
+        if len(directions) == 0:
+            raise ValueError('no direction specified')
+
+        faces = {}
+        for i,d in enumerate(['x','y','z']):
+            if d not in directions: continue
+            faces[i] = self.material != np.roll(self.material,1,i)
+            if not periodic: faces[i][(slice(None),)*i+(0,)] = False
+        return faces
+
+
     def get_grain_boundaries(self,
                              periodic: bool = True,
                              directions: Sequence[str] = 'xyz') -> VTK:
@@ -1389,25 +1416,82 @@ class GeomGrid:
             VTK-based geometry of grain boundary network.
 
         """
-        if not set(directions).issubset(valid := ['x', 'y', 'z']):
-            raise ValueError(f'invalid direction "{set(directions).difference(valid)}" specified')
-
         o = [[0, self.cells[0]+1,           np.prod(self.cells[:2]+1)+self.cells[0]+1, np.prod(self.cells[:2]+1)],
              [0, np.prod(self.cells[:2]+1), np.prod(self.cells[:2]+1)+1,               1],
              [0, 1,                         self.cells[0]+1+1,                         self.cells[0]+1]] # offset for connectivity
 
         connectivity = []
-        for i,d in enumerate(['x','y','z']):
-            if d not in directions: continue
-            mask = self.material != np.roll(self.material,1,i)
+        for i,mask in self._boundary_faces(periodic,directions).items():
             for j in [0,1,2]:
                 mask = np.concatenate((mask,np.take(mask,[0],j)*(i==j)),j)
-            if i == 0 and not periodic: mask[0,:,:] = mask[-1,:,:] = False
-            if i == 1 and not periodic: mask[:,0,:] = mask[:,-1,:] = False
-            if i == 2 and not periodic: mask[:,:,0] = mask[:,:,-1] = False
 
             base_nodes = np.argwhere(mask.flatten(order='F')).reshape(-1,1)
             connectivity.append(np.block([base_nodes + o[i][k] for k in range(4)]))
 
         coords = grid_filters.coordinates0_node(self.cells,self.size,self.origin).reshape(-1,3,order='F')
         return VTK.from_unstructured_grid(coords,np.vstack(connectivity),'QUAD')
+
+
+    def get_grain_neighbors(self,
+                            orientations: Optional[Orientation] = None,
+                            periodic: bool = True,
+                            directions: Sequence[str] = 'xyz',
+                            degrees: bool = False) -> Table:
+        """
+        Determine pairs of neighboring materials and their boundary area.
+
+        Parameters
+        ----------
+        orientations : damask.Orientation, shape (N), optional
+            Orientation of each material ID. If given, the
+            disorientation is computed once per pair of neighbors.
+        periodic : bool, optional
+            Assume grid to be periodic. Defaults to True.
+        directions : (sequence of) {'x', 'y', 'z'}, optional
+            Direction(s) along which the boundaries are determined.
+            Defaults to 'xyz'.
+        degrees : bool, optional
+            Disorientation angle is given in degrees. Defaults to False.
+
+        Returns
+        -------
+        neighbors : damask.Table
+            Material IDs of neighbors ('material', sorted in ascending order),
+            and area of their common boundary ('area').
+            If orientations are given, disorientation axis ('n')
+            and angle ('omega') are included.
+
+        Examples
+        --------
+        Area-weighted distribution of disorientation angles.
+
+        >>> import numpy as np
+        >>> import damask
+        >>> cells,size = [64]*3,np.ones(3)*1e-4
+        >>> seeds = damask.seeds.from_random(size,100)
+        >>> grid = damask.GeomGrid.from_Voronoi_tessellation(cells,size,seeds)
+        >>> O = damask.Orientation.from_random(shape=100,lattice='cF')
+        >>> n = grid.get_grain_neighbors(O,degrees=True)
+        >>> np.histogram(n.get('omega'),bins=12,range=(0,63),weights=n.get('area'))
+        (...)
+
+        """
+        if orientations is not None and np.nanmax(self.material) >= len(orientations):
+            raise ValueError(f'orientation of material ID {np.nanmax(self.material)} missing')
+
+        cell_area = np.prod(self.size/self.cells)/(self.size/self.cells)
+        pairs,area = [],[]
+        for i,mask in self._boundary_faces(periodic,directions).items():
+            pairs.append(np.sort(np.stack((self.material[mask],np.roll(self.material,1,i)[mask]),-1),-1))
+            area.append(np.full(len(pairs[-1]),cell_area[i]))
+
+        material,idx = np.unique(np.concatenate(pairs).reshape(-1,2),axis=0,return_inverse=True)
+        neighbors = Table({'material':(2,)},material) \
+                   .set('area',np.bincount(idx.reshape(-1),np.concatenate(area),len(material)))
+
+        if orientations is None:
+            return neighbors
+
+        disorientation = cast(Orientation,orientations[material[:,0]].disorientation(orientations[material[:,1]]))
+        n,omega = disorientation.as_axis_angle(degrees=degrees,pair=True)
+        return neighbors.set('n',n).set('omega',omega)
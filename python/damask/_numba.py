@@ -0,0 +1,9 @@
+"""Optional just-in-time compilation with numba."""
+
+try:
+    import numba as nb                                                                              # type: ignore
+except ImportError:
+    nb = False
+
+def numba_njit_wrapper(**kwargs):
+    return (lambda function: nb.njit(function,**kwargs) if nb else function)
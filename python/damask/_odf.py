@@ -0,0 +1,229 @@
+from typing import Optional, Literal
+
+import numpy as np
+from scipy import spatial
+
+from ._typehints import FloatSequence, IntSequence, CrystalFamily
+from . import Rotation
+from . import Orientation
+from . import util
+
+
+_chunk_size = 2**16                                                                                 # rotations binned at once
+
+
+class ODF:
+    """
+    Binned orientation distribution function (ODF).
+
+    Rotations are accumulated as weighted histograms on a regular grid
+    in Euler space or in the (equal-volume) cubochoric cube. Orientations
+    are reduced to the fundamental zone of their crystal family before
+    binning. Histograms from chunks, increments, or processes can be merged.
+    The bin centers and volume fractions can be used as input to
+    damask.Rotation.from_ODF and damask.Orientation.from_ODF.
+
+    Examples
+    --------
+    Estimate the ODF of a set of orientations and sample 500 grains from it.
+
+    >>> import damask
+    >>> O = damask.Orientation.from_random(shape=100000,family='cubic')
+    >>> odf = damask.ODF(family='cubic')
+    >>> odf.update(O)
+    >>> damask.Orientation.from_ODF(weights=odf.result(sigma=5.,degrees=True),phi=odf.phi,
+    ...                             shape=500,family='cubic')
+
+    """
+
+    def __init__(self,
+                 family: Optional[CrystalFamily] = None,
+                 cells: Optional[IntSequence] = None,
+                 grid: Literal['Euler', 'cubochoric'] = 'Euler'):
+        """
+        New ODF.
+
+        Parameters
+        ----------
+        family : {'triclinic', 'monoclinic', 'orthorhombic', 'tetragonal', 'hexagonal', 'cubic'}, optional
+            Crystal family of the orientations.
+            Defaults to None, i.e. no symmetry reduction.
+        cells : sequence of int, len (3), optional
+            Number of bins along (φ_1,Φ,φ_2) or along the edges of the cubochoric cube.
+            Defaults to (72,36,72) for an Euler grid, i.e. 5° resolution,
+            and to (48,48,48) for a cubochoric grid.
+        grid : {'Euler', 'cubochoric'}, optional
+            Space in which the bins are defined. Defaults to 'Euler'.
+
+        """
+        if grid not in ['Euler','cubochoric']:
+            raise ValueError(f'invalid grid "{grid}"')
+        cells_ = ((72,36,72) if grid == 'Euler' else (48,48,48)) if cells is None else tuple(int(c) for c in cells)
+        if len(cells_) != 3 or min(cells_) < 1:
+            raise ValueError(f'invalid cells {cells_}')
+
+        self.family = family
+        self.grid = grid
+        self.weight = np.zeros(cells_)
+
+
+    def __repr__(self) -> str:
+        """
+        Return repr(self).
+
+        Give short, human-readable summary.
+
+        """
+        return util.srepr([f'ODF on {self.grid} grid with cells {self.cells}',
+                           f'Crystal family: {self.family}',
+                           f'total weight: {np.sum(self.weight)}'])
+
+
+    @property
+    def cells(self) -> tuple:
+        """Number of bins along each direction."""
+        return self.weight.shape
+
+
+    @property
+    def _size(self) -> np.ndarray:
+        """Edge lengths of the grid."""
+        return np.array([2.*np.pi,np.pi,2.*np.pi]) if self.grid == 'Euler' else \
+               np.full(3,np.pi**(2./3.))
+
+
+    @property
+    def _origin(self) -> np.ndarray:
+        """Lower corner of the grid."""
+        return np.zeros(3) if self.grid == 'Euler' else np.full(3,-.5*np.pi**(2./3.))
+
+
+    @property
+    def phi(self) -> np.ndarray:
+        """Euler angles (φ_1,Φ,φ_2) in radians of the bin centers, shape (prod(self.cells),3)."""
+        x = self._origin + (np.stack(np.meshgrid(*[np.arange(c) for c in self.cells],indexing='ij'),axis=-1)+.5) \
+                         * self._size/np.array(self.cells)
+        return x.reshape(-1,3) if self.grid == 'Euler' else \
+               Rotation.from_cubochoric(x.reshape(-1,3)).as_Euler_angles()
+
+
+    @property
+    def _volume(self) -> np.ndarray:
+        """Volume fraction of the bins, shape (prod(self.cells))."""
+        if self.grid == 'cubochoric':
+            return np.full(self.weight.size,1./self.weight.size)
+        Phi = np.linspace(0.,np.pi,self.cells[1]+1)
+        dV = (np.cos(Phi[:-1])-np.cos(Phi[1:]))*.5/self.cells[0]/self.cells[2]
+        return np.broadcast_to(dV[np.newaxis,:,np.newaxis],self.cells).reshape(-1)
+
+
+    def update(self,
+               rotations: Rotation,
+               weights: Optional[FloatSequence] = None):
+        """
+        Add rotations.
+
+        Parameters
+        ----------
+        rotations : damask.Rotation or damask.Orientation
+            Rotations to add. Rotations are interpreted as orientations of
+            own crystal family, orientations need to be of the same family.
+        weights : numpy.ndarray, shape (rotations.shape), optional
+            Relative weight (e.g. volume fraction) of each rotation.
+            Defaults to equal weights.
+
+        """
+        if isinstance(rotations,Orientation) and rotations.family != self.family:
+            raise ValueError(f'family mismatch: {rotations.family} and {self.family}')
+
+        q = rotations.quaternion.reshape(-1,4)
+        w = None if weights is None else \
+            np.broadcast_to(np.array(weights,float),rotations.shape).reshape(-1)
+        scale = np.array(self.cells)/self._size
+        for c in range(0,len(q),_chunk_size):
+            r = Rotation(q[c:c+_chunk_size]) if self.family is None else \
+                Orientation(q[c:c+_chunk_size],family=self.family).reduced
+            x = r.as_Euler_angles() if self.grid == 'Euler' else r.as_cubochoric()
+            i = np.clip(((x-self._origin)*scale).astype(int),0,np.array(self.cells)-1)
+            self.weight += np.bincount(np.ravel_multi_index(i.T,self.cells),
+                                       None if w is None else w[c:c+_chunk_size],
+                                       self.weight.size).reshape(self.cells)
+
+
+    def merge(self,
+              other: 'ODF') -> 'ODF':
+        """
+        Combine with other ODF.
+
+        Parameters
+        ----------
+        other : damask.ODF
+            ODF of the same crystal family and grid.
+
+        Returns
+        -------
+        merged : damask.ODF
+            ODF containing the rotations added to both.
+
+        """
+        if (other.family,other.grid,other.cells) != (self.family,self.grid,self.cells):
+            raise ValueError('family, grid, or cells mismatch')
+
+        merged = ODF(self.family,self.cells,self.grid)
+        merged.weight = self.weight + other.weight
+        return merged
+
+
+    def result(self,
+               sigma: Optional[float] = None,
+               degrees: bool = False) -> np.ndarray:
+        """
+        Volume fractions of the bins.
+
+        Parameters
+        ----------
+        sigma : float, optional
+            Standard deviation of the Gaussian smoothing kernel
+            in terms of (dis)orientation angle. The kernel is
+            truncated at 3σ. Defaults to None, i.e. no smoothing.
+        degrees : bool, optional
+            sigma is given in degrees. Defaults to False.
+
+        Returns
+        -------
+        fractions : numpy.ndarray, shape (prod(self.cells))
+            Volume fraction of each bin, ordered as self.phi.
+
+        Notes
+        -----
+        For smoothing, the weight of each occupied bin is distributed
+        over the bins with centers in its vicinity. Hence, the result
+        is not symmetrized but describes the same orientations.
+
+        """
+        if np.sum(self.weight) <= 0.:
+            raise ValueError('ODF of zero total weight')
+
+        w = self.weight.reshape(-1)
+        if sigma is None:
+            return w/np.sum(w)
+
+        sigma_ = np.radians(sigma) if degrees else sigma
+        if sigma_ <= 0.:
+            raise ValueError(f'invalid kernel width {sigma}')
+
+        q = Rotation.from_Euler_angles(self.phi).quaternion
+        tree = spatial.cKDTree(np.block([[q],[-q]]))
+        r = 2.*np.sin(min(3.*sigma_,np.pi)*.25)
+        V = self._volume
+
+        f = np.zeros(w.size)
+        occupied = np.flatnonzero(w)
+        for c in range(0,len(occupied),_chunk_size):
+            o = occupied[c:c+_chunk_size]
+            d = np.sort(spatial.cKDTree(q[o]).sparse_distance_matrix(tree,r,output_type='ndarray'),order='v')
+            key,first = np.unique(d['i']*w.size + d['j']%w.size,return_index=True)                 # nearest of ±q per sample and bin
+            K = np.exp(-.5*(4.*np.arcsin(np.clip(d['v'][first]*.5,None,1.))/sigma_)**2)*V[key%w.size]
+            norm = np.bincount(key//w.size,K,len(o))
+            f += np.bincount(key%w.size,K*(w[o]/norm)[key//w.size],w.size)
+        return f/np.sum(f)
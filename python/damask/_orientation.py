@@ -1,10 +1,11 @@
-import copy
-from typing import Tuple, Optional, Union, TypeVar
+from typing import Tuple, Optional, Union, TypeVar, Dict, Literal, Iterator, Callable, cast
 
 import numpy as np
+from scipy import spatial
 
-from ._typehints import FloatSequence, IntSequence, CrystalFamily, BravaisLattice
+from ._typehints import FloatSequence, IntSequence, CrystalFamily, BravaisLattice, NumpyRngSeed
 from . import Rotation
+from ._rotation import _compose
 from . import Crystal
 from . import util
 from . import tensor
@@ -12,6 +13,156 @@ from . import tensor
 
 MyType = TypeVar('MyType', bound='Orientation')
 
+_chunk_size = 2**14                                                                                 # orientations processed at once
+
+
+def _in_FZ(family: CrystalFamily,
+           rho: np.ndarray) -> Union[np.bool_, np.ndarray]:
+    """Check whether Rodrigues–Frank vector (three-component) falls into fundamental zone."""
+    tol = 1.e-6 if rho.dtype == np.float32 else 1.e-9
+    rho_abs = np.abs(rho)*(1.-tol)
+
+    with np.errstate(invalid='ignore'):
+        # using '*'/prod for 'and'
+        if   family == 'cubic':
+            return (np.prod(np.sqrt(2)-1. >= rho_abs,axis=-1) *
+                               (1. >= np.sum(rho_abs,axis=-1))).astype(bool)
+        if family == 'hexagonal':
+            return (np.prod(1.  >= rho_abs,axis=-1) *
+                            (2. >= np.sqrt(3)*rho_abs[...,0] + rho_abs[...,1]) *
+                            (2. >= np.sqrt(3)*rho_abs[...,1] + rho_abs[...,0]) *
+                            (2. >= np.sqrt(3)                + rho_abs[...,2])).astype(bool)
+        if family == 'tetragonal':
+            return (np.prod(1.  >= rho_abs[...,:2],axis=-1) *
+                    (np.sqrt(2) >= rho_abs[...,0] + rho_abs[...,1]) *
+                    (np.sqrt(2) >= rho_abs[...,2] + 1.)).astype(bool)
+        if family == 'orthorhombic':
+            return (np.prod(1. >= rho_abs,axis=-1)).astype(bool)
+        if family == 'monoclinic':
+            return np.logical_or(   1. >= rho_abs[...,1],
+                                 np.isnan(rho_abs[...,1]))
+        if family == 'triclinic':
+            return np.ones(rho_abs.shape[:-1]).astype(bool)
+
+        raise TypeError(f'unknown symmetry "{family}"')
+
+
+def _in_disorientation_FZ(family: CrystalFamily,
+                          rho: np.ndarray) -> np.ndarray:
+    """Check whether Rodrigues–Frank vector (three-component) falls into fundamental zone of disorientations."""
+    def larger_or_equal(v,c):
+        return ((np.isclose(c[0],v[...,0]) | (v[...,0] > c[0])) &
+                (np.isclose(c[1],v[...,1]) | (v[...,1] > c[1])) &
+                (np.isclose(c[2],v[...,2]) | (v[...,2] > c[2]))).astype(bool)
+
+    return larger_or_equal(rho,
+                                 [rho[...,1],           rho[...,2],0] if family == 'cubic'
+                            else [rho[...,1]*np.sqrt(3),0,         0] if family == 'hexagonal'
+                            else [rho[...,1],           0,         0] if family == 'tetragonal'
+                            else [0,                    0,         0] if family == 'orthorhombic'
+                            else [-np.inf,              0,         0] if family == 'monoclinic'
+                            else [-np.inf,        -np.inf,   -np.inf]) & _in_FZ(family,rho)
+
+
+def _SST_components(standard_triangle: Dict[str, np.ndarray],
+                    vector: np.ndarray,
+                    proper: bool) -> Tuple[np.ndarray, np.ndarray]:
+    """Express crystal frame vector in basis of standard stereographic triangle and check whether it falls into SST."""
+    if proper:
+        components_proper   = np.around(np.einsum('ji,...i',standard_triangle['proper'],  vector),12)
+        components_improper = np.around(np.einsum('ji,...i',standard_triangle['improper'],vector),12)
+        in_proper = np.all(components_proper >= 0.0,axis=-1)
+        return (np.where(in_proper[...,np.newaxis],components_proper,components_improper),
+                in_proper | np.all(components_improper >= 0.0,axis=-1))
+    else:
+        components = np.around(np.einsum('ji,...i',standard_triangle['improper'],
+                                         np.block([vector[...,:2],np.abs(vector[...,2:3])])),12)
+        return components, np.all(components >= 0.0,axis=-1)
+
+
+def _unproject(xy: np.ndarray,
+               projection: Literal['equal_area', 'equal_angle']) -> Tuple[np.ndarray, np.ndarray]:
+    """Invert projection along z to unit vectors with z >= 0 and return area scaling (zero outside the unit disk)."""
+    rho2 = np.sum(xy**2,axis=-1)
+    if projection == 'equal_area':
+        v = np.block([xy*np.sqrt(np.clip(2.-rho2,0.,None))[...,np.newaxis],(1.-rho2)[...,np.newaxis]])
+        J = np.full_like(rho2,2.)
+    else:
+        v = np.block([2.*xy,(1.-rho2)[...,np.newaxis]])/(1.+rho2)[...,np.newaxis]
+        J = 4./(1.+rho2)**2
+    return v/np.linalg.norm(v,axis=-1,keepdims=True), np.where(rho2<=1.,J,0.)
+
+
+def _density_2D(xy: Iterator[Tuple[np.ndarray, np.ndarray]],
+                bins: int,
+                extent: np.ndarray,
+                projection: Literal['equal_area', 'equal_angle'],
+                inside: Callable[[np.ndarray], np.ndarray],
+                sigma: Optional[float],
+                equivalent: np.ndarray) -> np.ndarray:
+    """
+    Bin projected unit vectors and normalize to multiples of random distribution.
+
+    Parameters
+    ----------
+    xy : iterator of tuple of numpy.ndarray, shapes (N,2) and (N)
+        Projected coordinates and weights, provided in chunks.
+    bins : int
+        Number of pixels along each axis.
+    extent : numpy.ndarray, shape (4)
+        Lower and upper bound of first and second axis.
+    projection : {'equal_area', 'equal_angle'}
+        Projection used for the coordinates.
+    inside : callable
+        Mask of unit vectors (z >= 0) belonging to the domain.
+    sigma : float or None
+        Standard deviation of the Gaussian smoothing kernel in radians.
+    equivalent : numpy.ndarray, shape (M,3,3)
+        Operators mapping unit vectors onto equivalent ones.
+
+    Returns
+    -------
+    density : numpy.ndarray, shape (bins,bins)
+        Density, NaN outside of the domain.
+
+    """
+    if projection not in ['equal_area','equal_angle']:
+        raise ValueError(f'invalid projection "{projection}"')
+
+    lower,step = extent[::2],(extent[1::2]-extent[::2])/bins
+    f = np.zeros(bins*bins)
+    for xy_,w in xy:
+        i = np.clip(((xy_-lower)/step).astype(int),0,bins-1)
+        f += np.bincount(i[:,0]*bins+i[:,1],w,bins*bins)
+
+    area = np.zeros(bins*bins)
+    centers = lower + (np.stack(np.meshgrid(np.arange(bins),np.arange(bins),indexing='ij'),axis=-1)+.5)*step
+    for offset in np.ndindex(8,8):                                                                  # 8x8 supersampling
+        v,J = _unproject(centers + ((np.array(offset)+.5)/8.-.5)*step,projection)
+        area += (J*inside(v)).reshape(-1)
+
+    if sigma is not None:
+        if sigma <= 0.: raise ValueError(f'invalid kernel width {sigma}')
+        v = _unproject(centers,projection)[0].reshape(-1,3)
+        t = np.flatnonzero(area)
+        eq = (v[t]@np.swapaxes(equivalent,-1,-2)).reshape(-1,3)
+        tree = spatial.cKDTree(np.block([[eq],[-eq]]))
+        r = 2.*np.sin(min(3.*sigma,np.pi)*.5)
+        f_ = np.zeros_like(f)
+        occupied = np.flatnonzero(f)
+        for c in range(0,len(occupied),_chunk_size):
+            o = occupied[c:c+_chunk_size]
+            d = spatial.cKDTree(v[o]).sparse_distance_matrix(tree,r,output_type='ndarray')
+            j = t[d['j']%len(t)]                                                                    # sum over equivalents folds kernel into domain
+            K = np.exp(-.5*(2.*np.arcsin(np.clip(d['v']*.5,None,1.))/sigma)**2)*area[j]
+            norm = np.bincount(d['i'],K,len(o))
+            f_ += np.bincount(j,K*(f[o]/np.where(norm>0.,norm,1.))[d['i']],len(f))
+        f = f_
+
+    with np.errstate(invalid='ignore',divide='ignore'):
+        return np.where(area>0.,f/np.sum(f)/(area/np.sum(area)),np.nan).reshape(bins,bins)
+
+
 class Orientation(Rotation,Crystal):
     """
     Representation of crystallographic orientation as combination of rotation and either crystal family or Bravais lattice.
@@ -113,10 +264,7 @@ class Orientation(Rotation,Crystal):
         Create deep copy.
 
         """
-        dup = copy.deepcopy(self)
-        if rotation is not None:
-            dup.quaternion = Rotation(rotation).quaternion
-        return dup
+        return self._adopt(self.quaternion.copy() if rotation is None else Rotation(rotation).quaternion)
 
     copy = __copy__
 
@@ -238,7 +386,7 @@ class Orientation(Rotation,Crystal):
         """
         if not isinstance(other, (Orientation,Rotation)):
             raise TypeError('use "O@b", i.e. matmul, to apply Orientation "O" to object "b"')
-        return self.copy(Rotation(self.quaternion)*Rotation(other.quaternion))
+        return cast(MyType,Rotation.__mul__(self,other))
 
 
     @classmethod
@@ -370,20 +518,54 @@ class Orientation(Rotation,Crystal):
         is added to the left of the Rotation array.
 
         """
-        sym_ops = self.symmetry_operations
-        o = sym_ops.broadcast_to(sym_ops.shape+self.shape,mode='right')
-        return self.copy(o*Rotation(self.quaternion).broadcast_to(o.shape,mode='left'))
+        sym_ops = self.symmetry_operations.quaternion.astype(self.dtype)
+        return self._adopt(_compose(sym_ops.reshape((-1,)+(1,)*len(self.shape)+(4,)),self.quaternion))
 
 
     @property
     def reduced(self: MyType) -> MyType:
-        """Select symmetrically equivalent orientation that falls into fundamental zone according to symmetry."""
-        eq   = self.equivalent
-        ok   = eq.in_FZ
-        ok  &= np.cumsum(ok,axis=0) == 1
-        loc  = np.where(ok)
-        sort = 0 if len(loc) == 1 else np.lexsort(loc[:0:-1])
-        return eq[ok][sort].reshape(self.shape)
+        """
+        Select symmetrically equivalent orientation that falls into fundamental zone according to symmetry.
+
+        Notes
+        -----
+        The first symmetry operator that maps into the fundamental zone is selected.
+        Only operators that attain the minimum rotation angle are tested.
+
+        """
+        q = self.quaternion.reshape(-1,4)
+        sym_ops = self.symmetry_operations.astype(self.dtype).quaternion
+        conjugate = np.array([1,-1,-1,-1],dtype=self.dtype)
+
+        def in_FZ(q):
+            with np.errstate(invalid='ignore'):
+                ro = Rotation._qu2ro(q).astype(q.dtype,copy=False)
+                return _in_FZ(self.family,ro[...,:3]*ro[...,3:4])
+
+        quat = np.full_like(q,np.nan)                                                               # no equivalent in FZ for invalid input
+        for c in range(0,len(q),_chunk_size):
+            cos = np.abs((q[c:c+_chunk_size]*conjugate)@sym_ops.T)                                  # |cos(ω/2)| of S_k*q
+            minimum = cos >= np.max(cos,axis=-1,keepdims=True)-1.e-6                                # S_k attaining minimum angle
+            found = np.zeros(len(cos),dtype=bool)
+
+            u = np.flatnonzero(np.count_nonzero(minimum,axis=-1) == 1)
+            _q = _compose(sym_ops[np.argmax(cos[u],axis=-1)],q[c+u])
+            ok = in_FZ(_q)
+            quat[c+u[ok]] = _q[ok]
+            found[u[ok]] = True
+
+            for candidates in (minimum,None):                                                       # ties: reduced search, exhaustive fallback
+                if found.all(): break
+                for k in range(len(sym_ops)):                                                       # first operator mapping into FZ
+                    todo = np.flatnonzero(~found if candidates is None else candidates[:,k] & ~found)
+                    if len(todo) == 0: continue
+                    _q = _compose(np.broadcast_to(sym_ops[k],(len(todo),4)),q[c+todo])
+                    ok = in_FZ(_q)
+                    quat[c+todo[ok]] = _q[ok]
+                    found[todo[ok]] = True
+                    if found.all(): break
+
+        return self.copy(rotation=quat.reshape(self.shape+(4,)))
 
 
     @property
@@ -406,31 +588,7 @@ class Orientation(Rotation,Crystal):
         https://doi.org/10.1107/S0108767391006864
 
         """
-        rho_abs = np.abs(self.as_Rodrigues_vector(compact=True))*(1.-1.e-9)
-
-        with np.errstate(invalid='ignore'):
-            # using '*'/prod for 'and'
-            if   self.family == 'cubic':
-                return (np.prod(np.sqrt(2)-1. >= rho_abs,axis=-1) *
-                                   (1. >= np.sum(rho_abs,axis=-1))).astype(bool)
-            if self.family == 'hexagonal':
-                return (np.prod(1.  >= rho_abs,axis=-1) *
-                                (2. >= np.sqrt(3)*rho_abs[...,0] + rho_abs[...,1]) *
-                                (2. >= np.sqrt(3)*rho_abs[...,1] + rho_abs[...,0]) *
-                                (2. >= np.sqrt(3)                + rho_abs[...,2])).astype(bool)
-            if self.family == 'tetragonal':
-                return (np.prod(1.  >= rho_abs[...,:2],axis=-1) *
-                        (np.sqrt(2) >= rho_abs[...,0] + rho_abs[...,1]) *
-                        (np.sqrt(2) >= rho_abs[...,2] + 1.)).astype(bool)
-            if self.family == 'orthorhombic':
-                return (np.prod(1. >= rho_abs,axis=-1)).astype(bool)
-            if self.family == 'monoclinic':
-                return np.logical_or(   1. >= rho_abs[...,1],
-                                     np.isnan(rho_abs[...,1]))
-            if self.family == 'triclinic':
-                return np.ones(rho_abs.shape[:-1]).astype(bool)
-
-            raise TypeError(f'unknown symmetry "{self.family}"')
+        return _in_FZ(self.family,self.as_Rodrigues_vector(compact=True))
 
 
     @property
@@ -449,19 +607,7 @@ class Orientation(Rotation,Crystal):
         https://doi.org/10.1107/S0108767391006864
 
         """
-        def larger_or_equal(v,c):
-            return ((np.isclose(c[0],v[...,0]) | (v[...,0] > c[0])) &
-                    (np.isclose(c[1],v[...,1]) | (v[...,1] > c[1])) &
-                    (np.isclose(c[2],v[...,2]) | (v[...,2] > c[2]))).astype(bool)
-
-        rho = self.as_Rodrigues_vector(compact=True)
-        return larger_or_equal(rho,
-                                     [rho[...,1],           rho[...,2],0] if self.family == 'cubic'
-                                else [rho[...,1]*np.sqrt(3),0,         0] if self.family == 'hexagonal'
-                                else [rho[...,1],           0,         0] if self.family == 'tetragonal'
-                                else [0,                    0,         0] if self.family == 'orthorhombic'
-                                else [-np.inf,              0,         0] if self.family == 'monoclinic'
-                                else [-np.inf,        -np.inf,   -np.inf]) & self.in_FZ
+        return _in_disorientation_FZ(self.family,self.as_Rodrigues_vector(compact=True))
 
 
     def disorientation(self: MyType,
@@ -490,6 +636,8 @@ class Orientation(Rotation,Crystal):
         Notes
         -----
         Requires same crystal family for both orientations.
+        Only pairs of symmetry operators that attain the minimum
+        misorientation angle are tested for the fundamental zone.
 
         Examples
         --------
@@ -524,29 +672,62 @@ class Orientation(Rotation,Crystal):
         s_m   = util.shapeshifter( self.shape,blend,mode='right')
         s_o   = util.shapeshifter(other.shape,blend,mode='left')
 
-        s =  self.broadcast_to(s_m).equivalent
-        o = other.broadcast_to(s_o).equivalent
-
-        r_ = s[:,np.newaxis,...].misorientation(o[np.newaxis,:,...])                                # type: ignore[index]
-        _r = ~r_
-        shp = r_.shape[2:]
-
-        forward = r_.in_disorientation_FZ
-        reverse = _r.in_disorientation_FZ
-        ok  = forward | reverse
-        ok &= (np.cumsum(ok.reshape((-1,*shp)),axis=0) == 1).reshape(ok.shape)
-        r = np.where(np.any((ok&forward)[...,np.newaxis],axis=(0,1),keepdims=True),
-                     r_.quaternion,
-                     _r.quaternion)
-        loc  = np.where(ok)
-        sort = 0 if len(loc) == 2 else np.lexsort(loc[:1:-1])
-
-        quat = r[ok][sort].reshape((*shp,4))
+        q_s = np.broadcast_to( self.quaternion.reshape(s_m+(4,)),blend+(4,)).reshape(-1,4)
+        q_o = np.broadcast_to(other.quaternion.reshape(s_o+(4,)),blend+(4,)).reshape(-1,4)
+        sym_ops = self.symmetry_operations.astype(self.dtype).quaternion[:,np.newaxis]
+        conjugate = np.array([1,-1,-1,-1],dtype=self.dtype)
+
+        def in_FZ(_r):
+            with np.errstate(invalid='ignore'):
+                ro = Rotation._qu2ro(_r).astype(_r.dtype,copy=False)
+                rho = -ro[...,:3]*ro[...,3:4]                                                       # r_ = ~_r
+            forward = _in_disorientation_FZ(self.family,rho)
+            return forward, forward | _in_disorientation_FZ(self.family,-rho)
+
+        # cos(ω/2) of ~S_j*S_i*s*~o depends only on ~S_j*S_i = S_k, i.e. one j per i for each k
+        G = _compose(sym_ops*conjugate,sym_ops[:,0])
+        k = np.argmax(np.abs(G@sym_ops[:,0].T),axis=-1).T                                           # S_k = ~S_j*S_i
+        j_k = np.argsort(k,axis=-1)                                                                 # j for given i and k
+
+        quat = np.empty_like(q_s)
+        ops = np.empty((len(q_s),2),dtype=np.int64)
+        for c in range(0,len(q_s),_chunk_size):
+            s = _compose(sym_ops,q_s[c:c+_chunk_size])
+            o = _compose(sym_ops,q_o[c:c+_chunk_size])*conjugate
+            cos = np.abs((_compose(q_s[c:c+_chunk_size],q_o[c:c+_chunk_size]*conjugate)*conjugate)
+                         @sym_ops[:,0].T)
+            minimum = cos >= np.max(cos,axis=-1,keepdims=True)-1.e-6                                # S_k attaining minimum angle
+            found = np.zeros(s.shape[1],dtype=bool)
+
+            u = np.flatnonzero(np.count_nonzero(minimum,axis=-1) == 1)                              # unique minimum: test all i at once
+            j = j_k[:,np.argmax(cos[u],axis=-1)]
+            _r = _compose(s[:,u],o[j,u])
+            forward,ok = in_FZ(_r)
+            i = np.argmax(ok,axis=0)                                                                # first pair in FZ
+            hit = np.flatnonzero(ok[i,np.arange(len(u))])
+            quat[c+u[hit]] = np.where(forward[i[hit],hit,np.newaxis],
+                                      _r[i[hit],hit]*conjugate,_r[i[hit],hit])
+            ops[c+u[hit]] = np.stack([i[hit],j[i[hit],hit]],axis=-1)
+            found[u[hit]] = True
+
+            for pairs in (minimum[:,k],None):                                                       # ties: reduced search, exhaustive fallback
+                if found.all(): break
+                for i_,j_ in np.ndindex(len(sym_ops),len(sym_ops)):                                 # first pair in FZ
+                    todo = np.flatnonzero(~found if pairs is None else pairs[:,i_,j_] & ~found)
+                    if len(todo) == 0: continue
+                    _r = _compose(s[i_,todo],o[j_,todo])
+                    forward,ok = in_FZ(_r)
+                    quat[c+todo[ok]] = np.where(forward[ok,np.newaxis],_r[ok]*conjugate,_r[ok])
+                    ops[c+todo[ok]] = (i_,j_)
+                    found[todo[ok]] = True
+                    if found.all(): break
+            if not found.all():
+                raise ValueError('no equivalent disorientation in fundamental zone, invalid quaternion(s)')
 
         return (
-                (self.copy(rotation=quat), (np.vstack(loc[:2]).T)[sort].reshape((*shp,2)))
+                (self.copy(rotation=quat.reshape(blend+(4,))), ops.reshape(blend+(2,)))
                 if return_operators else
-                self.copy(rotation=quat)
+                self.copy(rotation=quat.reshape(blend+(4,)))
                )
 
 
@@ -569,6 +750,8 @@ class Orientation(Rotation,Crystal):
         Notes
         -----
         Requires same crystal family for both orientations.
+        For single precision, small angles (ω < 1e-2) are only
+        resolved with an accuracy of about 5e-4 rad.
 
         References
         ----------
@@ -676,6 +859,49 @@ class Orientation(Rotation,Crystal):
                )
 
 
+    def average_by(self: MyType,
+                   labels: np.ndarray,
+                   weights: Optional[FloatSequence] = None) -> MyType:
+        """
+        Return orientation average per label.
+
+        Parameters
+        ----------
+        labels : numpy.ndarray, shape (self.shape)
+            Label of each orientation, e.g. grain ID.
+        weights : numpy.ndarray, shape (self.shape), optional
+            Relative weights of orientations.
+            Defaults to equal weights.
+
+        Returns
+        -------
+        average : Orientation, shape (N_labels)
+            Weighted average for each label, sorted by label.
+
+        Notes
+        -----
+        For each label, the symmetrically equivalent orientations
+        closest to the first orientation with that label are averaged.
+
+        References
+        ----------
+        J.C. Glez and J. Driver, Journal of Applied Crystallography 34:280-288, 2001
+        https://doi.org/10.1107/S0021889801003077
+
+        """
+        if np.shape(labels) != self.shape: raise ValueError(f'shape mismatch: {np.shape(labels)} and {self.shape}')
+
+        _, first, idx = np.unique(labels,return_index=True,return_inverse=True)
+        o = Rotation(self.flatten())
+        sym_ops = self.symmetry_operations.astype(self.dtype)
+        p = o[first[idx.reshape(-1)]]*~o                                                            # real part of s*o*~o_ref = s·p
+        r = sym_ops[np.argmax(np.abs(p.quaternion@sym_ops.quaternion.T),axis=-1)]*o
+
+        return self.copy(r.average_by(np.ravel(labels),
+                                      None if weights is None else
+                                      np.broadcast_to(np.array(weights,float),self.shape).reshape(-1)))
+
+
     def to_SST(self,
                vector: FloatSequence,
                proper: bool = False,
@@ -709,18 +935,68 @@ class Orientation(Rotation,Crystal):
             raise ValueError('input is not a field of three-dimensional vectors')
 
         blend = util.shapeblender(self.shape,vector_.shape[:-1])
-        eq    = self.broadcast_to(util.shapeshifter(self.shape,blend,mode='right')).equivalent
-        poles = np.atleast_2d(eq @ np.broadcast_to(vector_,(1,)+blend+(3,)))
-        ok    = self.in_SST(poles,proper=proper)
-        ok   &= np.cumsum(ok,axis=0) == 1
-        loc   = np.where(ok)
-        sort  = 0 if len(loc) == 1 else np.lexsort(loc[:0:-1])
+        q,v = self._broadcast_flat(vector_,blend)
+        poles,ops = np.empty_like(v),np.empty(len(v),dtype=np.int64)
+        for c in range(0,len(v),_chunk_size):
+            poles[c:c+_chunk_size],ops[c:c+_chunk_size] = self._to_SST(q[c:c+_chunk_size],v[c:c+_chunk_size],proper)
+
+        return (poles.reshape(blend+(3,)), ops.reshape(blend)) if return_operators else poles.reshape(blend+(3,))
+
+
+    def _broadcast_flat(self,
+                        other: np.ndarray,
+                        blend: Tuple[int, ...],
+                        rank: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """Broadcast quaternions and vectors (rank 1) or tensors (rank 2) to blended shape and flatten."""
+        tail = other.shape[other.ndim-rank:]
+        return (np.broadcast_to(self.quaternion.reshape(util.shapeshifter(self.shape,blend,mode='right')+(4,)),
+                                blend+(4,)).reshape(-1,4),
+                np.broadcast_to(other.reshape(util.shapeshifter(other.shape[:-rank],blend,mode='left')+tail),
+                                blend+tail).reshape((-1,)+tail))
+
+
+    def _to_SST(self,
+                q: np.ndarray,
+                vector: np.ndarray,
+                proper: bool) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Rotate lab frame vectors into SST.
 
-        return (
-                (poles[ok][sort].reshape(blend+(3,)), (np.vstack(loc[:1]).T)[sort].reshape(blend))
-                if return_operators else
-                poles[ok][sort].reshape(blend+(3,))
-               )
+        Each vector is rotated once and the symmetry operators are applied
+        until the first one that maps it into the SST.
+
+        Parameters
+        ----------
+        q : numpy.ndarray, shape (N,4)
+            Quaternions.
+        vector : numpy.ndarray, shape (N,3)
+            Lab frame vectors.
+        proper : bool
+            Consider only vectors with z >= 0, hence combine two neighboring SSTs.
+
+        Returns
+        -------
+        vector_SST : numpy.ndarray, shape (N,3)
+            Rotated vectors falling into SST.
+        operator : numpy.ndarray of int, shape (N)
+            Index of symmetry operator that rotated vector to SST.
+
+        """
+        p = Rotation(q) @ vector
+
+        if (standard_triangle := self.standard_triangle) is None:                                   # direct exit for no symmetry
+            return p, np.zeros(len(p),dtype=np.int64)
+
+        poles = np.empty_like(p)
+        ops = np.empty(len(p),dtype=np.int64)
+        todo = np.arange(len(p))
+        for k,R in enumerate(self.symmetry_operations.as_matrix()):                                 # first operator mapping into SST
+            p_ = p[todo]@R.T
+            ok = _SST_components(standard_triangle,p_,proper)[1]
+            poles[todo[ok]] = p_[ok]
+            ops[todo[ok]] = k
+            if len(todo := todo[~ok]) == 0: break
+        return poles, ops
 
 
     def in_SST(self,
@@ -750,27 +1026,14 @@ class Orientation(Rotation,Crystal):
         if self.standard_triangle is None:                                                          # direct exit for no symmetry
             return np.ones_like(vector_[...,0],bool)
 
-        if proper:
-            components_proper   = np.around(np.einsum('...ji,...i',
-                                                      np.broadcast_to(self.standard_triangle['proper'],   vector_.shape+(3,)),
-                                                      vector_), 12)
-            components_improper = np.around(np.einsum('...ji,...i',
-                                                      np.broadcast_to(self.standard_triangle['improper'], vector_.shape+(3,)),
-                                                      vector_), 12)
-            return   np.all(components_proper   >= 0.0,axis=-1) \
-                   | np.all(components_improper >= 0.0,axis=-1)
-        else:
-            components = np.around(np.einsum('...ji,...i',
-                                             np.broadcast_to(self.standard_triangle['improper'], vector_.shape+(3,)),
-                                             np.block([vector_[...,:2],np.abs(vector_[...,2:3])])), 12)
-
-            return np.all(components >= 0.0,axis=-1)
+        return _SST_components(self.standard_triangle,vector_,proper)[1]
 
 
     def IPF_color(self,
                   vector: FloatSequence,
                   in_SST: bool = True,
-                  proper: bool = False) -> np.ndarray:
+                  proper: bool = False,
+                  out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Map lab frame vector to RGB color within standard stereographic triangle of own symmetry.
 
@@ -786,12 +1049,19 @@ class Orientation(Rotation,Crystal):
         proper : bool, optional
             Consider only vectors with z >= 0, hence combine two neighboring SSTs (with mirrored colors).
             Defaults to False.
+        out : numpy.ndarray, shape (...,3), optional
+            C-contiguous array for the result. If of unsigned integer type,
+            e.g. numpy.uint8, the colors are scaled to its maximum value.
 
         Returns
         -------
         rgb : numpy.ndarray, shape (...,3)
            RGB array of IPF colors.
 
+        See Also
+        --------
+        inverse_pole_figure_density : Density of lab frame vector in SST.
+
         Examples
         --------
         Inverse pole figure color of the e_3 lab direction for a
@@ -802,6 +1072,13 @@ class Orientation(Rotation,Crystal):
         >>> o.IPF_color([0,0,1])
         array([1., 0., 0.])
 
+        8-bit colors of a map:
+
+        >>> import numpy as np
+        >>> import damask
+        >>> o = damask.Orientation.from_random(shape=(4096,4096),family='cubic')
+        >>> rgb = o.IPF_color([0,0,1],out=np.empty((4096,4096,3),np.uint8))
+
         Sample standard triangle for hexagonal symmetry:
 
         >>> import damask
@@ -817,40 +1094,117 @@ class Orientation(Rotation,Crystal):
         >>> plt.show()
 
         """
-        if np.array(vector).shape[-1] != 3:
+        vector_ = np.array(vector,float)
+        if vector_.shape[-1] != 3:
             raise ValueError('input is not a field of three-dimensional vectors')
 
-        vector_ = self.to_SST(vector,proper) if in_SST else \
-                  self @ np.broadcast_to(vector,self.shape+(3,))
+        blend = util.shapeblender(self.shape,vector_.shape[:-1])
+        rgb = np.empty(blend+(3,)) if out is None else out
+        if rgb.shape != blend+(3,) or not rgb.flags.c_contiguous:
+            raise ValueError(f'output array of shape {rgb.shape} instead of C-contiguous {blend+(3,)}')
+        scale = np.iinfo(rgb.dtype).max if np.issubdtype(rgb.dtype,np.unsignedinteger) else 1.
+
+        if (standard_triangle := self.standard_triangle) is None:                                   # direct exit for no symmetry
+            rgb[...] = 0
+            return rgb
+
+        q,v = self._broadcast_flat(vector_,blend)
+        rgb_ = rgb.reshape(-1,3)
+        for c in range(0,len(v),_chunk_size):
+            p = self._to_SST(q[c:c+_chunk_size],v[c:c+_chunk_size],proper)[0] if in_SST else \
+                Rotation(q[c:c+_chunk_size]) @ v[c:c+_chunk_size]
+            components,in_SST_ = _SST_components(standard_triangle,p,proper)
+            with np.errstate(invalid='ignore',divide='ignore'):
+                color = (components/np.linalg.norm(components,axis=-1,keepdims=True))**(1./3.)      # smoothen color ramps
+                color = np.clip(color,0.,1.)                                                        # clip intensity
+                color /= np.max(color,axis=-1,keepdims=True)                                        # normalize to (HS)V = 1
+            color[~in_SST_] = 0.0
+            rgb_[c:c+_chunk_size] = color*scale if scale != 1. else color
 
-        if self.standard_triangle is None:                                                          # direct exit for no symmetry
-            return np.zeros_like(vector_)
-
-        if proper:
-            components_proper   = np.around(np.einsum('...ji,...i',
-                                                      np.broadcast_to(self.standard_triangle['proper'],   vector_.shape+(3,)),
-                                                      vector_), 12)
-            components_improper = np.around(np.einsum('...ji,...i',
-                                                      np.broadcast_to(self.standard_triangle['improper'], vector_.shape+(3,)),
-                                                      vector_), 12)
-            in_SST_ = np.all(components_proper   >= 0.0,axis=-1) \
-                    | np.all(components_improper >= 0.0,axis=-1)
-            components = np.where((in_SST_ & np.all(components_proper   >= 0.0,axis=-1))[...,np.newaxis],
-                                  components_proper,components_improper)
-        else:
-            components = np.around(np.einsum('...ji,...i',
-                                             np.broadcast_to(self .standard_triangle['improper'], vector_.shape+(3,)),
-                                             np.block([vector_[...,:2],np.abs(vector_[...,2:3])])), 12)
+        return rgb
 
-            in_SST_ = np.all(components >= 0.0,axis=-1)
 
-        with np.errstate(invalid='ignore',divide='ignore'):
-            rgb = (components/np.linalg.norm(components,axis=-1,keepdims=True))**(1./3.)            # smoothen color ramps
-            rgb = np.clip(rgb,0.,1.)                                                                # clip intensity
-            rgb /= np.max(rgb,axis=-1,keepdims=True)                                                # normalize to (HS)V = 1
-        rgb[np.broadcast_to(~in_SST_[...,np.newaxis],rgb.shape)] = 0.0
+    def inverse_pole_figure_density(self,
+                                    vector: FloatSequence,
+                                    weights: Optional[FloatSequence] = None,
+                                    bins: int = 128,
+                                    sigma: Optional[float] = None,
+                                    degrees: bool = False,
+                                    projection: Literal['equal_area', 'equal_angle'] = 'equal_area',
+                                    proper: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculate inverse pole figure density of lab frame vector in standard stereographic triangle.
 
-        return rgb
+        Parameters
+        ----------
+        vector : numpy.ndarray, shape (...,3)
+            Lab frame vector.
+            Shape of vector blends with shape of own rotation array.
+        weights : numpy.ndarray, shape (...), optional
+            Relative weight (e.g. volume fraction) of each pole.
+            Defaults to equal weights.
+        bins : int, optional
+            Number of pixels along each axis. Defaults to 128.
+        sigma : float, optional
+            Standard deviation of the Gaussian smoothing kernel
+            in terms of angle between poles. The kernel is
+            truncated at 3σ. Defaults to None, i.e. no smoothing.
+        degrees : bool, optional
+            sigma is given in degrees. Defaults to False.
+        projection : {'equal_area', 'equal_angle'}, optional
+            Projection of the crystal frame poles along z.
+            Defaults to 'equal_area'.
+        proper : bool, optional
+            Consider only vectors with z >= 0, hence combine two neighboring SSTs.
+            Defaults to False.
+
+        Returns
+        -------
+        density : numpy.ndarray, shape (bins,bins)
+            Density in multiples of random distribution.
+            The first index runs along x, the second along y.
+            Pixels outside of the SST are NaN.
+        extent : numpy.ndarray, shape (4)
+            Lower and upper bounds along x and y of the SST projection.
+
+        Examples
+        --------
+        Inverse pole figure of the e_3 lab direction for a large set of hexagonal orientations.
+
+        >>> import damask
+        >>> from matplotlib import pyplot as plt
+        >>> o = damask.Orientation.from_random(shape=10000000,family='hexagonal')
+        >>> density,extent = o.inverse_pole_figure_density([0,0,1],sigma=2.,degrees=True)
+        >>> plt.imshow(density.T,origin='lower',extent=extent)
+        [...]
+        >>> plt.show()
+
+        """
+        vector_ = np.array(vector,float)
+        if vector_.shape[-1] != 3:
+            raise ValueError('input is not a field of three-dimensional vectors')
+
+        blend = util.shapeblender(self.shape,vector_.shape[:-1])
+        q,v = self._broadcast_flat(vector_,blend)
+        w = np.ones(len(v)) if weights is None else \
+            np.broadcast_to(np.array(weights,float),blend).reshape(-1)
+        project = util.project_equal_area if projection == 'equal_area' else util.project_equal_angle
+
+        if (standard_triangle := self.standard_triangle) is None:
+            extent = np.array([-1.,1.,-1.,1.])
+        else:
+            corners = [np.linalg.inv(standard_triangle[k]).T for k in (['improper','proper'] if proper else ['improper'])]
+            t = np.linspace(0.,1.,257)[:,np.newaxis]
+            edges = project(np.concatenate([(1.-t)*c[i]+t*c[(i+1)%3] for c in corners for i in range(3)]))
+            extent = np.array([edges[:,0].min(),edges[:,0].max(),edges[:,1].min(),edges[:,1].max()])
+
+        return (_density_2D(((project(self._to_SST(q[c:c+_chunk_size],v[c:c+_chunk_size],proper)[0]),
+                              w[c:c+_chunk_size]) for c in range(0,len(v),_chunk_size)),
+                            bins,extent,projection,
+                            lambda v: np.asarray(self.in_SST(v,proper)),
+                            None if sigma is None else np.radians(sigma) if degrees else sigma,
+                            self.symmetry_operations.as_matrix()),
+                extent)
 
 
 ####################################################################################################
@@ -949,6 +1303,96 @@ class Orientation(Rotation,Crystal):
                            0)
 
 
+    def pole_figure_density(self, *,
+                            uvw: Optional[IntSequence] = None,
+                            hkl: Optional[IntSequence] = None,
+                            uvtw: Optional[IntSequence] = None,
+                            hkil: Optional[IntSequence] = None,
+                            weights: Optional[FloatSequence] = None,
+                            bins: int = 128,
+                            sigma: Optional[float] = None,
+                            degrees: bool = False,
+                            projection: Literal['equal_area', 'equal_angle'] = 'equal_area',
+                            direction: Literal['x', 'y', 'z'] = 'z') -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculate pole figure density of lattice direction ⟨uvw⟩/⟨uvtw⟩ or plane normal {hkl}/{hkil}.
+
+        Parameters
+        ----------
+        uvw|hkl|uvtw|hkil : numpy.ndarray, shape (3) or shape (4)
+            Miller(–Bravais) indices of crystallographic direction or plane normal.
+            All symmetrically equivalent poles are considered.
+        weights : numpy.ndarray, shape (self.shape), optional
+            Relative weight (e.g. volume fraction) of each orientation.
+            Defaults to equal weights.
+        bins : int, optional
+            Number of pixels along each axis. Defaults to 128.
+        sigma : float, optional
+            Standard deviation of the Gaussian smoothing kernel
+            in terms of angle between poles. The kernel is
+            truncated at 3σ. Defaults to None, i.e. no smoothing.
+        degrees : bool, optional
+            sigma is given in degrees. Defaults to False.
+        projection : {'equal_area', 'equal_angle'}, optional
+            Projection of the lab frame poles. Defaults to 'equal_area'.
+        direction : {'x', 'y', 'z'}, optional
+            Projection direction. Defaults to 'z'.
+
+        Returns
+        -------
+        density : numpy.ndarray, shape (bins,bins)
+            Density in multiples of random distribution.
+            The first index runs along the next axis relative to the
+            projection direction, the second along the next-next axis.
+            Pixels outside of the unit circle are NaN.
+        extent : numpy.ndarray, shape (4)
+            Lower and upper bounds along both axes, i.e. [-1,1,-1,1].
+
+        Notes
+        -----
+        Poles on the lower hemisphere are projected onto the upper hemisphere.
+
+        Examples
+        --------
+        {111} pole figure of a large set of face-centered cubic orientations.
+
+        >>> import damask
+        >>> from matplotlib import pyplot as plt
+        >>> o = damask.Orientation.from_random(shape=10000000,lattice='cF')
+        >>> density,extent = o.pole_figure_density(hkl=[1,1,1],sigma=2.,degrees=True)
+        >>> plt.imshow(density.T,origin='lower',extent=extent)
+        [...]
+        >>> plt.show()
+
+        """
+        v = np.array(super().to_frame(uvw=uvw,hkl=hkl,uvtw=uvtw,hkil=hkil),float)
+        if v.shape != (3,):
+            raise ValueError('input is not a single crystallographic direction or plane')
+
+        v = self.symmetry_operations.as_matrix()@(v/np.linalg.norm(v))
+        v *= np.where(np.sum(np.sign(np.round(v,12))*[4,2,1],axis=-1,keepdims=True)<0,-1.,1.)       # antipodal poles coincide
+        v = v[np.unique(np.round(v,12),axis=0,return_index=True)[1]]
+        q = self.quaternion.reshape(-1,4)
+        w = np.ones(len(q)) if weights is None else \
+            np.broadcast_to(np.array(weights,float),self.shape).reshape(-1)
+        project = util.project_equal_area if projection == 'equal_area' else util.project_equal_angle
+        extent = np.array([-1.,1.,-1.,1.])
+        axis = 'xyz'.index(direction)
+
+        def poles(q: np.ndarray) -> np.ndarray:
+            p = v@Rotation._qu2om(q)
+            p *= np.where(p[...,axis:axis+1] < 0.,-1.,1.)                                           # upper hemisphere of lab frame
+            return project(p,direction,normalize=False).reshape(-1,2)
+
+        return (_density_2D(((poles(q[c:c+_chunk_size]),
+                              np.repeat(w[c:c+_chunk_size],len(v))) for c in range(0,len(q),_chunk_size)),
+                            bins,extent,projection,
+                            lambda v: np.ones(v.shape[:-1],bool),
+                            None if sigma is None else np.radians(sigma) if degrees else sigma,
+                            np.eye(3)[np.newaxis]),
+                extent)
+
+
     def Schmid(self, *,
                N_slip: Optional[IntSequence] = None,
                N_twin: Optional[IntSequence] = None) -> np.ndarray:
@@ -980,6 +1424,17 @@ class Orientation(Rotation,Crystal):
                [ 0.000,  0.000,  0.000]])
 
         """
+        P = self._Schmid_crystal(N_slip,N_twin)
+        shape = P.shape[0:1]+self.shape+(3,3)
+
+        return ~self.broadcast_to(shape[:-2]) \
+               @ np.broadcast_to(P.reshape(util.shapeshifter(P.shape,shape)),shape)
+
+
+    def _Schmid_crystal(self,
+                        N_slip: Optional[IntSequence],
+                        N_twin: Optional[IntSequence]) -> np.ndarray:
+        """Calculate Schmid matrix P = d ⨂ n in the crystal frame for selected deformation systems."""
         if (N_slip is not None) ^ (N_twin is None):
             raise KeyError('specify either "N_slip" or "N_twin"')
 
@@ -991,18 +1446,73 @@ class Orientation(Rotation,Crystal):
             raise ValueError('Schmid matrix not defined')
         d = super().to_frame(uvw=np.vstack([kinematics['direction'][i][:n] for i,n in enumerate(active)]))
         p = super().to_frame(hkl=np.vstack([kinematics['plane'][i][:n] for i,n in enumerate(active)]))
-        P = np.einsum('...i,...j',d/np.linalg.norm(d,axis=1,keepdims=True),
-                                  p/np.linalg.norm(p,axis=1,keepdims=True))
+        return np.einsum('...i,...j',d/np.linalg.norm(d,axis=1,keepdims=True),
+                                     p/np.linalg.norm(p,axis=1,keepdims=True))
 
-        shape = P.shape[0:1]+self.shape+(3,3)
 
-        return ~self.broadcast_to(shape[:-2]) \
-               @ np.broadcast_to(P.reshape(util.shapeshifter(P.shape,shape)),shape)
+    def resolved_shear_stress(self,
+                              sigma: FloatSequence,
+                              *,
+                              N_slip: Optional[IntSequence] = None,
+                              N_twin: Optional[IntSequence] = None) -> np.ndarray:
+        u"""
+        Calculate resolved shear stress τ = σ : P on selected deformation systems.
+
+        Parameters
+        ----------
+        sigma : numpy.ndarray, shape (...,3,3)
+            Stress in the lab frame.
+            Shape of stress blends with shape of own rotation array.
+        N_slip|N_twin : '*' or sequence of int
+            Number of deformation systems per family of the deformation system.
+            Use '*' to select all.
+
+        Returns
+        -------
+        tau : numpy.ndarray, shape (...,N)
+            Resolved shear stress on each of the N deformation systems.
+
+        Notes
+        -----
+        Equivalent to contracting the stress with the Schmid matrices
+        (see Orientation.Schmid), but the stress is rotated to the crystal
+        frame instead of rotating the Schmid matrices to the lab frame.
+        Orientations are processed in chunks, so that memory usage scales
+        with the size of the result.
+
+        Examples
+        --------
+        Schmid factors of the octahedral slip systems of a face-centered cubic
+        crystal in "Goss" orientation under uniaxial tension along x.
+
+        >>> import numpy as np
+        >>> import damask
+        >>> O = damask.Orientation.from_Euler_angles(phi=[0,45,0],degrees=True,lattice='cF')
+        >>> O.resolved_shear_stress(np.diag([1.,0.,0.]),N_slip=[12])
+        array([ 0.   , -0.408,  0.408,  0.   , -0.408,  0.408,  0.   , -0.408,
+                0.408, -0.   , -0.408,  0.408])
+
+        """
+        P = self._Schmid_crystal(N_slip,N_twin)
+        sigma_ = np.asarray(sigma,float)
+        if sigma_.shape[-2:] != (3,3):
+            raise ValueError('input is not a field of second-order tensors')
+
+        blend = util.shapeblender(self.shape,sigma_.shape[:-2])
+        q,s = self._broadcast_flat(sigma_,blend,2)
+        tau = np.empty((len(s),len(P)))
+        for c in range(0,len(s),_chunk_size):
+            R = Rotation._qu2om(q[c:c+_chunk_size])
+            sigma_c = R@s[c:c+_chunk_size]@np.swapaxes(R,-1,-2)                                     # stress in crystal frame
+            tau[c:c+_chunk_size] = sigma_c.reshape(-1,9)@P.reshape(-1,9).T
+        return tau.reshape(blend+(len(P),))
 
 
     def related(self: MyType,
                 model: str,
-                target = None) -> MyType:
+                target = None,
+                variant: Union[None, int, IntSequence, Literal['random']] = None,
+                rng_seed: Optional[NumpyRngSeed] = None) -> MyType:
         """
         All orientations related to self by given relationship model.
 
@@ -1014,12 +1524,21 @@ class Orientation(Rotation,Crystal):
             Crystal to transform to.
             Providing this parameter allows specification of non-standard lattice parameters.
             Default is inferred from selected model and uses standard lattice parameters.
+        variant : int, numpy.ndarray of int, or 'random', optional
+            Index of the variant selected for each orientation.
+            Shape of the indices blends with shape of own rotation array.
+            Use 'random' to select variants with equal probability.
+            Defaults to None, i.e. all variants.
+        rng_seed : {None, int, array_like[ints], SeedSequence, BitGenerator, Generator}, optional
+            A seed to initialize the BitGenerator for random variant selection.
+            Defaults to None, i.e. unpredictable entropy will be pulled from the OS.
 
         Returns
         -------
-        rel : Orientation, shape (:,self.shape)
+        rel : Orientation, shape (:,self.shape) or (...)
             Orientations related to self according to the selected
             model for the orientation relationship.
+            If variants are selected, the leading dimension is omitted.
 
         Examples
         --------
@@ -1039,10 +1558,31 @@ class Orientation(Rotation,Crystal):
          [ 2.70598050e-01 -2.70598050e-01 -6.53281482e-01 -6.53281482e-01]
          [ 9.23879533e-01 -5.55111512e-17 -2.77555756e-17 -3.82683432e-01]]
 
+        Transform a large set of austenite orientations into martensite
+        by selecting one random Kurdjumov-Sachs variant each.
+
+        >>> import damask
+        >>> gamma = damask.Orientation.from_random(shape=1000000,lattice='cF')
+        >>> alpha = gamma.related('KS',variant='random')
+        >>> alpha.shape
+        (1000000,)
+
         """
         lattice,o = self.relation_operations(model,target)
         target = Crystal(lattice=lattice) if target is None else target
-        return Orientation(rotation=o*Rotation(self.quaternion)[np.newaxis,...],                    # type: ignore
+        if variant is None:
+            rotation = o*Rotation(self.quaternion)[np.newaxis,...]
+        else:
+            if isinstance(variant,str) and variant != 'random':
+                raise ValueError(f'invalid variant "{variant}"')
+            v = np.random.default_rng(rng_seed).integers(len(o),size=self.shape) if isinstance(variant,str) else \
+                np.array(variant,dtype=int)
+            if np.any((v < 0) | (v >= len(o))):
+                raise ValueError(f'variant not in [0,{len(o)})')
+            blend = util.shapeblender(self.shape,v.shape)
+            q_s = self.quaternion.reshape(util.shapeshifter(self.shape,blend,mode='right')+(4,))
+            rotation = Rotation(_compose(o.quaternion[v.reshape(util.shapeshifter(v.shape,blend,mode='left'))],q_s))
+        return Orientation(rotation=rotation,                                                       # type: ignore
                            lattice=target.lattice,
                            a=target.a,
                            b=target.b,
@@ -1,10 +1,15 @@
 import re
+import ast
 import fnmatch
 import os
 import copy
 import xml.etree.ElementTree as ET                                                                  # noqa
 import xml.dom.minidom
 import functools
+import contextlib
+import itertools
+import zlib
+import concurrent.futures
 from pathlib import Path
 from collections import defaultdict
 from collections.abc import Iterable
@@ -33,11 +38,172 @@ chunk_size = 1024**2//8
 prefix_inc = 'increment_'
 
 
-def _read(dataset: h5py._hl.dataset.Dataset) -> np.ndarray:
+def _record(profiler: Optional[util.Profiler],
+            name: str,
+            nbytes: int = 0,
+            total: bool = False):
+    """Record a phase if profiling is enabled."""
+    return contextlib.nullcontext({}) if profiler is None else profiler.record(name,nbytes,total)
+
+def _fletcher32(buffer) -> int:
+    """
+    Fletcher-32 checksum as computed by the HDF5 library.
+
+    The 16 bit words are summed up blockwise in floating point arithmetic,
+    which is exact as long as the partial sums are below 2^53.
+    """
+    B = 4096
+    N = len(buffer)//2
+    w = np.zeros(-(-N//B)*B)
+    w[:N] = np.frombuffer(buffer,'>u2',N)
+    w = w.reshape(-1,B)
+    rows = w.sum(axis=1).astype(np.int64)
+    s1 = int(rows.sum())
+    s2 = int(np.sum((N-B*np.arange(1,len(w)+1,dtype=np.int64))%65535 * (rows%65535))) \
+       + int(np.sum((w@np.arange(B,0,-1,dtype=float)).astype(np.int64)%65535))
+    if len(buffer)%2:
+        s1 += int(buffer[-1])<<8
+        s2 += s1
+    s1,s2 = (s%65535 or (65535 if s else 0) for s in (s1,s2))                                      # end-around carry
+    return (s2 << 16) | s1
+
+def _unshuffle(buffer,
+               itemsize: int) -> np.ndarray:
+    """Revert the HDF5 shuffle filter."""
+    N = len(buffer)//itemsize
+    shuffled = np.frombuffer(buffer,np.uint8)
+    unshuffled = np.empty_like(shuffled)
+    for i,byte in enumerate(shuffled[:N*itemsize].reshape(itemsize,N)):
+        unshuffled[i:N*itemsize:itemsize] = byte
+    unshuffled[N*itemsize:] = shuffled[N*itemsize:]
+    return unshuffled
+
+def _read_chunks(dataset: h5py._hl.dataset.Dataset,
+                 dtype: np.dtype,
+                 profiler: Optional[util.Profiler] = None,
+                 N_threads: Optional[int] = None) -> Optional[np.ndarray]:
+    """
+    Read a compressed dataset by decompressing its chunks in parallel threads.
+
+    Returns None if parallelization is not possible or if the
+    layout or filters of the dataset are not supported.
+    """
+    N_threads_ = (os.cpu_count() or 1) if N_threads is None else N_threads
+    if N_threads_ < 2 or dataset.chunks is None or not hasattr(dataset.id,'read_direct_chunk') \
+       or dataset.dtype.kind not in 'biuf' or dataset.size == 0:
+        return None
+
+    dcpl = dataset.id.get_create_plist()
+    filters = [dcpl.get_filter(i)[:3] for i in range(dcpl.get_nfilters())]
+    codes = [f[0] for f in filters]
+    if h5py.h5z.FILTER_DEFLATE not in codes or \
+       not set(codes) <= {h5py.h5z.FILTER_DEFLATE,h5py.h5z.FILTER_SHUFFLE,h5py.h5z.FILTER_FLETCHER32}:
+        return None
+
+    offsets = list(itertools.product(*[range(0,s,c) for s,c in zip(dataset.shape,dataset.chunks)]))
+    try:
+        if len(offsets) < 2 or dataset.id.get_num_chunks() != len(offsets): return None             # unallocated chunks
+    except AttributeError:
+        return None
+
+    def decode(offset: Tuple[int, ...], mask: int, chunk: bytes):
+        buffer: Union[bytes, np.ndarray] = chunk
+        with _record(profiler,'decompress') as event:
+            for i,(code,_,values) in reversed(list(enumerate(filters))):
+                if mask & 1<<i: continue
+                if code == h5py.h5z.FILTER_DEFLATE:
+                    buffer = zlib.decompress(bytes(buffer))                                         # no copy for bytes
+                elif code == h5py.h5z.FILTER_SHUFFLE:
+                    buffer = _unshuffle(buffer,values[0] if values else dataset.dtype.itemsize)
+                else:
+                    checksum,buffer = int.from_bytes(bytes(buffer[-4:]),'little'),buffer[:-4]
+                    f = _fletcher32(buffer)
+                    if checksum not in (f,(f&0x00ff00ff)<<8 | (f>>8)&0x00ff00ff):                   # HDF5 < 1.6.3
+                        raise OSError(f'Fletcher32 checksum mismatch in chunk {offset} of "{dataset.name}"')
+            event['bytes'] = len(buffer)
+        data = np.frombuffer(buffer,dataset.dtype).reshape(dataset.chunks)
+        out[tuple(slice(o,o+c) for o,c in zip(offset,dataset.chunks))] \
+            = data[tuple(slice(0,s-o) for o,s in zip(offset,dataset.shape))]
+
+    out = np.empty(dataset.shape,dtype)
+    with concurrent.futures.ThreadPoolExecutor(min(len(offsets),N_threads_)) as executor:
+        jobs = []
+        for offset in offsets:                                                                      # h5py is not thread-parallel
+            with _record(profiler,'read') as event:
+                mask,chunk = dataset.id.read_direct_chunk(offset)
+                event['bytes'] = len(chunk)
+            jobs.append(executor.submit(decode,offset,mask,chunk))
+        for job in jobs: job.result()
+    return out
+
+def _read(dataset: h5py._hl.dataset.Dataset,
+          profiler: Optional[util.Profiler] = None) -> np.ndarray:
     """Read a dataset and its metadata into a numpy.ndarray."""
     metadata = {k:(v.decode() if not h5py3 and type(v) is bytes else v) for k,v in dataset.attrs.items()}
     dtype = np.dtype(dataset.dtype,metadata=metadata)                                               # type: ignore
-    return np.array(dataset,dtype=dtype)
+    if (data := _read_chunks(dataset,dtype,profiler)) is not None:
+        return data
+    with _record(profiler,'read') as event:
+        if profiler is not None: event['bytes'] = dataset.id.get_storage_size()
+        return np.array(dataset,dtype=dtype)
+
+def _is_elementwise(node: ast.AST,
+                    variables: Sequence[str]) -> bool:
+    """Check whether an expression consists only of arithmetics, comparisons, and numpy ufuncs of variables."""
+    if isinstance(node,ast.Call):
+        return isinstance(node.func,ast.Attribute) and isinstance(node.func.value,ast.Name) \
+           and node.func.value.id == 'np' and isinstance(getattr(np,node.func.attr,None),np.ufunc) \
+           and not node.keywords and all(_is_elementwise(a,variables) for a in node.args)
+    if isinstance(node,ast.Attribute):                                                              # constants such as np.pi
+        return isinstance(node.value,ast.Name) and node.value.id == 'np' \
+           and isinstance(getattr(np,node.attr,None),float)
+    if isinstance(node,ast.Name):
+        return node.id in variables
+    return isinstance(node,(ast.Expression,ast.BinOp,ast.UnaryOp,ast.Compare,ast.Constant,
+                            ast.operator,ast.unaryop,ast.cmpop,ast.Load)) \
+       and all(_is_elementwise(c,variables) for c in ast.iter_child_nodes(node))
+
+@functools.lru_cache(maxsize=32)
+def _compile_formula(formula: str) -> Tuple[Any, Dict[str, str], bool]:
+    """
+    Compile a formula referencing datasets as '#TheirName#' into code operating on variables.
+
+    Also report whether the formula is elementwise along the first axis, i.e. can be evaluated chunkwise.
+    """
+    variables = {d:f'_dataset_{i}' for i,d in enumerate(dict.fromkeys(re.findall(r'#(.*?)#',formula)))}
+    tree = ast.parse(re.sub(r'#(.*?)#',lambda m: variables[m.group(1)],formula),'<formula>','eval')
+    return compile(tree,'<formula>','eval'), variables, _is_elementwise(tree,list(variables.values()))
+
+def _evaluate_formula(formula: str,
+                      data: Dict[str, np.ndarray]) -> Any:
+    """
+    Evaluate a formula for datasets.
+
+    Elementwise formulas are evaluated for chunks of points to
+    avoid intermediate arrays of the size of the datasets.
+    """
+    expression,variables,elementwise = _compile_formula(formula)
+    local = {v:data[d] for d,v in variables.items()}
+    if not elementwise or not all(np.ndim(x) > 0 for x in local.values()):
+        return eval(expression,globals(),local)
+    N = [np.shape(x)[0] for x in local.values()]
+    if len(set(N)) != 1:
+        return eval(expression,globals(),local)
+
+    N_points: int = N[0]
+    step = max(1,chunk_size//max(np.size(x[0]) for x in local.values()))
+    if step >= N_points:
+        return eval(expression,globals(),local)
+
+    out = None
+    for c in range(0,N_points,step):
+        r = np.asarray(eval(expression,globals(),{v:x[c:c+step] for v,x in local.items()}))
+        if out is None:
+            if r.shape[:1] != (min(step,N_points),):                                                # broadcasting along first axis
+                return eval(expression,globals(),local)
+            out = np.empty((N_points,)+r.shape[1:],r.dtype)
+        out[c:c+step] = r
+    return out
 
 def _match(requested,
            existing: h5py._hl.base.KeysViewHDF5) -> List[str]:
@@ -148,6 +314,7 @@ class Result:
         self.fname = Path(fname).expanduser().absolute()
 
         self._protected = True
+        self._profiler: Optional[util.Profiler] = None
 
 
     def __copy__(self) -> "Result":
@@ -568,6 +735,55 @@ class Result:
         return msg
 
 
+    def enable_profiling(self) -> util.Profiler:
+        """
+        Record timings of reading, computing, and writing.
+
+        The profiler is shared with all views derived from this view.
+
+        Returns
+        -------
+        profiler : damask.util.Profiler
+            Profiler collecting timings, number of calls, and bytes
+            moved for the phases 'open', 'metadata', 'mapping',
+            'read', 'scatter', 'compute', 'write', 'VTK build',
+            and 'VTK save' of the individual operations.
+
+        Examples
+        --------
+        Find out where time is spent when exporting to VTK and write
+        a trace that can be inspected with chrome://tracing:
+
+        >>> import damask
+        >>> r = damask.Result('my_file.hdf5')
+        >>> profiler = r.enable_profiling()
+        >>> r.export_VTK()
+        >>> profiler.report()
+        {...}
+        >>> profiler.save_Chrome_trace('trace.json')
+
+        """
+        self._profiler = util.Profiler()
+        return self._profiler
+
+    def disable_profiling(self):
+        """Stop recording timings."""
+        self._profiler = None
+
+    def _record(self,
+                name: str,
+                nbytes: int = 0,
+                total: bool = False):
+        """Record a phase if profiling is enabled."""
+        return _record(self._profiler,name,nbytes,total)
+
+    def _open(self,
+              mode: Literal['r', 'a'] = 'r') -> h5py.File:
+        """Open the underlying DADF5 file."""
+        with self._record('open'):
+            return h5py.File(self.fname,mode)
+
+
     def enable_user_function(self,
                              func: Callable):
         globals()[func.__name__]=func
@@ -675,6 +891,12 @@ class Result:
         formula : str
             Formula to calculate resulting dataset.
             Existing datasets are referenced by '#TheirName#'.
+            The modules numpy (as 'np'), damask.tensor ('tensor'),
+            and damask.mechanics ('mechanics') are available.
+            The formula is compiled once and then evaluated for
+            each matching group. Formulas consisting only of arithmetic
+            operations, comparisons, and numpy ufuncs are evaluated for
+            chunks of points to limit the size of intermediate results.
         name : str
             Name of resulting dataset.
         unit : str, optional
@@ -716,12 +938,10 @@ class Result:
 
         """
         def calculation(**kwargs) -> DADF5Dataset:
-            formula = kwargs['formula']
-            for d in re.findall(r'#(.*?)#',formula):
-                formula = formula.replace(f'#{d}#',f"kwargs['{d}']['data']")
-            data = eval(formula)
+            variables = _compile_formula(kwargs['formula'])[1]
+            data = _evaluate_formula(kwargs['formula'],{d:kwargs[d]['data'] for d in variables})
 
-            if not hasattr(data,'shape') or data.shape[0] != kwargs[d]['data'].shape[0]:
+            if not hasattr(data,'shape') or data.shape[0] != kwargs[next(iter(variables))]['data'].shape[0]:
                 raise ValueError('"{}" results in invalid shape'.format(kwargs['formula']))
 
             return {
@@ -734,7 +954,7 @@ class Result:
                               }
                      }
 
-        dataset_mapping = {d:d for d in set(re.findall(r'#(.*?)#',formula))}                        # datasets used in the formula
+        dataset_mapping = {d:d for d in _compile_formula(formula)[1]}                               # datasets used in the formula
         args             = {'formula':formula,'label':name,'unit':unit,'description':description}
         self._add_generic_pointwise(calculation,dataset_mapping,args)
 
@@ -958,7 +1178,7 @@ class Result:
             o = Orientation(rotation = q['data'],lattice=lattice)
 
             return {
-                    'data': (o.IPF_color(l)*255).astype(np.uint8),
+                    'data': o.IPF_color(l,out=np.empty(o.shape+(3,),np.uint8)),
                     'label': 'IPFcolor_({} {} {})'.format(*m),
                     'meta' : {
                               'unit':        '8-bit RGB',
@@ -1182,6 +1402,61 @@ class Result:
         self._add_generic_pointwise(pole,{'q':q},{'uvw':uvw,'hkl':hkl,'with_symmetry':with_symmetry,'normalize':normalize})
 
 
+    def add_resolved_shear_stress(self,
+                                  sigma: str = 'sigma',
+                                  q: str = 'O',
+                                  *,
+                                  N_slip: Optional[IntSequence] = None,
+                                  N_twin: Optional[IntSequence] = None):
+        u"""
+        Add resolved shear stress τ = σ : P on selected deformation systems.
+
+        Parameters
+        ----------
+        sigma : str, optional
+            Name of the dataset containing the Cauchy stress.
+            Defaults to 'sigma'.
+        q : str, optional
+            Name of the dataset containing the crystallographic orientation as quaternions.
+            Defaults to 'O'.
+        N_slip|N_twin : '*' or sequence of int
+            Number of deformation systems per family of the deformation system.
+            Use '*' to select all.
+
+        Examples
+        --------
+        Add the resolved shear stress on all slip systems:
+
+        >>> import damask
+        >>> r = damask.Result('my_file.hdf5')
+        >>> r.add_stress_Cauchy()
+        >>> r.add_resolved_shear_stress(N_slip='*')
+        [...]
+
+        """
+        def resolved_shear_stress(sigma: DADF5Dataset,
+                                  q: DADF5Dataset,
+                                  N_slip: Optional[IntSequence],
+                                  N_twin: Optional[IntSequence]) -> DADF5Dataset:
+            c = q['meta']['c/a'] if 'c/a' in q['meta'] else 1.0
+            O = Orientation(q['data'],lattice=q['meta']['lattice'],a=1,c=c)
+            mode = 'slip' if N_twin is None else 'twin'
+            return {
+                    'data':  O.resolved_shear_stress(sigma['data'],N_slip=N_slip,N_twin=N_twin),
+                    'label': f"tau_{mode[:2]}({sigma['label']})",
+                    'meta':  {
+                              'unit':        sigma['meta']['unit'],
+                              'description': f"resolved shear stress on {mode} systems "
+                                             f"from {sigma['label']} ({sigma['meta']['description']})"
+                                             f" and {q['label']} ({q['meta']['description']})",
+                              'lattice':     q['meta']['lattice'],
+                              'creator':     'add_resolved_shear_stress'
+                              }
+                     }
+
+        self._add_generic_pointwise(resolved_shear_stress,{'sigma':sigma,'q':q},{'N_slip':N_slip,'N_twin':N_twin})
+
+
     def add_rotation(self, F: str):
         """
         Add rotational part of a deformation gradient.
@@ -1215,6 +1490,60 @@ class Result:
         self._add_generic_pointwise(rotation,{'F':F})
 
 
+    def add_Schmid_factor(self,
+                          l: FloatSequence,
+                          q: str = 'O',
+                          *,
+                          N_slip: Optional[IntSequence] = None,
+                          N_twin: Optional[IntSequence] = None):
+        """
+        Add Schmid factor for uniaxial loading on selected deformation systems.
+
+        Parameters
+        ----------
+        l : numpy.array of shape (3) or compatible
+            Lab frame loading direction.
+        q : str, optional
+            Name of the dataset containing the crystallographic orientation as quaternions.
+            Defaults to 'O'.
+        N_slip|N_twin : '*' or sequence of int
+            Number of deformation systems per family of the deformation system.
+            Use '*' to select all.
+
+        Examples
+        --------
+        Add the Schmid factors of all slip systems for loading along [0,0,1]:
+
+        >>> import damask
+        >>> r = damask.Result('my_file.hdf5')
+        >>> r.add_Schmid_factor([0,0,1],N_slip='*')
+        [...]
+
+        """
+        def Schmid_factor(q: DADF5Dataset,
+                          l: FloatSequence,
+                          N_slip: Optional[IntSequence],
+                          N_twin: Optional[IntSequence]) -> DADF5Dataset:
+            c = q['meta']['c/a'] if 'c/a' in q['meta'] else 1.0
+            O = Orientation(q['data'],lattice=q['meta']['lattice'],a=1,c=c)
+            l_ = np.array(l,float)/np.linalg.norm(l)
+            m = util.scale_to_coprime(np.array(l))
+            mode = 'slip' if N_twin is None else 'twin'
+            return {
+                    'data':  O.resolved_shear_stress(np.outer(l_,l_),N_slip=N_slip,N_twin=N_twin),
+                    'label': 'm_{}_({} {} {})'.format(mode[:2],*m),
+                    'meta':  {
+                              'unit':        '1',
+                              'description': 'Schmid factor of {} systems for uniaxial loading along ({} {} {})'
+                                             .format(mode,*m),
+                              'lattice':     q['meta']['lattice'],
+                              'creator':     'add_Schmid_factor'
+                              }
+                     }
+
+        self._add_generic_pointwise(Schmid_factor,{'q':q},{'l':l,'N_slip':N_slip,'N_twin':N_twin})
+
+
     def add_spherical(self, T: str):
         """
         Add the spherical (hydrostatic) part of a tensor.
@@ -1530,20 +1859,24 @@ class Result:
                           args: Dict[str, str]) -> Union[None, DADF5Dataset]:
             try:
                 datasets_in = {}
-                with h5py.File(self.fname,'r') as f:
+                with self._open('r') as f:
                     for arg,label in datasets.items():
                         loc  = f[group+'/'+label]
-                        datasets_in[arg]={'data' :loc[()],
+                        with self._record('read') as event:
+                            if self._profiler is not None: event['bytes'] = loc.id.get_storage_size()
+                            data = loc[()]
+                        datasets_in[arg]={'data' :data,
                                           'label':label,
                                           'meta': {k:(v.decode() if not h5py3 and type(v) is bytes else v) \
                                                    for k,v in loc.attrs.items()}}
-                return callback(**datasets_in,**args)
+                with self._record('compute'):
+                    return callback(**datasets_in,**args)
             except Exception as err:
                 print(f'Error during calculation: {err}.')
                 return None
 
         groups = []
-        with h5py.File(self.fname,'r') as f:
+        with self._open('r') as f, self._record('metadata'):
             for inc in self._visible['increments']:
                 for ty in ['phase','homogenization']:
                     for label in self._visible[ty+'s']:
@@ -1559,7 +1892,7 @@ class Result:
         for group in util.show_progress(groups):
             if not (result := job_pointwise(group, callback=func, datasets=datasets, args=args)):   # type: ignore
                 continue
-            with h5py.File(self.fname, 'a') as f:
+            with self._open('a') as f, self._record('write',result['data'].nbytes):
                 try:
                     if not self._protected and '/'.join([group,result['label']]) in f:
                         dataset = f['/'.join([group,result['label']])]
@@ -1593,7 +1926,7 @@ class Result:
 
     def _mappings(self):
         """Mappings to place data spatially."""
-        with h5py.File(self.fname,'r') as f:
+        with self._open('r') as f, self._record('mapping'):
 
             at_cell_ph = []
             in_data_ph = []
@@ -1638,12 +1971,12 @@ class Result:
         """
         r: Dict[str,Any] = {}
 
-        with h5py.File(self.fname,'r') as f:
+        with self._record('get',total=True), self._open('r') as f:
             for inc in util.show_progress(self._visible['increments']):
                 r[inc] = {'phase':{},'homogenization':{},'geometry':{}}
 
                 for out in _match(output,f['/'.join([inc,'geometry'])].keys()):
-                    r[inc]['geometry'][out] = _read(f['/'.join([inc,'geometry',out])])
+                    r[inc]['geometry'][out] = _read(f['/'.join([inc,'geometry',out])],self._profiler)
 
                 for ty in ['phase','homogenization']:
                     for label in self._visible[ty+'s']:
@@ -1651,7 +1984,8 @@ class Result:
                         for field in _match(self._visible['fields'],f['/'.join([inc,ty,label])].keys()):
                             r[inc][ty][label][field] = {}
                             for out in _match(output,f['/'.join([inc,ty,label,field])].keys()):
-                                r[inc][ty][label][field][out] = _read(f['/'.join([inc,ty,label,field,out])])
+                                r[inc][ty][label][field][out] = _read(f['/'.join([inc,ty,label,field,out])],
+                                                                      self._profiler)
 
         if prune:   r = util.dict_prune(r)
         if flatten: r = util.dict_flatten(r)
@@ -1712,13 +2046,14 @@ class Result:
 
         at_cell_ph,in_data_ph,at_cell_ho,in_data_ho = self._mappings()
 
-        with h5py.File(self.fname,'r') as f:
+        with self._record('place',total=True), self._open('r') as f:
 
             for inc in util.show_progress(self._visible['increments']):
                 r[inc] = {'phase':{},'homogenization':{},'geometry':{}}
 
                 for out in _match(output,f['/'.join([inc,'geometry'])].keys()):
-                    r[inc]['geometry'][out] = ma.array(_read(f['/'.join([inc,'geometry',out])]),fill_value = fill_float)
+                    r[inc]['geometry'][out] = ma.array(_read(f['/'.join([inc,'geometry',out])],self._profiler),
+                                                       fill_value = fill_float)
 
                 for ty in ['phase','homogenization']:
                     for label in self._visible[ty+'s']:
@@ -1727,23 +2062,24 @@ class Result:
                                 r[inc][ty][field] = {}
 
                             for out in _match(output,f['/'.join([inc,ty,label,field])].keys()):
-                                data = ma.array(_read(f['/'.join([inc,ty,label,field,out])]))
+                                data = ma.array(_read(f['/'.join([inc,ty,label,field,out])],self._profiler))
 
-                                if ty == 'phase':
-                                    if out+suffixes[0] not in r[inc][ty][field].keys():
-                                        for c,suffix in zip(constituents_,suffixes):
-                                            r[inc][ty][field][out+suffix] = \
-                                                _empty_like(data,self.N_materialpoints,fill_float,fill_int)
+                                with self._record('scatter',data.nbytes):
+                                    if ty == 'phase':
+                                        if out+suffixes[0] not in r[inc][ty][field].keys():
+                                            for c,suffix in zip(constituents_,suffixes):
+                                                r[inc][ty][field][out+suffix] = \
+                                                    _empty_like(data,self.N_materialpoints,fill_float,fill_int)
 
-                                    for c,suffix in zip(constituents_,suffixes):
-                                        r[inc][ty][field][out+suffix][at_cell_ph[c][label]] = data[in_data_ph[c][label]]
+                                        for c,suffix in zip(constituents_,suffixes):
+                                            r[inc][ty][field][out+suffix][at_cell_ph[c][label]] = data[in_data_ph[c][label]]
 
-                                if ty == 'homogenization':
-                                    if out not in r[inc][ty][field].keys():
-                                        r[inc][ty][field][out] = \
-                                            _empty_like(data,self.N_materialpoints,fill_float,fill_int)
+                                    if ty == 'homogenization':
+                                        if out not in r[inc][ty][field].keys():
+                                            r[inc][ty][field][out] = \
+                                                _empty_like(data,self.N_materialpoints,fill_float,fill_int)
 
-                                    r[inc][ty][field][out][at_cell_ho[label]] = data[in_data_ho[label]]
+                                        r[inc][ty][field][out][at_cell_ho[label]] = data[in_data_ho[label]]
 
         if prune:   r = util.dict_prune(r)
         if flatten: r = util.dict_flatten(r)
@@ -1820,7 +2156,7 @@ class Result:
         out_dir   = Path.cwd() if target_dir is None else Path(target_dir)
         hdf5_link = (hdf5_dir if absolute_path else Path(os.path.relpath(hdf5_dir,out_dir.resolve())))/hdf5_name
 
-        with h5py.File(self.fname,'r') as f:
+        with self._record('export_XDMF',total=True), self._open('r') as f:
             for inc in self._visible['increments']:
 
                 grid = ET.SubElement(collection,'Grid')
@@ -1946,15 +2282,16 @@ class Result:
         out_dir = Path.cwd() if target_dir is None else Path(target_dir)
         out_dir.mkdir(parents=True,exist_ok=True)
 
-        with h5py.File(self.fname,'r') as f:
+        with self._record('export_VTK',total=True), self._open('r') as f:
             creator = f.attrs['creator'] if h5py3 else f.attrs['creator'].decode()
             created = f.attrs['created'] if h5py3 else f.attrs['created'].decode()
             v.comments += [f'{creator} ({created})']
 
             for inc in util.show_progress(self._visible['increments']):
 
-                u = _read(f['/'.join([inc,'geometry','u_n' if mode.lower() == 'cell' else 'u_p'])])
-                v = v.set('u',u)
+                u = _read(f['/'.join([inc,'geometry','u_n' if mode.lower() == 'cell' else 'u_p'])],self._profiler)
+                with self._record('VTK build',u.nbytes):
+                    v = v.set('u',u)
 
                 for ty in ['phase','homogenization']:
                     for field in self._visible['fields']:
@@ -1963,29 +2300,32 @@ class Result:
                             if field not in f['/'.join([inc,ty,label])].keys(): continue
 
                             for out in _match(output,f['/'.join([inc,ty,label,field])].keys()):
-                                data = ma.array(_read(f['/'.join([inc,ty,label,field,out])]))
+                                data = ma.array(_read(f['/'.join([inc,ty,label,field,out])],self._profiler))
 
-                                if ty == 'phase':
-                                    if out+suffixes[0] not in outs.keys():
-                                        for c,suffix in zip(constituents_,suffixes):
-                                            outs[out+suffix] = \
-                                                _empty_like(data,self.N_materialpoints,fill_float,fill_int)
+                                with self._record('scatter',data.nbytes):
+                                    if ty == 'phase':
+                                        if out+suffixes[0] not in outs.keys():
+                                            for c,suffix in zip(constituents_,suffixes):
+                                                outs[out+suffix] = \
+                                                    _empty_like(data,self.N_materialpoints,fill_float,fill_int)
 
-                                    for c,suffix in zip(constituents_,suffixes):
-                                        outs[out+suffix][at_cell_ph[c][label]] = data[in_data_ph[c][label]]
+                                        for c,suffix in zip(constituents_,suffixes):
+                                            outs[out+suffix][at_cell_ph[c][label]] = data[in_data_ph[c][label]]
 
-                                if ty == 'homogenization':
-                                    if out not in outs.keys():
-                                        outs[out] = _empty_like(data,self.N_materialpoints,fill_float,fill_int)
+                                    if ty == 'homogenization':
+                                        if out not in outs.keys():
+                                            outs[out] = _empty_like(data,self.N_materialpoints,fill_float,fill_int)
 
-                                    outs[out][at_cell_ho[label]] = data[in_data_ho[label]]
+                                        outs[out][at_cell_ho[label]] = data[in_data_ho[label]]
 
                         for label,dataset in outs.items():
-                            v = v.set(' / '.join(['/'.join([ty,field,label]),dataset.dtype.metadata['unit']]),dataset)
+                            with self._record('VTK build',dataset.nbytes):
+                                v = v.set(' / '.join(['/'.join([ty,field,label]),dataset.dtype.metadata['unit']]),dataset)
 
 
-                v.save(out_dir/f'{self.fname.stem}_inc{inc.split(prefix_inc)[-1].zfill(N_digits)}',
-                       parallel=parallel)
+                with self._record('VTK save'):
+                    v.save(out_dir/f'{self.fname.stem}_inc{inc.split(prefix_inc)[-1].zfill(N_digits)}',
+                           parallel=parallel)
 
     def export_DREAM3D(self,
                        q: str = 'O',
@@ -2153,7 +2493,7 @@ class Result:
                 path_out[label].attrs.update(path_in[label].attrs)
 
 
-        with h5py.File(self.fname,'r') as f_in, h5py.File(fname,'w') as f_out:
+        with self._record('export_DADF5',total=True), self._open('r') as f_in, h5py.File(fname,'w') as f_out:
             f_out.attrs.update(f_in.attrs)
             for g in ['setup','geometry'] + (['cell_to'] if mapping is None else []):
                 f_in.copy(g,f_out)
@@ -0,0 +1,338 @@
+import os
+import re
+import sqlite3
+from pathlib import Path
+from typing import Optional, Union, Iterable, Dict, List, Tuple, Any
+
+import h5py
+import numpy as np
+
+from . import Result
+from . import util
+from ._result import prefix_inc
+
+
+_schema = """
+CREATE TABLE IF NOT EXISTS files (
+    id          INTEGER PRIMARY KEY,
+    path        TEXT UNIQUE NOT NULL,
+    mtime_ns    INTEGER NOT NULL,
+    size        INTEGER NOT NULL,
+    creator     TEXT,
+    created     TEXT
+);
+CREATE TABLE IF NOT EXISTS increments (
+    file        INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    increment   INTEGER NOT NULL,
+    time        REAL NOT NULL,
+    PRIMARY KEY (file, increment)
+);
+CREATE TABLE IF NOT EXISTS datasets (
+    file        INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    increment   INTEGER NOT NULL,
+    type        TEXT NOT NULL,
+    label       TEXT NOT NULL,
+    field       TEXT NOT NULL,
+    name        TEXT NOT NULL,
+    shape       TEXT NOT NULL,
+    dtype       TEXT NOT NULL,
+    unit        TEXT,
+    description TEXT,
+    minimum     REAL,
+    maximum     REAL,
+    mean        REAL
+);
+CREATE INDEX IF NOT EXISTS datasets_by_name ON datasets (name, label);
+CREATE INDEX IF NOT EXISTS datasets_by_file ON datasets (file, increment);
+"""
+
+
+class ResultCatalog:
+    """
+    Catalog of DADF5 (DAMASK HDF5) files.
+
+    The catalog is a SQLite database that stores the increments,
+    simulation times, phases, homogenizations, fields, and datasets
+    (including their shape, unit, and, optionally, statistics) of many
+    DADF5 files. It allows to locate data without opening the files.
+
+    Examples
+    --------
+    Index all DADF5 files in the current directory and find the
+    increments after 10 s for which the phase 'Ferrite' has the
+    dataset 'xi_sl':
+
+    >>> import damask
+    >>> from pathlib import Path
+    >>> c = damask.ResultCatalog('catalog.sqlite')
+    >>> c.update(Path.cwd().glob('*.hdf5'))
+    >>> c.query(phase='Ferrite',dataset='xi_sl',t_min=10.0)
+    {PosixPath('/.../my_file.hdf5'): [12, 13, 14]}
+    >>> r = c.results(phase='Ferrite',dataset='xi_sl',t_min=10.0)
+
+    """
+
+    def __init__(self,
+                 fname: Union[str, Path] = ':memory:'):
+        """
+        New catalog bound to a SQLite database.
+
+        Parameters
+        ----------
+        fname : str or pathlib.Path, optional
+            Name of the database file, will be created if non-existent.
+            Defaults to ':memory:', i.e. a non-persistent database.
+
+        """
+        self.fname = fname if fname == ':memory:' else Path(fname).expanduser().absolute()
+        self._db = sqlite3.connect(self.fname)
+        self._db.execute('PRAGMA foreign_keys = ON')
+        self._db.executescript(_schema)
+
+
+    def __repr__(self) -> str:
+        """
+        Return repr(self).
+
+        Give short, human-readable summary.
+
+        """
+        N_files, = self._db.execute('SELECT COUNT(*) FROM files').fetchone()
+        N_increments, = self._db.execute('SELECT COUNT(*) FROM increments').fetchone()
+        return util.srepr([f'Catalog of {N_files} DADF5 file{"" if N_files == 1 else "s"} '
+                           f'with {N_increments} increment{"" if N_increments == 1 else "s"}',
+                           f'stored in {self.fname}'])
+
+    def __len__(self) -> int:
+        """Number of cataloged files."""
+        return self._db.execute('SELECT COUNT(*) FROM files').fetchone()[0]
+
+
+    def __enter__(self) -> 'ResultCatalog':
+        """Return self for use as context manager."""
+        return self
+
+    def __exit__(self, *args):
+        """Close the database connection when leaving the context."""
+        self.close()
+
+
+    def close(self):
+        """Close the database connection."""
+        self._db.close()
+
+
+    @property
+    def files(self) -> List[Path]:
+        """Cataloged files."""
+        return [Path(p) for p, in self._db.execute('SELECT path FROM files ORDER BY path')]
+
+
+    def update(self,
+               fnames: Union[str, Path, Iterable[Union[str, Path]]],
+               statistics: bool = False) -> int:
+        """
+        Add files to the catalog or update them if modified.
+
+        Files that are already cataloged are only re-indexed if their
+        size or modification time changed.
+
+        Parameters
+        ----------
+        fnames : (iterable of) str or pathlib.Path
+            DADF5 files to catalog.
+        statistics : bool, optional
+            Store minimum, maximum, and mean value of numeric datasets.
+            Requires to read all data. Defaults to False.
+
+        Returns
+        -------
+        N_indexed : int
+            Number of (re-)indexed files.
+
+        """
+        fnames_ = [fnames] if isinstance(fnames,(str,Path)) else fnames
+        N_indexed = 0
+        with self._db:
+            for fname in fnames_:
+                path = Path(fname).expanduser().absolute()
+                stat = path.stat()
+                known = self._db.execute('SELECT id,mtime_ns,size FROM files WHERE path = ?',
+                                         (str(path),)).fetchone()
+                if known is not None:
+                    if known[1:] == (stat.st_mtime_ns,stat.st_size): continue
+                    self._db.execute('DELETE FROM files WHERE id = ?',(known[0],))
+                self._index(path,stat,statistics)
+                N_indexed += 1
+        return N_indexed
+
+
+    def prune(self) -> int:
+        """
+        Remove files that do not exist anymore from the catalog.
+
+        Returns
+        -------
+        N_removed : int
+            Number of removed files.
+
+        """
+        missing = [(str(p),) for p in self.files if not p.exists()]
+        with self._db:
+            self._db.executemany('DELETE FROM files WHERE path = ?',missing)
+        return len(missing)
+
+
+    def _index(self,
+               path: Path,
+               stat: os.stat_result,
+               statistics: bool):
+        """Store the content of a DADF5 file."""
+        def attr(dataset,key):
+            v = dataset.attrs.get(key)
+            return v.decode() if isinstance(v,bytes) else v
+
+        with h5py.File(path,'r') as f:
+            cur = self._db.execute('INSERT INTO files (path,mtime_ns,size,creator,created) VALUES (?,?,?,?,?)',
+                                   (str(path),stat.st_mtime_ns,stat.st_size,attr(f,'creator'),attr(f,'created')))
+            file_id = cur.lastrowid
+            r = re.compile(rf'{prefix_inc}([0-9]+)')
+            for inc in [i for i in f.keys() if r.match(i)]:
+                i = int(inc.split('_')[1])
+                self._db.execute('INSERT INTO increments VALUES (?,?,?)',
+                                 (file_id,i,float(np.around(f[inc].attrs['t/s'],12))))
+                rows = []
+                for ty in ['phase','homogenization']:
+                    for label in f[inc].get(ty,{}):
+                        for field in f['/'.join([inc,ty,label])]:
+                            for name,d in f['/'.join([inc,ty,label,field])].items():
+                                if not isinstance(d,h5py.Dataset): continue
+                                stats: Tuple[Optional[float], Optional[float], Optional[float]] = (None,)*3
+                                if statistics and d.dtype.kind in 'biuf' and d.size > 0:
+                                    data = d[()]
+                                    stats = (float(np.min(data)),float(np.max(data)),float(np.mean(data)))
+                                rows.append((file_id,i,ty,label,field,name,str(d.shape[1:]),str(d.dtype),
+                                             attr(d,'unit'),attr(d,'description'))+stats)
+                self._db.executemany('INSERT INTO datasets VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?)',rows)
+
+
+    def query(self,*,
+              phase: Optional[str] = None,
+              homogenization: Optional[str] = None,
+              field: Optional[str] = None,
+              dataset: Optional[str] = None,
+              t_min: Optional[float] = None,
+              t_max: Optional[float] = None) -> Dict[Path, List[int]]:
+        """
+        Find increments that contain matching data.
+
+        Wildcard matching with '?' and '*' is supported for names.
+        If phase and homogenization are given, both need to have
+        matching data. If no phase, homogenization, field, or dataset
+        is given, all increments within the time range match.
+
+        Parameters
+        ----------
+        phase : str, optional
+            Name of the phase.
+        homogenization : str, optional
+            Name of the homogenization.
+        field : str, optional
+            Name of the field, e.g. 'mechanical'.
+        dataset : str, optional
+            Name of the dataset, e.g. 'F'.
+        t_min : float, optional
+            Minimum simulation time.
+        t_max : float, optional
+            Maximum simulation time.
+
+        Returns
+        -------
+        matches : dict
+            Increments per file.
+
+        """
+        conditions: List[str] = []
+        values: List[Any] = []
+        groups = [(ty,label) for ty,label in [('phase',phase),('homogenization',homogenization)] if label is not None]
+        for ty,label in groups if groups else ([(None,None)] if field is not None or dataset is not None else []):
+            criteria = [(c,v) for c,v in [('type',ty),('label',label),('field',field),('name',dataset)] if v is not None]
+            conditions.append('EXISTS (SELECT 1 FROM datasets d WHERE d.file = f.id AND d.increment = i.increment'
+                              + ''.join(f' AND d.{c} GLOB ?' for c,_ in criteria) + ')')
+            values += [v for _,v in criteria]
+        if t_min is not None:
+            conditions.append('i.time >= ?')
+            values.append(t_min)
+        if t_max is not None:
+            conditions.append('i.time <= ?')
+            values.append(t_max)
+
+        matches: Dict[Path, List[int]] = {}
+        for path,increment in self._db.execute('SELECT f.path, i.increment FROM files f '
+                                               'JOIN increments i ON i.file = f.id '
+                                               + (('WHERE ' + ' AND '.join(conditions)) if conditions else '')
+                                               + ' ORDER BY f.path, i.increment',values):
+            matches.setdefault(Path(path),[]).append(increment)
+        return matches
+
+
+    def results(self,*,
+                phase: Optional[str] = None,
+                homogenization: Optional[str] = None,
+                field: Optional[str] = None,
+                dataset: Optional[str] = None,
+                t_min: Optional[float] = None,
+                t_max: Optional[float] = None) -> List[Result]:
+        """
+        Open views on the files that contain matching data.
+
+        Parameters are the same as for `query`.
+
+        Returns
+        -------
+        results : list of damask.Result
+            Views showing the matching increments,
+            phase/homogenization, and field.
+
+        """
+        views = []
+        for fname,increments in self.query(phase=phase,homogenization=homogenization,field=field,
+                                           dataset=dataset,t_min=t_min,t_max=t_max).items():
+            views.append(Result(fname).view(increments=increments,
+                                             phases=phase if phase is not None or homogenization is None else False,
+                                             homogenizations=homogenization if homogenization is not None or phase is None
+                                                             else False,
+                                             fields=field))
+        return views
+
+
+    def statistics(self,
+                   dataset: str,
+                   fname: Union[None, str, Path] = None) -> List[Dict]:
+        """
+        Stored information about a dataset.
+
+        Parameters
+        ----------
+        dataset : str
+            Name of the dataset. Wildcard matching is supported.
+        fname : str or pathlib.Path, optional
+            Restrict to a single file.
+
+        Returns
+        -------
+        info : list of dict
+            Location, shape, data type, unit, description,
+            and statistics (if stored) of matching datasets.
+
+        """
+        keys = ['path','increment','time','type','label','field','name','shape','dtype',
+                'unit','description','minimum','maximum','mean']
+        rows = self._db.execute('SELECT f.path, d.increment, i.time, d.type, d.label, d.field, d.name, '
+                                'd.shape, d.dtype, d.unit, d.description, d.minimum, d.maximum, d.mean '
+                                'FROM datasets d JOIN files f ON d.file = f.id '
+                                'JOIN increments i ON i.file = d.file AND i.increment = d.increment '
+                                'WHERE d.name GLOB ?' + ('' if fname is None else ' AND f.path = ?')
+                                + ' ORDER BY f.path, d.increment',
+                                (dataset,) if fname is None else (dataset,str(Path(fname).expanduser().absolute())))
+        return [dict(zip(keys,row)) for row in rows]
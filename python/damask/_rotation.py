@@ -2,7 +2,7 @@ import sys
 import copy
 import re
 import builtins
-from typing import Optional, Union, Sequence, Tuple, Literal, List, TypeVar
+from typing import Optional, Union, Sequence, Tuple, Literal, List, TypeVar, Callable, Dict, Any
 
 import numpy as np
 
@@ -10,10 +10,13 @@ from ._typehints import FloatSequence, IntSequence, NumpyRngSeed
 from . import tensor
 from . import util
 from . import grid_filters
+from ._numba import nb, numba_njit_wrapper
 
 
 _P = -1
 
+_cache_limit = 2**28                                                                                # bytes of cached representations per Rotation
+
 # parameters for conversion from/to cubochoric
 _sc   = np.pi**(1./6.)/6.**(1./6.)
 _beta = np.pi**(5./6.)/6.**(1./6.)/2.
@@ -21,6 +24,89 @@ _R1   = (3.*np.pi/4.)**(1./3.)
 
 MyType = TypeVar('MyType', bound='Rotation')
 
+
+def _float_array(a: Union[FloatSequence, Sequence[FloatSequence]]) -> np.ndarray:
+    """Copy to floating point array, keep single precision."""
+    return np.array(a,dtype=np.float32 if np.asarray(a).dtype == np.float32 else float)
+
+def _rotate_Mandel(R: np.ndarray,
+                   T: np.ndarray) -> np.ndarray:
+    """
+    Rotate fourth-order tensors with minor symmetries in Mandel notation.
+
+    Parameters
+    ----------
+    R : numpy.ndarray, shape (...,3,3)
+        Rotation matrices.
+    T : numpy.ndarray, shape (...,3,3,3,3)
+        Fourth-order tensors with minor symmetries. Needs to be broadcastable to R.
+
+    Returns
+    -------
+    T' : numpy.ndarray, shape (...,3,3,3,3)
+        Rotated tensors.
+
+    """
+    i,j = np.array([0,1,2,1,0,0]),np.array([0,1,2,2,2,1])
+    w = np.array([1.,1.,1.,np.sqrt(2.),np.sqrt(2.),np.sqrt(2.)])
+    I,J = (slice(None),np.newaxis),(np.newaxis,slice(None))
+    K = (R[...,i[I],i[J]]*R[...,j[I],j[J]] + R[...,i[I],j[J]]*R[...,j[I],i[J]]) \
+      * (w[I]/w[J]*np.where(i==j,.5,1.)[J]).astype(R.dtype)                                         # 6x6 rotation operator
+
+    T_6 = T[...,i[I],j[I],i[J],j[J]]*np.outer(w,w).astype(T.dtype)
+    T_6 = K@T_6@np.swapaxes(K,-1,-2)
+    m = np.array([[0,5,4],[5,1,3],[4,3,2]])
+    return (T_6/np.outer(w,w).astype(T_6.dtype))[...,m[:,:,np.newaxis,np.newaxis],m[np.newaxis,np.newaxis,:,:]]
+
+def _compose(q_a: np.ndarray,
+             q_b: np.ndarray,
+             out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Compose quaternions (first b then a) and standardize the result.
+
+    Parameters
+    ----------
+    q_a : numpy.ndarray, shape (...,4)
+        Quaternion of second rotation.
+    q_b : numpy.ndarray, shape (...,4)
+        Quaternion of first rotation. Needs to be broadcastable to q_a.
+    out : numpy.ndarray, shape (...,4), optional
+        Array for the result, can be q_a or q_b.
+
+    Returns
+    -------
+    q : numpy.ndarray, shape (...,4)
+        Quaternion of compound rotation.
+
+    """
+    shape = np.broadcast_shapes(q_a.shape,q_b.shape)
+    out_ = np.empty(shape,np.result_type(q_a,q_b)) if out is None else out
+
+    if nb and q_a.shape == q_b.shape == out_.shape \
+          and q_a.flags.c_contiguous and q_b.flags.c_contiguous and out_.flags.c_contiguous:
+        _nb_compose(q_a.reshape(-1,4),q_b.reshape(-1,4),out_.reshape(-1,4))
+    else:
+        aliased = np.shares_memory(out_,q_a) or np.shares_memory(out_,q_b)
+        q = np.empty_like(out_) if aliased else out_
+        t,u = np.empty(shape[:-1],out_.dtype),np.empty(shape[:-1],out_.dtype)
+        for i,(j,k) in enumerate([(2,3),(3,1),(1,2)],1):
+            np.multiply(q_a[...,j],q_b[...,k],out=t)
+            t -= np.multiply(q_a[...,k],q_b[...,j],out=u)
+            t *= _P
+            t += np.multiply(q_a[...,0],q_b[...,i],out=u)
+            np.add(t,np.multiply(q_b[...,0],q_a[...,i],out=u),out=q[...,i])
+        np.multiply(q_a[...,0],q_b[...,0],out=t)
+        for i in range(1,4):
+            t -= np.multiply(q_a[...,i],q_b[...,i],out=u)
+        q[...,0] = t
+        np.negative(q,out=q,where=q[...,0:1] < 0.)
+        if aliased: out_[...] = q
+
+    if out_.dtype == np.float32:
+        out_ /= np.linalg.norm(out_,axis=-1,keepdims=True)
+    return out_
+
+
 class Rotation:
     u"""
     Rotation with functionality for conversion between different representations.
@@ -34,6 +120,17 @@ class Rotation:
       the coordinate frame.
     - P = -1 (as default).
 
+    Quaternions are stored in double precision unless they are given
+    in single precision (numpy.float32). Single precision halves the
+    memory footprint and is retained by composition, rotation of
+    single-precision vectors and tensors, and conversions. The
+    accuracy of single-precision rotations is about 1e-7, angles
+    close to zero are resolved with an accuracy of about 5e-4 rad.
+
+    Representations other than quaternions are cached (up to 256 MiB
+    per Rotation) such that repeated conversions are cheap. The cache
+    is discarded if the quaternions have been modified.
+
     Examples
     --------
     Rotate vector 'a' (defined in coordinate system 'A') to
@@ -64,7 +161,7 @@ class Rotation:
 
     """
 
-    __slots__ = ['quaternion']
+    __slots__ = ['quaternion','_cache']
 
     def __init__(self,
                  rotation: Union[FloatSequence, 'Rotation'] = np.array([1.,0.,0.,0.])):
@@ -76,14 +173,15 @@ class Rotation:
         rotation : list, numpy.ndarray, or Rotation, optional
             Unit quaternion in positive real hemisphere.
             Use .from_quaternion to perform a sanity check.
+            Single precision (numpy.float32) is retained.
             Defaults to no rotation.
 
         """
         self.quaternion: np.ndarray
         if isinstance(rotation,Rotation):
             self.quaternion = rotation.quaternion.copy()
-        elif np.array(rotation).shape[-1] == 4:
-            self.quaternion = np.array(rotation,dtype=float)
+        elif np.shape(rotation)[-1] == 4:
+            self.quaternion = _float_array(rotation)
         else:
             raise TypeError('"rotation" is neither a Rotation nor a quaternion')
 
@@ -118,14 +216,53 @@ class Rotation:
         Create deep copy.
 
         """
-        dup = copy.deepcopy(self)
-        if rotation is not None:
-            dup.quaternion = Rotation(rotation).quaternion
-        return dup
+        return self._adopt(self.quaternion.copy() if rotation is None else Rotation(rotation).quaternion)
 
     copy = __copy__
 
 
+    def _adopt(self: MyType,
+               quaternion: np.ndarray) -> MyType:
+        """Create deep copy that uses the given quaternion array (without copying it)."""
+        memo: Dict[int, Any] = {id(self.quaternion):quaternion}
+        if (cache := getattr(self,'_cache',None)) is not None: memo[id(cache)] = None
+        return copy.deepcopy(self,memo)
+
+
+    def _cached(self,
+                representation: str,
+                conversion: Callable[[np.ndarray], np.ndarray]) -> np.ndarray:
+        """
+        Convert quaternions, reuse earlier conversion if quaternions are unchanged.
+
+        Parameters
+        ----------
+        representation : str
+            Name of the representation.
+        conversion : callable
+            Conversion function taking the quaternions.
+
+        Returns
+        -------
+        x : numpy.ndarray
+            Representation, not shared with the cache.
+
+        """
+        cache = getattr(self,'_cache',None)
+        if cache is not None and not np.array_equal(cache['quaternion'],self.quaternion):           # changed in-place, e.g. via view
+            cache = self._cache = None
+        if cache is not None and representation in cache:
+            return cache[representation].copy()
+
+        x = conversion(self.quaternion).astype(self.dtype,copy=False)
+        if x.nbytes + sum(c.nbytes for c in (cache or {'quaternion':self.quaternion}).values()) > _cache_limit:
+            return x
+        if cache is None:
+            cache = self._cache = {'quaternion':self.quaternion.copy()}
+        cache[representation] = x
+        return x.copy()
+
+
     def __getitem__(self: MyType,
                     item: Union[Tuple[Union[None, int, slice, "builtins.ellipsis"], ...],
                                 int, bool, np.bool_, np.ndarray]) -> MyType:
@@ -244,6 +381,10 @@ class Rotation:
     def shape(self) -> Tuple[int, ...]:
         return self.quaternion[...,0].shape
 
+    @property
+    def dtype(self) -> np.dtype:
+        return self.quaternion.dtype
+
 
     def __len__(self) -> int:
         """
@@ -324,15 +465,7 @@ class Rotation:
             s_m   = util.shapeshifter( self.shape,blend,mode='right')
             s_o   = util.shapeshifter(other.shape,blend,mode='left')
 
-            q_m = self.broadcast_to(s_m).quaternion[...,0:1]
-            p_m = self.broadcast_to(s_m).quaternion[...,1:]
-            q_o = other.broadcast_to(s_o).quaternion[...,0:1]
-            p_o = other.broadcast_to(s_o).quaternion[...,1:]
-
-            qmo = q_m*q_o
-            q = (qmo - np.einsum('...i,...i',p_m,p_o).reshape(qmo.shape))
-            p = q_m*p_o + q_o*p_m + _P * np.cross(p_m,p_o)
-            return self.copy(Rotation(np.block([q,p]))._standardize())
+            return self._adopt(_compose(self.quaternion.reshape(s_m+(4,)),other.quaternion.reshape(s_o+(4,))))
         else:
             raise TypeError('use "R@b", i.e. matmul, to apply rotation "R" to object "b"')
 
@@ -349,7 +482,21 @@ class Rotation:
             Rotation for composition.
             Compatible innermost dimensions will blend.
 
-        """
+        Notes
+        -----
+        The composition is computed in-place, i.e. without allocating
+        a new array, if the shape and data type of self do not change
+        and self is writeable.
+        Otherwise, a new Rotation is returned.
+
+        """
+        if isinstance(other,Rotation) and self.quaternion.flags.writeable \
+           and util.shapeblender(self.shape,other.shape) == self.shape \
+           and np.result_type(self.quaternion,other.quaternion) == self.quaternion.dtype:
+            _compose(self.quaternion,
+                     other.quaternion.reshape(util.shapeshifter(other.shape,self.shape,mode='left')+(4,)),
+                     out=self.quaternion)
+            return self
         return self*other
 
 
@@ -389,7 +536,14 @@ class Rotation:
         other : Rotation, shape (self.shape)
             Rotation to invert for composition.
 
+        Notes
+        -----
+        See `__imul__` for conditions of in-place computation.
+
         """
+        if isinstance(other,Rotation):
+            self *= ~other
+            return self
         return self/other
 
 
@@ -415,6 +569,11 @@ class Rotation:
         rotated : numpy.ndarray, shape (...,3), (...,3,3), or (...,3,3,3,3)
             Rotated vector or tensor, i.e. transformed to frame defined by rotation.
 
+        Notes
+        -----
+        Fourth-order tensors with minor symmetries, e.g. stiffness tensors,
+        are rotated in Mandel notation, i.e. as 6x6 matrices.
+
         Examples
         --------
         Application of twelve (random) rotations to a set of five vectors.
@@ -468,8 +627,8 @@ class Rotation:
             for l in [4,2,1]:
                 if obs[-l:] == l*(3,):
                     bs = util.shapeblender(self.shape,other.shape[:-l],False)
-                    self_ = self.broadcast_to(bs) if self.shape != bs else self
                     if l==1:
+                        self_ = self.broadcast_to(bs) if self.shape != bs else self
                         q_m = self_.quaternion[...,0]
                         p_m = self_.quaternion[...,1:]
                         A = q_m**2 - np.einsum('...i,...i',p_m,p_m)
@@ -481,9 +640,13 @@ class Rotation:
                                               - p_m[...,(i+2)%3]*other[...,(i+1)%3]))
                                         for i in [0,1,2]]).reshape(bs+(3,),order='F')
                     else:
+                        R = Rotation._qu2om(self.quaternion.reshape(util.shapeshifter(self.shape,bs,mode='right')+(4,)))
+                        if l==4 and np.array_equal(other,np.swapaxes(other,-4,-3)) \
+                                and np.array_equal(other,np.swapaxes(other,-2,-1)):
+                            return _rotate_Mandel(R,other)
                         return np.einsum({2: '...im,...jn,...mn',
                                           4: '...im,...jn,...ko,...lp,...mnop'}[l],
-                                         *l*[self_.as_matrix()],
+                                         *l*[R],
                                          other)
             raise ValueError('can only rotate vectors, second-order tensors, and fourth-order tensors')
         elif isinstance(other, Rotation):
@@ -491,15 +654,90 @@ class Rotation:
         else:
             raise TypeError(f'cannot rotate "{type(other)}"')
 
-    apply = __matmul__
+    def apply(self,
+              other: np.ndarray,
+              unique: bool = False) -> np.ndarray:
+        """
+        Rotate vector, second-order tensor, or fourth-order tensor.
+
+        Parameters
+        ----------
+        other : numpy.ndarray, shape (...,3), (...,3,3), or (...,3,3,3,3)
+            Vector or tensor on which to apply the rotation.
+        unique : bool, optional
+            Rotate only once per unique rotation and reuse the result for
+            repeated rotations, e.g. for a field of grain-wise orientations.
+            Requires a single vector or tensor. Defaults to False.
+
+        Returns
+        -------
+        rotated : numpy.ndarray, shape (...,3), (...,3,3), or (...,3,3,3,3)
+            Rotated vector or tensor, i.e. transformed to frame defined by rotation.
+
+        See Also
+        --------
+        __matmul__ : Shape handling.
+
+        Examples
+        --------
+        Rotate the stiffness tensor of a cubic crystal to
+        the orientations of ten grains in 4096 cells.
+
+        >>> import numpy as np
+        >>> import damask
+        >>> C = np.zeros((3,3,3,3))
+        >>> C[0,0,0,0] = C[1,1,1,1] = C[2,2,2,2] = 106.75e9
+        >>> C[0,0,1,1] = C[1,1,2,2] = C[2,2,0,0] = C[1,1,0,0] = C[2,2,1,1] = C[0,0,2,2] = 60.41e9
+        >>> C[0,1,0,1] = C[1,0,1,0] = C[0,1,1,0] = C[1,0,0,1] = 28.34e9
+        >>> C[1,2,1,2] = C[2,1,2,1] = C[1,2,2,1] = C[2,1,1,2] = 28.34e9
+        >>> C[2,0,2,0] = C[0,2,0,2] = C[2,0,0,2] = C[0,2,2,0] = 28.34e9
+        >>> O = damask.Rotation.from_random(10)[np.random.randint(10,size=4096)]
+        >>> O.apply(C,unique=True).shape
+        (4096, 3, 3, 3, 3)
+
+        """
+        if not unique:
+            return self@other
+        if not isinstance(other, np.ndarray) or other.shape not in [(3,),(3,3),(3,3,3,3)]:
+            raise ValueError('can only rotate single vector, second-order tensor, or fourth-order tensor')
+        q,idx = np.unique(self.quaternion.reshape(-1,4),axis=0,return_inverse=True)
+        return (Rotation(q)@other)[idx.reshape(self.shape)]
 
 
     def _standardize(self: MyType) -> MyType:
-        """Standardize quaternion (ensure positive real hemisphere)."""
+        """
+        Standardize quaternion (ensure positive real hemisphere).
+
+        Single-precision quaternions are also normalized to
+        prevent the accumulation of round-off errors.
+        """
         self.quaternion[self.quaternion[...,0] < 0.] *= -1.
+        if self.quaternion.dtype == np.float32:
+            self.quaternion /= np.linalg.norm(self.quaternion,axis=-1,keepdims=True)
         return self
 
 
+    def astype(self: MyType,
+               dtype: Union[str, type, np.dtype]) -> MyType:
+        """
+        Change floating point precision.
+
+        Parameters
+        ----------
+        dtype : {numpy.float32, numpy.float64}
+            Data type of the quaternion.
+
+        Returns
+        -------
+        converted : damask.Rotation
+            Rotation with given precision.
+
+        """
+        if np.dtype(dtype) not in (np.float32,np.float64):
+            raise ValueError(f'invalid data type: {dtype}')
+        return self.copy(self.quaternion.astype(dtype))
+
+
     def append(self: MyType,
                other: Union[MyType, List[MyType]]) -> MyType:
         """
@@ -611,22 +849,52 @@ class Rotation:
         https://doi.org/10.2514/1.28949
 
         """
-        def _M(quat):
-            """Intermediate representation supporting quaternion averaging."""
-            return np.einsum('...i,...j',quat,quat)
+        from . import RotationAverager
 
-        weights_ = np.ones(self.shape,dtype=float) if weights is None else np.array(weights,float)
+        avg = RotationAverager(self.shape[:-1])
+        avg.update(Rotation(np.moveaxis(self.quaternion,-2,0)),
+                   None if weights is None else np.moveaxis(np.broadcast_to(weights,self.shape),-1,0))
+        return self.copy(avg.result().astype(self.dtype))
 
-        eig, vec = np.linalg.eig(np.sum(_M(self.quaternion) * weights_[...,np.newaxis,np.newaxis],axis=-3)
-                                /np.sum(                      weights_[...,np.newaxis,np.newaxis],axis=-3))
 
-        return self.copy(Rotation.from_quaternion(np.real(
-                                                  np.squeeze(
-                                                  np.take_along_axis(vec,
-                                                                     eig.argmax(axis=-1)[...,np.newaxis,np.newaxis],
-                                                                     axis=-1),
-                                                  axis=-1)),
-                                                  accept_homomorph = True))
+    def average_by(self: MyType,
+                   labels: np.ndarray,
+                   weights: Optional[FloatSequence] = None) -> MyType:
+        """
+        Average per label.
+
+        Parameters
+        ----------
+        labels : numpy.ndarray, shape (self.shape)
+            Label of each rotation, e.g. grain ID.
+        weights : numpy.ndarray, shape (self.shape), optional
+            Relative weight of each rotation.
+
+        Returns
+        -------
+        average : damask.Rotation, shape (N_labels)
+            Weighted average for each label, sorted by label.
+
+        Examples
+        --------
+        Average orientations per grain.
+
+        >>> import numpy as np
+        >>> import damask
+        >>> g = damask.GeomGrid.load('my_geom.vti')
+        >>> O = damask.Rotation.from_random(g.cells)
+        >>> avg = O.average_by(g.material)
+        >>> grains = np.unique(g.material)
+
+        """
+        if np.shape(labels) != self.shape: raise ValueError(f'shape mismatch: {np.shape(labels)} and {self.shape}')
+
+        from . import RotationAverager
+
+        unique, idx = np.unique(labels,return_inverse=True)
+        avg = RotationAverager(len(unique))
+        avg.update(self,weights,idx.reshape(self.shape))
+        return self.copy(avg.result().astype(self.dtype))
 
 
     def misorientation(self: MyType,
@@ -665,11 +933,146 @@ class Rotation:
         omega : np.ndarray
             Misorientation angle.
 
+        Notes
+        -----
+        For single precision, small angles (ω < 1e-2) are only
+        resolved with an accuracy of about 5e-4 rad.
+
         """
         trace_max = np.abs((self*~other).quaternion[...,0])
         return 2.*np.arccos(np.clip(np.round(trace_max,15),None,1.))
 
 
+    ################################################################################################
+    # operations on quaternion arrays that do not fit into memory
+
+    @staticmethod
+    def map_chunked(q,
+                    function: Callable,
+                    *args,
+                    out = None,
+                    chunk_size: int = 2**16,
+                    accept_homomorph: bool = False,
+                    normalize: bool = False,
+                    P: Literal[1, -1] = -1):
+        """
+        Apply function to quaternion array in chunks along first dimension.
+
+        Parameters
+        ----------
+        q : array_like, shape (N,...,4)
+            Unit quaternions, e.g. numpy.memmap or h5py.Dataset.
+        function : callable
+            Function mapping a damask.Rotation of shape (n,...) and the corresponding
+            chunks of 'args' to a numpy.ndarray or damask.Rotation of shape (n,...).
+        *args : array_like or damask.Rotation of shape (N,...)
+            Additional arguments to 'function', chunked like 'q'.
+            Constant arguments can be bound to 'function' instead.
+        out : array_like, optional
+            Container for the result, e.g. numpy.memmap or h5py.Dataset.
+            Defaults to a newly allocated numpy.ndarray.
+        chunk_size : int, optional
+            Approximate number of rotations per chunk. Defaults to 65536.
+        accept_homomorph : bool, optional
+            Allow homomorphic variants, i.e. q_0 < 0 (negative real hemisphere).
+            Defaults to False.
+        normalize: bool, optional
+            Allow ǀqǀ ≠ 1. Defaults to False.
+        P : int ∈ {-1,1}, optional
+            Sign convention. Defaults to -1.
+
+        Returns
+        -------
+        out : array_like, shape (N,...)
+            Result of 'function'. Rotations are stored as quaternions.
+
+        Examples
+        --------
+        Write Bunge Euler angles of the orientations stored in a
+        DADF5 file into a file-backed array.
+
+        >>> import h5py
+        >>> import numpy as np
+        >>> import damask
+        >>> with h5py.File('my_file.hdf5','r') as f:
+        ...     O = f['increment_0/phase/alpha/mechanical/O']
+        ...     phi = np.lib.format.open_memmap('phi.npy',mode='w+',shape=O.shape[:1]+(3,))
+        ...     damask.Rotation.map_chunked(O,lambda r: r.as_Euler_angles(),out=phi)
+
+        Calculate misorientation angles between two increments.
+
+        >>> with h5py.File('my_file.hdf5','r') as f:
+        ...     O_0 = f['increment_0/phase/alpha/mechanical/O']
+        ...     O_1 = f['increment_10/phase/alpha/mechanical/O']
+        ...     omega = damask.Rotation.map_chunked(O_0,
+        ...                                         lambda r,o: r.misorientation_angle(damask.Rotation(o)),
+        ...                                         O_1)
+
+        """
+        if np.shape(q)[-1:] != (4,): raise ValueError(f'invalid shape: {np.shape(q)}')
+        if any(len(a) != len(q) for a in args): raise ValueError('mismatch of first dimension')
+
+        N = max(1,chunk_size//max(1,int(np.prod(np.shape(q)[1:-1]))))
+        for s in range(0,len(q),N):
+            r = function(Rotation.from_quaternion(q[s:s+N],accept_homomorph,normalize,P),
+                         *[a[s:s+N] for a in args])
+            r = r.quaternion if isinstance(r,Rotation) else np.asarray(r)
+            if out is None:
+                out = np.empty((len(q),)+r.shape[1:],dtype=r.dtype)
+            elif out.shape != (len(q),)+r.shape[1:]:
+                raise ValueError(f'invalid shape of out: {out.shape}')
+            out[s:s+N] = r
+        return out
+
+    @staticmethod
+    def average_chunked(q,
+                        weights = None,
+                        chunk_size: int = 2**16,
+                        accept_homomorph: bool = False,
+                        normalize: bool = False,
+                        P: Literal[1, -1] = -1) -> 'Rotation':
+        """
+        Average quaternion array in chunks along first dimension.
+
+        Parameters
+        ----------
+        q : array_like, shape (N,...,4)
+            Unit quaternions, e.g. numpy.memmap or h5py.Dataset.
+        weights : array_like, shape (N,...), optional
+            Relative weight of each rotation.
+        chunk_size : int, optional
+            Approximate number of rotations per chunk. Defaults to 65536.
+        accept_homomorph : bool, optional
+            Allow homomorphic variants, i.e. q_0 < 0 (negative real hemisphere).
+            Defaults to False.
+        normalize: bool, optional
+            Allow ǀqǀ ≠ 1. Defaults to False.
+        P : int ∈ {-1,1}, optional
+            Sign convention. Defaults to -1.
+
+        Returns
+        -------
+        average : damask.Rotation, shape (...)
+            Weighted average along first dimension.
+
+        See Also
+        --------
+        average : Average along last dimension of Rotation.
+        damask.RotationAverager : Accumulate rotations for averaging.
+
+        """
+        if np.shape(q)[-1:] != (4,): raise ValueError(f'invalid shape: {np.shape(q)}')
+
+        from . import RotationAverager
+
+        avg = RotationAverager(np.shape(q)[1:-1])
+        N = max(1,chunk_size//max(1,int(np.prod(np.shape(q)[1:-1]))))
+        for s in range(0,len(q),N):
+            avg.update(Rotation.from_quaternion(q[s:s+N],accept_homomorph,normalize,P),
+                       None if weights is None else weights[s:s+N])
+        return avg.result().astype(np.float32 if getattr(q,'dtype',None) == np.float32 else float)
+
+
     ################################################################################################
     # convert to different orientation representations (numpy arrays)
 
@@ -714,8 +1117,8 @@ class Rotation:
         array([0., 0., 0.])
 
         """
-        eu = Rotation._qu2eu(self.quaternion)
-        return np.degrees(eu) if degrees else eu
+        eu = self._cached('Euler_angles',Rotation._qu2eu)
+        return np.degrees(eu,out=eu) if degrees else eu
 
     def as_axis_angle(self,
                       degrees: bool = False,
@@ -745,7 +1148,7 @@ class Rotation:
         (array([0., 0., 1.]), array(0.))
 
         """
-        ax: np.ndarray = Rotation._qu2ax(self.quaternion)
+        ax = self._cached('axis_angle',Rotation._qu2ax)
         if degrees: ax[...,3] = np.degrees(ax[...,3])
         return (ax[...,:3],ax[...,3]) if pair else ax
 
@@ -769,7 +1172,8 @@ class Rotation:
                [0., 0., 1.]])
 
         """
-        return Rotation._qu2om(self.quaternion)
+        return Rotation._qu2om(self.quaternion).astype(self.dtype,copy=False) if nb else \
+               self._cached('matrix',Rotation._qu2om)                                               # compiled conversion is faster than cache
 
     def as_Rodrigues_vector(self,
                             compact: bool = False) -> np.ndarray:
@@ -797,7 +1201,7 @@ class Rotation:
         array([ 0.,  0., 0.])
 
         """
-        ro = Rotation._qu2ro(self.quaternion)
+        ro = self._cached('Rodrigues_vector',Rotation._qu2ro)
         if compact:
             with np.errstate(invalid='ignore'):
                 return ro[...,:3]*ro[...,3:4]
@@ -822,7 +1226,7 @@ class Rotation:
         array([0., 0., 0.])
 
         """
-        return Rotation._qu2ho(self.quaternion)
+        return self._cached('homochoric',Rotation._qu2ho)
 
     def as_cubochoric(self) -> np.ndarray:
         """
@@ -842,7 +1246,7 @@ class Rotation:
         array([0., 0., 0.])
 
         """
-        return Rotation._qu2cu(self.quaternion)
+        return self._cached('cubochoric',Rotation._qu2cu)
 
     ################################################################################################
     # Static constructors. The input data needs to follow the conventions, options allow to
@@ -880,7 +1284,7 @@ class Rotation:
          [0. 1. 0. 0.]]
 
         """
-        qu = np.array(q,dtype=float)
+        qu = _float_array(q)
         if qu.shape[:-2:-1] != (4,): raise ValueError(f'invalid shape: {qu.shape}')
         if abs(P) != 1: raise ValueError('P ∉ {-1,1}')
 
@@ -893,7 +1297,7 @@ class Rotation:
                 raise ValueError(f'quaternion with negative first (real) component\n{qu}')
         if normalize:
             qu /= np.linalg.norm(qu,axis=-1,keepdims=True)
-        elif not np.allclose(np.linalg.norm(qu,axis=-1),1.,rtol=1.e-8):
+        elif not np.allclose(np.linalg.norm(qu,axis=-1),1.,rtol=1.e-8 if qu.dtype == np.float64 else 1.e-6):
             with np.printoptions(threshold=sys.maxsize,precision=16,floatmode='fixed'):
                 raise ValueError(f'quaternion is not of unit length\n{qu}')
 
@@ -928,7 +1332,7 @@ class Rotation:
         Quaternion [0. 0. 0. 1.]
 
         """
-        eu = np.array(phi,dtype=float)
+        eu = _float_array(phi)
         if eu.shape[:-2:-1] != (3,): raise ValueError(f'invalid shape: {eu.shape}')
 
         eu = np.radians(eu) if degrees else eu
@@ -936,7 +1340,7 @@ class Rotation:
             with np.printoptions(threshold=sys.maxsize,precision=16,floatmode='fixed'):
                 raise ValueError(f'Euler angles outside of [0..2π],[0..π],[0..2π]\n{eu}')
 
-        return Rotation(Rotation._eu2qu(eu))
+        return Rotation(Rotation._eu2qu(eu).astype(eu.dtype,copy=False))
 
     @staticmethod
     def from_axis_angle(n_omega: np.ndarray,
@@ -971,7 +1375,7 @@ class Rotation:
          [0.707 0.707 0.    0.   ]]
 
         """
-        ax = np.array(n_omega,dtype=float)
+        ax = _float_array(n_omega)
         if ax.shape[:-2:-1] != (4,): raise ValueError(f'invalid shape: {ax.shape}')
         if abs(P) != 1: raise ValueError('P ∉ {-1,1}')
 
@@ -987,7 +1391,7 @@ class Rotation:
             with np.printoptions(threshold=sys.maxsize,precision=16,floatmode='fixed'):
                 raise ValueError(f'axis–angle rotation axis is not of unit length\n{ax}')
 
-        return Rotation(Rotation._ax2qu(ax))
+        return Rotation(Rotation._ax2qu(ax).astype(ax.dtype,copy=False))
 
     @staticmethod
     def from_basis(basis: np.ndarray,
@@ -1010,19 +1414,20 @@ class Rotation:
         new : damask.Rotation
 
         """
-        om = np.array(basis,dtype=float)
+        om = _float_array(basis)
         if om.shape[-2:] != (3,3): raise ValueError(f'invalid shape: {om.shape}')
 
         if reciprocal:
             om = np.linalg.inv(tensor.transpose(om)/np.pi)                                          # transform reciprocal basis set
             orthonormal = False                                                                     # contains stretch
 
+        tol = 5.e-8 if om.dtype == np.float64 else 5.e-6
         if not orthonormal:
             U, _, Vh = np.linalg.svd(om)                                                            # singular value decomposition
             om = np.einsum('...ij,...jl',U,Vh)
-        elif  (np.abs(np.einsum('...i,...i',om[...,0],om[...,1])) > 5.e-8).any() \
-           or (np.abs(np.einsum('...i,...i',om[...,1],om[...,2])) > 5.e-8).any() \
-           or (np.abs(np.einsum('...i,...i',om[...,2],om[...,0])) > 5.e-8).any():
+        elif  (np.abs(np.einsum('...i,...i',om[...,0],om[...,1])) > tol).any() \
+           or (np.abs(np.einsum('...i,...i',om[...,1],om[...,2])) > tol).any() \
+           or (np.abs(np.einsum('...i,...i',om[...,2],om[...,0])) > tol).any():
             with np.printoptions(threshold=sys.maxsize,precision=16,floatmode='fixed'):
                 raise ValueError(f'orientation matrix is not orthogonal\n{om}')
 
@@ -1030,7 +1435,7 @@ class Rotation:
             with np.printoptions(threshold=sys.maxsize,precision=16,floatmode='fixed'):
                 raise ValueError(f'orientation matrix has determinant ≠ 1\n{om}')
 
-        return Rotation(Rotation._om2qu(om))
+        return Rotation(Rotation._om2qu(om).astype(om.dtype,copy=False))
 
     @staticmethod
     def from_matrix(R: np.ndarray,
@@ -1056,7 +1461,7 @@ class Rotation:
         Quaternion [ 0.707 -0.707 0.  0. ]
 
         """
-        return Rotation.from_basis(np.array(R,dtype=float) * (np.linalg.det(R)**(-1./3.))[...,np.newaxis,np.newaxis]
+        return Rotation.from_basis(_float_array(R) * (np.linalg.det(R)**(-1./3.))[...,np.newaxis,np.newaxis]
                                    if normalize else
                                    R)
 
@@ -1094,8 +1499,8 @@ class Rotation:
         Quaternion [1. 0. 0. 0.]
 
         """
-        a_ = np.array(a,dtype=float)
-        b_ = np.array(b,dtype=float)
+        a_ = _float_array(a)
+        b_ = _float_array(b)
 
         if a_.shape[-2:] != (2,3) or b_.shape[-2:] != (2,3):
             raise ValueError(f'invalid shape: {a_.shape}/{b_.shape}')
@@ -1140,7 +1545,7 @@ class Rotation:
         Quaternion [0.707 0.    0.    0.707]
 
         """
-        ro = np.array(rho,dtype=float)
+        ro = _float_array(rho)
         if ro.shape[:-2:-1] != (4,): raise ValueError(f'invalid shape: {ro}')
         if abs(P) != 1: raise ValueError('P ∉ {-1,1}')
 
@@ -1155,7 +1560,7 @@ class Rotation:
             with np.printoptions(threshold=sys.maxsize,precision=16,floatmode='fixed'):
                 raise ValueError(f'Rodrigues vector rotation axis is not of unit length\n{ro}')
 
-        return Rotation(Rotation._ro2qu(ro))
+        return Rotation(Rotation._ro2qu(ro).astype(ro.dtype,copy=False))
 
     @staticmethod
     def from_homochoric(h: np.ndarray,
@@ -1175,7 +1580,7 @@ class Rotation:
         new : damask.Rotation
 
         """
-        ho = np.array(h,dtype=float)
+        ho = _float_array(h)
         if ho.shape[:-2:-1] != (3,): raise ValueError(f'invalid shape: {ho.shape}')
         if abs(P) != 1: raise ValueError('P ∉ {-1,1}')
 
@@ -1185,7 +1590,7 @@ class Rotation:
             with np.printoptions(threshold=sys.maxsize,precision=16,floatmode='fixed'):
                 raise ValueError(f'homochoric coordinate outside of the sphere\n{ho}')
 
-        return Rotation(Rotation._ho2qu(ho))
+        return Rotation(Rotation._ho2qu(ho).astype(ho.dtype,copy=False))
 
     @staticmethod
     def from_cubochoric(x: np.ndarray,
@@ -1205,7 +1610,7 @@ class Rotation:
         new : damask.Rotation
 
         """
-        cu = np.array(x,dtype=float)
+        cu = _float_array(x)
         if cu.shape[:-2:-1] != (3,): raise ValueError(f'invalid shape: {cu.shape}')
         if abs(P) != 1: raise ValueError('P ∉ {-1,1}')
         if np.abs(np.max(cu)) > np.pi**(2./3.) * 0.5+1.e-9:
@@ -1214,7 +1619,7 @@ class Rotation:
 
         ho = -P * Rotation._cu2ho(cu)
 
-        return Rotation(Rotation._ho2qu(ho))
+        return Rotation(Rotation._ho2qu(ho).astype(cu.dtype,copy=False))
 
 
     @staticmethod
@@ -1255,7 +1660,8 @@ class Rotation:
                  shape: Union[None, int, IntSequence] = None,
                  degrees: bool = False,
                  fractions: bool = True,
-                 rng_seed: Optional[NumpyRngSeed] = None) -> 'Rotation':
+                 rng_seed: Optional[NumpyRngSeed] = None,
+                 integer_approximation: bool = True) -> 'Rotation':
         """
         Initialize with samples from a binned orientation distribution function (ODF).
 
@@ -1268,18 +1674,27 @@ class Rotation:
         shape : (sequence of) int, optional
             Output shape. Defaults to None, which gives a scalar.
         degrees : bool, optional
-            Euler space grid coordinates are in degrees. Defaults to True.
+            Euler space grid coordinates are in degrees. Defaults to False.
         fractions : bool, optional
             ODF values correspond to volume fractions, not probability densities.
             Defaults to True.
         rng_seed: {None, int, array_like[ints], SeedSequence, BitGenerator, Generator}, optional
             A seed to initialize the BitGenerator.
             Defaults to None, i.e. unpredictable entropy will be pulled from the OS.
+        integer_approximation : bool, optional
+            Use hybrid integer approximation, i.e. the number of samples per
+            grid point deviates by less than one from the expected number.
+            Otherwise, samples are drawn independently. Defaults to True.
 
         Returns
         -------
         new : damask.Rotation
 
+        See Also
+        --------
+        ODF_sampler : Repeated sampling from the same ODF.
+        damask.ODF : Estimation of a binned ODF from rotations.
+
         Notes
         -----
         Due to the distortion of Euler space in the vicinity of ϕ = 0,
@@ -1293,6 +1708,55 @@ class Rotation:
         P. Eisenlohr and F. Roters, Computational Materials Science 42(4):670-678, 2008
         https://doi.org/10.1016/j.commatsci.2007.09.015
 
+        """
+        return Rotation.ODF_sampler(weights,phi,degrees,fractions)(shape,rng_seed,integer_approximation)
+
+
+    @staticmethod
+    def ODF_sampler(weights: np.ndarray,
+                    phi: np.ndarray,
+                    degrees: bool = False,
+                    fractions: bool = True) -> Callable[..., 'Rotation']:
+        """
+        Prepare sampling from a binned orientation distribution function (ODF).
+
+        The volume fractions of the bins and their cumulative sum
+        are computed once and reused for every sample.
+
+        Parameters
+        ----------
+        weights : numpy.ndarray, shape (n)
+            Texture intensity values (probability density or volume fraction) at Euler space grid points.
+        phi : numpy.ndarray, shape (n,3)
+            Grid coordinates in Euler space at which weights are defined.
+        degrees : bool, optional
+            Euler space grid coordinates are in degrees. Defaults to False.
+        fractions : bool, optional
+            ODF values correspond to volume fractions, not probability densities.
+            Defaults to True.
+
+        Returns
+        -------
+        sample : callable
+            Function with the signature sample(shape=None,rng_seed=None,integer_approximation=True)
+            returning a damask.Rotation. The parameters have the same meaning as for 'from_ODF'.
+
+        See Also
+        --------
+        from_ODF : Single sampling from an ODF.
+
+        Examples
+        --------
+        Sample 100 RVEs with 500 grains each.
+
+        >>> import numpy as np
+        >>> import damask
+        >>> phi = damask.grid_filters.coordinates0_point([36,18,18],[360.,90.,90.]).reshape(-1,3)
+        >>> weights = np.random.rand(len(phi))
+        >>> sample = damask.Rotation.ODF_sampler(weights,phi,degrees=True)
+        >>> rng = np.random.default_rng(20191102)
+        >>> RVEs = [sample(500,rng) for _ in range(100)]
+
         """
         def _dg(eu,deg):
             """Return infinitesimal Euler space volume of bin(s)."""
@@ -1303,9 +1767,23 @@ class Rotation:
 
         dg = 1. if fractions else _dg(phi,degrees)
         dV_V = dg * np.maximum(0.,weights.squeeze())
+        CDF = None
 
-        N = 1 if shape is None else np.prod(shape).astype(int)
-        return Rotation.from_Euler_angles(phi[util.hybrid_IA(dV_V,N,rng_seed)],degrees).reshape(() if shape is None else shape)
+        def sample(shape: Union[None, int, IntSequence] = None,
+                   rng_seed: Optional[NumpyRngSeed] = None,
+                   integer_approximation: bool = True) -> 'Rotation':
+            nonlocal CDF
+            N = 1 if shape is None else np.prod(shape).astype(int)
+            if integer_approximation:
+                idx = util.hybrid_IA(dV_V,N,rng_seed)
+            else:
+                if CDF is None: CDF = np.cumsum(dV_V)
+                rng = np.random.default_rng(rng_seed)
+                u = np.sort(rng.random(N)*CDF[-1])                                                  # sorted search is cache-friendly
+                idx = np.searchsorted(CDF,u,side='right')[rng.permutation(N)]
+            return Rotation.from_Euler_angles(phi[idx],degrees).reshape(() if shape is None else shape)
+
+        return sample
 
 
     @staticmethod
@@ -1481,6 +1959,7 @@ class Rotation:
     #---------- Quaternion ----------
     @staticmethod
     def _qu2om(qu: np.ndarray) -> np.ndarray:
+        if nb: return _compiled(_nb_qu2om,qu,(4,),(3,3))
         qq = qu[...,0:1]**2-(qu[...,1:2]**2 + qu[...,2:3]**2 + qu[...,3:4]**2)
         om = np.block([qq + 2.*qu[...,1:2]**2,
                        2.*(qu[...,2:3]*qu[...,1:2]-_P*qu[...,0:1]*qu[...,3:4]),
@@ -1505,6 +1984,7 @@ class Rotation:
         https://doi.org/10.1371/journal.pone.0276302
 
         """
+        if nb: return _compiled(_nb_qu2eu,qu,(4,),(3,))
         a =     qu[...,0:1]
         b = -_P*qu[...,3:4]
         c = -_P*qu[...,1:2]
@@ -1566,6 +2046,7 @@ class Rotation:
     @staticmethod
     def _qu2ho(qu: np.ndarray) -> np.ndarray:
         """Quaternion to homochoric vector."""
+        if nb: return _compiled(_nb_qu2ho,qu,(4,),(3,))
         with np.errstate(invalid='ignore'):
             omega = 2. * np.arccos(np.clip(qu[...,0:1],-1.,1.))
             ho = np.where(np.abs(omega) < 1.e-12,
@@ -1589,6 +2070,7 @@ class Rotation:
         This formulation is from  www.euclideanspace.com/maths/geometry/rotations/conversions/matrixToQuaternion.
         The original formulation had issues.
         """
+        if nb: return _compiled(_nb_om2qu,om,(3,3),(4,))
         trace = om[...,0,0:1] + om[...,1,1:2] + om[...,2,2:3]
 
         with np.errstate(invalid='ignore',divide='ignore'):
@@ -1861,6 +2343,7 @@ class Rotation:
     @staticmethod
     def _ho2ax(ho: np.ndarray) -> np.ndarray:
         """Homochoric vector to axis–angle pair."""
+        if nb: return _compiled(_nb_ho2ax,ho,(3,),(4,))
         tfit = np.array([+0.9999999999999968,     -0.49999999999986866,     -0.025000000000632055,
                          -0.003928571496460683,   -0.0008164666077062752,   -0.00019411896443261646,
                          -0.00004985822229871769, -0.000014164962366386031, -1.9000248160936107e-6,
@@ -1891,6 +2374,7 @@ class Rotation:
         https://doi.org/10.1088/0965-0393/22/7/075013
 
         """
+        if nb: return _compiled(_nb_ho2cu,ho,(3,),(3,))
         rs = np.linalg.norm(ho,axis=-1,keepdims=True)
 
         xyz3 = np.take_along_axis(ho,Rotation._get_pyramid_order(ho,'forward'),-1)
@@ -1954,6 +2438,7 @@ class Rotation:
         https://doi.org/10.1088/0965-0393/22/7/075013
 
         """
+        if nb: return _compiled(_nb_cu2ho,cu,(3,),(3,))
         with np.errstate(invalid='ignore',divide='ignore'):
             # get pyramid and scale by grid parameter ratio
             XYZ = np.take_along_axis(cu,Rotation._get_pyramid_order(cu,'forward'),-1) * _sc
@@ -2011,3 +2496,237 @@ class Rotation:
                      np.where(np.maximum(np.abs(xyz[...,1]),np.abs(xyz[...,2])) <= np.abs(xyz[...,0]),1,2))
 
         return order[direction][p]
+
+
+####################################################################################################
+# Compiled kernels (used if numba is available)
+#
+# The kernels operate on flattened arrays and mirror the numpy implementations above operation by
+# operation. Results are identical except for the transcendental functions (arccos, arctan2, sin,
+# cos), for which numpy and numba might use different implementations, and the polynomial in
+# '_ho2ax', which is evaluated with Horner's scheme. The differences are limited to a few units
+# in the last place (absolute difference < 1e-14). Only the angle computed in '_ho2ax' deviates
+# more (< 1e-11) for small angles, where arccos amplifies rounding differences.
+# The kernels run serially: numba's threading layers are not safe to use in combination with the
+# process-based parallelization (fork) used elsewhere in DAMASK.
+####################################################################################################
+def _compiled(kernel, a: np.ndarray, shape_in: Tuple[int, ...], shape_out: Tuple[int, ...]) -> np.ndarray:
+    """Apply compiled conversion kernel to array of arbitrary shape."""
+    shape = a.shape[:a.ndim-len(shape_in)]
+    return kernel(np.ascontiguousarray(a).reshape((-1,)+shape_in)).reshape(shape+shape_out)
+
+@numba_njit_wrapper(error_model='numpy',cache=True)
+def _nb_qu2om(qu):
+    om = np.empty((qu.shape[0],3,3),dtype=qu.dtype)
+    for i in range(qu.shape[0]):
+        q0,q1,q2,q3 = qu[i,0],qu[i,1],qu[i,2],qu[i,3]
+        qq = q0**2-(q1**2 + q2**2 + q3**2)
+        om[i,0,0] = qq + 2.*q1**2
+        om[i,0,1] = 2.*(q2*q1-_P*q0*q3)
+        om[i,0,2] = 2.*(q3*q1+_P*q0*q2)
+        om[i,1,0] = 2.*(q1*q2+_P*q0*q3)
+        om[i,1,1] = qq + 2.*q2**2
+        om[i,1,2] = 2.*(q3*q2-_P*q0*q1)
+        om[i,2,0] = 2.*(q1*q3-_P*q0*q2)
+        om[i,2,1] = 2.*(q2*q3+_P*q0*q1)
+        om[i,2,2] = qq + 2.*q3**2
+    return om
+
+@numba_njit_wrapper(error_model='numpy',cache=True)
+def _nb_qu2eu(qu):
+    eu = np.empty((qu.shape[0],3),dtype=qu.dtype)
+    for i in range(qu.shape[0]):
+        a =     qu[i,0]
+        b = -_P*qu[i,3]
+        c = -_P*qu[i,1]
+        d = -_P*qu[i,2]
+
+        e0 = np.arctan2(b,a)
+        e1 = np.arccos(2*(a**2+b**2)/(a**2+b**2+c**2+d**2)-1)
+        e2 = np.arctan2(-d,c)
+
+        if abs(e1) <= 1.e-8:
+            e0 = 2*e0
+            e2 = 0.0
+        elif abs(e1-np.pi) <= 1.e-8 + 1.e-5*np.pi:
+            e0 = -2*e2
+            e2 = 0.0
+        else:
+            e0,e2 = e0-e2,e0+e2
+
+        eu[i,0] = _nb_wrap(e0,2.*np.pi)
+        eu[i,1] = _nb_wrap(e1,np.pi)
+        eu[i,2] = _nb_wrap(e2,2.*np.pi)
+    return eu
+
+@numba_njit_wrapper(cache=True)
+def _nb_wrap(e,period):
+    if abs(e) < 1.e-6 or abs(e-2*np.pi) < 1.e-6:
+        return 0.
+    return e%period if e < 0. else e
+
+@numba_njit_wrapper(error_model='numpy',cache=True)
+def _nb_qu2ho(qu):
+    ho = np.empty((qu.shape[0],3),dtype=qu.dtype)
+    for i in range(qu.shape[0]):
+        q0 = qu[i,0]
+        omega = 2. * np.arccos(-1. if q0 < -1. else (1. if q0 > 1. else q0))
+        if abs(omega) < 1.e-12:
+            ho[i] = 0.
+        else:
+            n = np.sqrt(qu[i,1]*qu[i,1]+qu[i,2]*qu[i,2]+qu[i,3]*qu[i,3])
+            f = (0.75*(omega - np.sin(omega)))**(1./3.)
+            for j in range(3):
+                ho[i,j] = qu[i,j+1]/n * f
+    return ho
+
+@numba_njit_wrapper(error_model='numpy',cache=True)
+def _nb_om2qu(om):
+    qu = np.empty((om.shape[0],4),dtype=om.dtype)
+    for i in range(om.shape[0]):
+        o = om[i]
+        trace = o[0,0] + o[1,1] + o[2,2]
+        if trace > 0:
+            s = 0.5 / np.sqrt( 1. + trace)
+            q0,q1,q2,q3 = 0.25 / s,(o[2,1] - o[1,2]) * s,(o[0,2] - o[2,0]) * s,(o[1,0] - o[0,1]) * s
+        elif o[0,0] > (o[1,1] if (o[1,1] >= o[2,2] or o[1,1] != o[1,1]) else o[2,2]):
+            s = 2.  * np.sqrt( 1. + o[0,0] - o[1,1] - o[2,2])
+            q0,q1,q2,q3 = (o[2,1] - o[1,2]) / s,0.25 * s,(o[0,1] + o[1,0]) / s,(o[0,2] + o[2,0]) / s
+        elif o[1,1] > o[2,2]:
+            s = 2.  * np.sqrt( 1. + o[1,1] - o[2,2] - o[0,0])
+            q0,q1,q2,q3 = (o[0,2] - o[2,0]) / s,(o[0,1] + o[1,0]) / s,0.25 * s,(o[1,2] + o[2,1]) / s
+        else:
+            s = 2.  * np.sqrt( 1. + o[2,2] - o[0,0] - o[1,1] )
+            q0,q1,q2,q3 = (o[1,0] - o[0,1]) / s,(o[0,2] + o[2,0]) / s,(o[1,2] + o[2,1]) / s,0.25 * s
+        sign = -1. if q0 < 0. else 1.
+        qu[i,0] = sign*q0
+        qu[i,1] = sign*(q1*_P)
+        qu[i,2] = sign*(q2*_P)
+        qu[i,3] = sign*(q3*_P)
+    return qu
+
+_tfit = np.array([+0.9999999999999968,     -0.49999999999986866,     -0.025000000000632055,
+                  -0.003928571496460683,   -0.0008164666077062752,   -0.00019411896443261646,
+                  -0.00004985822229871769, -0.000014164962366386031, -1.9000248160936107e-6,
+                  -5.72184549898506e-6,    +7.772149920658778e-6,    -0.00001053483452909705,
+                  +9.528014229335313e-6,   -5.660288876265125e-6,    +1.2844901692764126e-6,
+                  +1.1255185726258763e-6,  -1.3834391419956455e-6,   +7.513691751164847e-7,
+                  -2.401996891720091e-7,   +4.386887017466388e-8,    -3.5917775353564864e-9])
+
+@numba_njit_wrapper(error_model='numpy',cache=True)
+def _nb_ho2ax(ho):
+    ax = np.empty((ho.shape[0],4),dtype=ho.dtype)
+    for i in range(ho.shape[0]):
+        hmag_squared = ho[i,0]**2 + ho[i,1]**2 + ho[i,2]**2
+        if abs(hmag_squared) < 1.e-8:
+            ax[i,0] = 0.
+            ax[i,1] = 0.
+            ax[i,2] = 1.
+            ax[i,3] = 0.
+        else:
+            s = _tfit[20]
+            for k in range(19,-1,-1):
+                s = s*hmag_squared + _tfit[k]
+            n = np.sqrt(hmag_squared)
+            for j in range(3):
+                ax[i,j] = ho[i,j]/n
+            ax[i,3] = 2.*np.arccos(-1. if s < -1. else (1. if s > 1. else s))
+    return ax
+
+@numba_njit_wrapper(cache=True)
+def _nb_pyramid(x,y,z):
+    if max(abs(x),abs(y)) <= abs(z):
+        return 0
+    elif max(abs(y),abs(z)) <= abs(x):
+        return 1
+    else:
+        return 2
+
+@numba_njit_wrapper(error_model='numpy',cache=True)
+def _nb_ho2cu(ho):
+    forward  = np.array([[0,1,2],[1,2,0],[2,0,1]])
+    backward = np.array([[0,1,2],[2,0,1],[1,2,0]])
+    cu = np.empty((ho.shape[0],3),dtype=ho.dtype)
+    for i in range(ho.shape[0]):
+        p = _nb_pyramid(ho[i,0],ho[i,1],ho[i,2])
+        if abs(ho[i,0]) + abs(ho[i,1]) + abs(ho[i,2]) <= 1.e-16:
+            cu[i] = 0.
+            continue
+        x3,y3,z3 = ho[i,forward[p,0]],ho[i,forward[p,1]],ho[i,forward[p,2]]
+        rs = np.sqrt(ho[i,0]*ho[i,0]+ho[i,1]*ho[i,1]+ho[i,2]*ho[i,2])
+
+        # inverse M_3
+        f = np.sqrt( 2.*rs/(rs+abs(z3)) )
+        x2,y2 = x3*f,y3*f
+        qxy = x2**2 + y2**2
+        if abs(qxy) <= 1.e-12:
+            T0 = T1 = 0.
+        else:
+            a,b = abs(x2),abs(y2)
+            mx = a if (a >= b or a != a) else b
+            mn = a if (a <= b or a != a) else b
+            q2 = qxy + mx**2
+            sq2 = np.sqrt(q2)
+            q = (_beta/np.sqrt(2.)/_R1) * np.sqrt(q2*qxy/(q2-mx*sq2))
+            tt = (mn**2+mx*sq2)/np.sqrt(2.)/qxy
+            tt = -1. if tt < -1. else (1. if tt > 1. else tt)
+            if b <= a:
+                T0,T1 = 1.*q,np.arccos(tt)/np.pi*12.*q
+            else:
+                T0,T1 = np.arccos(tt)/np.pi*12.*q,1.*q
+            if x2 < 0.: T0 *= -1.
+            if y2 < 0.: T1 *= -1.
+        xyz = (T0/_sc,T1/_sc,((-1. if z3 < 0. else 1.) * rs/np.sqrt(6./np.pi))/_sc)
+        for j in range(3):
+            cu[i,j] = xyz[backward[p,j]]
+    return cu
+
+@numba_njit_wrapper(error_model='numpy',cache=True)
+def _nb_cu2ho(cu):
+    forward  = np.array([[0,1,2],[1,2,0],[2,0,1]])
+    backward = np.array([[0,1,2],[2,0,1],[1,2,0]])
+    ho = np.empty((cu.shape[0],3),dtype=cu.dtype)
+    for i in range(cu.shape[0]):
+        p = _nb_pyramid(cu[i,0],cu[i,1],cu[i,2])
+        if abs(cu[i,0]) + abs(cu[i,1]) + abs(cu[i,2]) <= 1.e-16:
+            ho[i] = 0.
+            continue
+        # get pyramid and scale by grid parameter ratio
+        X,Y,Z = cu[i,forward[p,0]]*_sc,cu[i,forward[p,1]]*_sc,cu[i,forward[p,2]]*_sc
+        if abs(X) + abs(Y) <= 1.e-16:
+            xyz = (0.,0.,np.sqrt(6./np.pi)*Z)
+        else:
+            order = abs(Y) <= abs(X)
+            q = np.pi/12. * (Y if order else X) / (X if order else Y)
+            c = np.cos(q)
+            s = np.sin(q)
+            q = _R1*2.**0.25/_beta/ np.sqrt(np.sqrt(2.)-c) * (X if order else Y)
+            T0 = (np.sqrt(2.)*c - 1.) * q
+            T1 = (np.sqrt(2.) * s) * q
+
+            # transform to sphere grid (inverse Lambert)
+            c = T0**2 + T1**2
+            s = c *         np.pi/24. /Z**2
+            c = c * np.sqrt(np.pi/24.)/Z
+            q = np.sqrt( 1. - s)
+            xyz = ((T0 if order else T1)*q,(T1 if order else T0)*q,np.sqrt(6./np.pi) * Z - c)
+        for j in range(3):
+            ho[i,j] = xyz[backward[p,j]]
+    return ho
+
+@numba_njit_wrapper(error_model='numpy',cache=True)
+def _nb_compose(q_a,q_b,out):
+    for i in range(out.shape[0]):
+        a0,a1,a2,a3 = q_a[i,0],q_a[i,1],q_a[i,2],q_a[i,3]
+        b0,b1,b2,b3 = q_b[i,0],q_b[i,1],q_b[i,2],q_b[i,3]
+        q0 = a0*b0 - a1*b1 - a2*b2 - a3*b3
+        c1,c2,c3 = a2*b3 - a3*b2, a3*b1 - a1*b3, a1*b2 - a2*b1
+        if _P < 0: c1,c2,c3 = -c1,-c2,-c3                                                           # keep single precision
+        q1 = (c1 + a0*b1) + b0*a1                                                                   # same order as numpy path
+        q2 = (c2 + a0*b2) + b0*a2
+        q3 = (c3 + a0*b3) + b0*a3
+        sign = -1. if q0 < 0. else 1.
+        out[i,0] = sign*q0
+        out[i,1] = sign*q1
+        out[i,2] = sign*q2
+        out[i,3] = sign*q3
@@ -0,0 +1,153 @@
+from typing import Optional, Union
+
+import numpy as np
+
+from ._typehints import FloatSequence, IntSequence
+from . import Rotation
+from . import util
+
+
+class RotationAverager:
+    """
+    Accumulate rotations for averaging.
+
+    Only the weighted sum of the quaternion outer products q⊗q (a 4x4
+    matrix per average) and the sum of the weights are stored. Partial
+    sums from chunks, increments, or processes can be merged.
+
+    References
+    ----------
+    F. Landis Markley et al., Journal of Guidance, Control, and Dynamics 30(4):1193-1197, 2007
+    https://doi.org/10.2514/1.28949
+
+    Examples
+    --------
+    Average orientation of each grain over all increments of a simulation.
+
+    >>> import damask
+    >>> r = damask.Result('my_file.hdf5')
+    >>> avg = damask.RotationAverager(len(r.get('O',increments=0)))
+    >>> for O in r.get('O').values():
+    ...     avg.update(damask.Rotation(O))
+    >>> avg.result()
+
+    """
+
+    def __init__(self,
+                 shape: Union[None, int, IntSequence] = None):
+        """
+        New accumulator.
+
+        Parameters
+        ----------
+        shape : (sequence of) int, optional
+            Shape of the averaged rotation. Defaults to None, which gives a scalar.
+
+        """
+        shape_ = () if shape is None else (shape,) if isinstance(shape,(int,np.integer)) else tuple(shape)
+        self.M = np.zeros(shape_+(4,4))
+        self.weight = np.zeros(shape_)
+
+
+    def __repr__(self) -> str:
+        """
+        Return repr(self).
+
+        Give short, human-readable summary.
+
+        """
+        return util.srepr([f'Averager of rotations of shape {self.shape}',
+                           f'total weight: {np.sum(self.weight)}'])
+
+
+    @property
+    def shape(self) -> tuple:
+        """Shape of the averaged rotation."""
+        return self.weight.shape
+
+
+    def update(self,
+               rotations: Rotation,
+               weights: Optional[FloatSequence] = None,
+               labels: Optional[IntSequence] = None):
+        """
+        Add rotations.
+
+        Parameters
+        ----------
+        rotations : damask.Rotation, shape (...,self.shape)
+            Rotations to add. Leading dimensions are summed over.
+        weights : numpy.ndarray, shape (rotations.shape), optional
+            Relative weight of each rotation. Defaults to equal weights.
+        labels : numpy.ndarray of int, shape (rotations.shape), optional
+            Index into the flattened accumulator to which each rotation
+            is added, e.g. grain ID. Defaults to None, i.e. the trailing
+            dimensions of the rotations match self.shape.
+
+        """
+        if labels is None:
+            if rotations.shape[len(rotations.shape)-len(self.shape):] != self.shape:
+                raise ValueError(f'shape mismatch: {rotations.shape} and {self.shape}')
+
+            q = rotations.quaternion.astype(float,copy=False).reshape((-1,)+self.shape+(4,))
+            w = np.ones(q.shape[:-1]) if weights is None else \
+                np.broadcast_to(np.array(weights,float),rotations.shape).reshape(q.shape[:-1])
+            self.M += np.einsum('i...j,i...k,i...->...jk',q,q,w)
+            self.weight += np.sum(w,axis=0)
+        else:
+            if np.shape(labels) != rotations.shape:
+                raise ValueError(f'shape mismatch: {np.shape(labels)} and {rotations.shape}')
+            idx = np.array(labels,int).reshape(-1)
+            if np.any(idx < 0) or np.any(idx >= self.weight.size):
+                raise ValueError(f'labels out of range [0,{self.weight.size})')
+
+            q = rotations.quaternion.astype(float,copy=False).reshape(-1,4)
+            w = np.ones(len(q)) if weights is None else \
+                np.broadcast_to(np.array(weights,float),rotations.shape).reshape(-1)
+            M = np.empty((self.weight.size,4,4))
+            for i,j in zip(*np.triu_indices(4)):
+                M[:,i,j] = M[:,j,i] = np.bincount(idx,w*q[:,i]*q[:,j],len(M))
+            self.M += M.reshape(self.M.shape)
+            self.weight += np.bincount(idx,w,len(M)).reshape(self.shape)
+
+
+    def merge(self,
+              other: 'RotationAverager') -> 'RotationAverager':
+        """
+        Combine with other accumulator.
+
+        Parameters
+        ----------
+        other : damask.RotationAverager
+            Accumulator of the same shape.
+
+        Returns
+        -------
+        merged : damask.RotationAverager
+            Accumulator containing the rotations added to both.
+
+        """
+        if other.shape != self.shape:
+            raise ValueError(f'shape mismatch: {other.shape} and {self.shape}')
+
+        merged = RotationAverager(self.shape)
+        merged.M = self.M + other.M
+        merged.weight = self.weight + other.weight
+        return merged
+
+
+    def result(self) -> Rotation:
+        """
+        Weighted average of the added rotations.
+
+        Returns
+        -------
+        average : damask.Rotation, shape (self.shape)
+            Average.
+
+        """
+        if np.any(self.weight <= 0.):
+            raise ValueError('average of zero total weight')
+
+        _, vec = np.linalg.eigh(self.M/self.weight[...,np.newaxis,np.newaxis])                      # ascending eigenvalues
+        return Rotation.from_quaternion(vec[...,-1],accept_homomorph=True,normalize=True)
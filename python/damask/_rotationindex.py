@@ -0,0 +1,145 @@
+from typing import Tuple
+
+import numpy as np
+from scipy import spatial
+
+from . import Rotation
+from . import Orientation
+from . import util
+
+
+class RotationIndex:
+    """
+    Spatial index for nearest-neighbor search in a set of rotations.
+
+    The unit quaternions q and -q (which represent the same rotation)
+    are stored in a k-d tree. The Euclidean distance d between two
+    quaternions is related to the misorientation angle ω = 4 arcsin(d/2).
+    For orientations, all symmetrically equivalent orientations are
+    stored such that distances correspond to disorientation angles.
+
+    Examples
+    --------
+    Match measured orientations against a dictionary of reference orientations.
+
+    >>> import damask
+    >>> reference = damask.Orientation.from_random(shape=10000,lattice='cF')
+    >>> measured = damask.Orientation.from_random(shape=(50,50),lattice='cF')
+    >>> omega,ID = damask.RotationIndex(reference).query(measured,degrees=True)
+    >>> omega.shape, ID.shape
+    ((50, 50), (50, 50))
+
+    """
+
+    def __init__(self,
+                 rotations: Rotation,
+                 leafsize: int = 16):
+        """
+        New index over rotations.
+
+        Parameters
+        ----------
+        rotations : damask.Rotation or damask.Orientation
+            Rotations to index. Multi-dimensional arrays are flattened.
+        leafsize : int, optional
+            Number of points at which the k-d tree switches to brute-force.
+            Defaults to 16.
+
+        """
+        self.rotations = rotations.flatten()
+        eq = self.rotations.equivalent if isinstance(self.rotations,Orientation) else \
+             self.rotations.reshape((1,)+self.rotations.shape)
+        q = eq.quaternion.reshape(-1,4)
+        self.N_equivalent = 2*eq.shape[0]
+        self._tree = spatial.cKDTree(np.block([[q],[-q]]),leafsize=leafsize)
+
+
+    def __repr__(self) -> str:
+        """
+        Return repr(self).
+
+        Give short, human-readable summary.
+
+        """
+        return util.srepr([f'Index of {len(self)} {self.rotations.__class__.__name__.lower()}s',
+                           f'with {self.N_equivalent} equivalent quaternions each'])
+
+
+    def __len__(self) -> int:
+        """Number of indexed rotations."""
+        return len(self.rotations)
+
+
+    def query(self,
+              rotations: Rotation,
+              k: int = 1,
+              degrees: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find nearest indexed rotations.
+
+        Parameters
+        ----------
+        rotations : damask.Rotation
+            Rotations to find nearest indexed rotations for.
+        k : int, optional
+            Number of nearest rotations to find. Defaults to 1.
+        degrees : bool, optional
+            Angle is given in degrees. Defaults to False.
+
+        Returns
+        -------
+        omega : numpy.ndarray, shape (rotations.shape) or (rotations.shape+(k,))
+            (Dis)orientation angles to nearest rotations, sorted in ascending order.
+            The last dimension is dropped for k=1. Missing neighbors are indicated by inf.
+        ID : numpy.ndarray, shape (rotations.shape) or (rotations.shape+(k,))
+            Index of nearest rotations. Missing neighbors are indicated by len(self).
+
+        """
+        if not 0 < k: raise ValueError(f'invalid number of neighbors: {k}')
+
+        d,i = self._tree.query(rotations.quaternion.reshape(-1,4),k=k*self.N_equivalent)
+        d,i = d.reshape(-1,k*self.N_equivalent),i.reshape(-1,k*self.N_equivalent)
+        ID = np.where(i<self._tree.n,i%len(self),len(self))
+        if self.N_equivalent > 2 or k > 1:
+            s = np.argsort(ID,axis=-1,kind='stable')                                                # keep only first occurrence
+            first = np.ones_like(ID,dtype=bool)
+            first[:,1:] = np.diff(np.take_along_axis(ID,s,-1),axis=-1) != 0
+            np.put_along_axis(d,s,np.where(first,np.take_along_axis(d,s,-1),np.inf),-1)
+            s = np.argsort(d,axis=-1,kind='stable')[:,:k]
+            d,ID = np.take_along_axis(d,s,-1),np.take_along_axis(ID,s,-1)
+        else:
+            d,ID = d[:,:k],ID[:,:k]
+        ID[np.isinf(d)] = len(self)
+
+        omega = np.where(np.isinf(d),np.inf,4.*np.arcsin(np.clip(d*.5,None,1.)))
+        shape = rotations.shape if k == 1 else rotations.shape+(k,)
+        return (np.degrees(omega) if degrees else omega).reshape(shape), ID.reshape(shape)
+
+
+    def query_within(self,
+                     rotations: Rotation,
+                     omega: float,
+                     degrees: bool = False) -> np.ndarray:
+        """
+        Find all indexed rotations within a (dis)orientation angle.
+
+        Parameters
+        ----------
+        rotations : damask.Rotation
+            Rotations to find indexed rotations in the vicinity for.
+        omega : float
+            Maximum (dis)orientation angle.
+        degrees : bool, optional
+            Angle is given in degrees. Defaults to False.
+
+        Returns
+        -------
+        IDs : numpy.ndarray of object, shape (rotations.shape)
+            Sorted indices of rotations within the given angle.
+
+        """
+        r = 2.*np.sin((np.radians(omega) if degrees else omega)*.25)
+        candidates = self._tree.query_ball_point(rotations.quaternion.reshape(-1,4),r)
+        IDs = np.empty(len(candidates),dtype=object)
+        IDs[:] = [np.unique(np.array(c,dtype=int)%len(self)) for c in candidates]
+        return IDs.reshape(rotations.shape)
@@ -9,6 +9,9 @@ import re as _re
 import signal as _signal
 import fractions as _fractions
 import contextlib as _contextlib
+import json as _json
+import time as _time
+import threading as _threading
 from collections import abc as _abc, OrderedDict as _OrderedDict
 from functools import reduce as _reduce, partial as _partial, wraps as _wraps
 import inspect
@@ -456,19 +459,22 @@ def hybrid_IA(dist: _FloatSequence,
     hist : numpy.ndarray, shape (N)
         Integer approximation of the distribution.
 
+    Notes
+    -----
+    The number of samples per bin deviates by less than one from the
+    (scaled) distribution (largest remainder method).
+
     """
-    N_opt_samples = max(_np.count_nonzero(dist),N)                                                  # random subsampling if too little samples requested
-    N_inv_samples = 0
+    dist_ = _np.asarray(dist,dtype=float)
+    N_opt_samples = max(_np.count_nonzero(dist_),N)                                                 # random subsampling if too little samples requested
 
-    scale_,scale,inc_factor = (0.0,float(N_opt_samples),1.0)
-    while (not _np.isclose(scale, scale_)) and (N_inv_samples != N_opt_samples):
-        repeats = _np.rint(scale*_np.array(dist)).astype(_np.int64)
-        N_inv_samples = _np.sum(repeats)
-        scale_,scale,inc_factor = (scale,scale+inc_factor*0.5*(scale - scale_), inc_factor*2.0) \
-                                   if N_inv_samples < N_opt_samples else \
-                                  (scale_,0.5*(scale_ + scale), 1.0)
+    scaled = dist_*(N_opt_samples/_np.sum(dist_))
+    repeats = _np.floor(scaled).astype(_np.int64)
+    if (N_missing := N_opt_samples - _np.sum(repeats)) > 0:
+        repeats[_np.argpartition(repeats-scaled,N_missing-1)[:N_missing]] += 1                     # largest remainders
 
-    return _np.repeat(_np.arange(len(dist)),repeats)[_np.random.default_rng(rng_seed).permutation(N_inv_samples)[:N]]
+    bins = _np.flatnonzero(repeats)
+    return _np.repeat(bins,repeats[bins])[_np.random.default_rng(rng_seed).permutation(N_opt_samples)[:N]]
 
 
 def shapeshifter(fro: _Tuple[int, ...],
@@ -981,3 +987,128 @@ class ProgressBar:
 
         if iteration == self.total - 1 and _sys.stdout.isatty():
             _sys.stdout.write('\n')
+
+
+class Profiler:
+    """
+    Record timings, call counts, and transferred bytes of named phases.
+
+    A profiler is shared (not copied) when the object that holds it is
+    deep-copied, such that all views of a damask.Result report to the
+    same profiler.
+    Phases recorded as totals enclose other phases. Their times are
+    reported separately and must not be added to those of other phases.
+
+    Examples
+    --------
+    Record the time spent in a phase called 'compute':
+
+    >>> import damask
+    >>> p = damask.util.Profiler()
+    >>> with p.record('compute') as event:
+    ...     event['bytes'] = 1024
+    >>> p.report()['compute']['calls']
+    1
+
+    """
+
+    def __init__(self):
+        """New profiler without recorded events."""
+        self.events: _List[_Dict[str, _Any]] = []
+        self._t0 = _time.perf_counter()
+
+    def __deepcopy__(self, memo) -> 'Profiler':
+        """Return self to share the profiler among copies of its owner."""
+        return self
+
+    def __repr__(self) -> str:
+        """
+        Return repr(self).
+
+        Give table of accumulated time, calls, and bytes per phase.
+
+        """
+        lines = [f'{"phase":<16} {"calls":>8} {"time/s":>12} {"bytes":>14}']
+        report = self.report()
+        for total in [False,True]:
+            if total and any(r['total'] for r in report.values()): lines.append('totals:')
+            for name,r in report.items():
+                if r['total'] == total:
+                    lines.append(f'{name:<16} {r["calls"]:>8} {r["time/s"]:>12.6f} {r["bytes"]:>14}')
+        return srepr(lines)
+
+    @_contextlib.contextmanager
+    def record(self,
+               name: str,
+               nbytes: int = 0,
+               total: bool = False) -> _Generator[_Dict[str, _Any], None, None]:
+        """
+        Record the duration of the enclosed code block.
+
+        Parameters
+        ----------
+        name : str
+            Name of the phase.
+        nbytes : int, optional
+            Number of bytes moved in this phase. Can be
+            modified via the 'bytes' entry of the yielded event.
+            Defaults to 0.
+        total : bool, optional
+            The phase encloses other recorded phases.
+            Defaults to False.
+
+        Yields
+        ------
+        event : dict
+            Event data.
+
+        """
+        event = {'name':name,'bytes':nbytes,'total':total,'thread':_threading.get_ident()}
+        start = _time.perf_counter()
+        try:
+            yield event
+        finally:
+            event['start'] = start - self._t0
+            event['duration'] = _time.perf_counter() - start
+            self.events.append(event)
+
+    def report(self) -> _Dict[str, _Dict[str, _Any]]:
+        """
+        Summarize recorded events per phase.
+
+        Returns
+        -------
+        report : dict
+            Number of calls, total time in s, and total bytes per phase,
+            and whether the phase encloses other phases ('total').
+
+        """
+        r: _Dict[str, _Dict[str, _Any]] = {}
+        for e in self.events:
+            s = r.setdefault(e['name'],{'calls':0,'time/s':0.0,'bytes':0,'total':e['total']})
+            s['calls'] += 1
+            s['time/s'] += e['duration']
+            s['bytes'] += int(e['bytes'])
+        return r
+
+    def save_Chrome_trace(self,
+                          fname: _FileHandle):
+        """
+        Save recorded events in the Chrome trace event format.
+
+        The file can be inspected with chrome://tracing or https://ui.perfetto.dev.
+
+        Parameters
+        ----------
+        fname : file, str, or pathlib.Path
+            Filename or file to write.
+
+        """
+        pid = _os.getpid()
+        trace = {'traceEvents': [{'name':e['name'],'cat':'damask','ph':'X',
+                                  'ts':e['start']*1e6,'dur':e['duration']*1e6,
+                                  'pid':pid,'tid':e['thread'],'args':{'bytes':int(e['bytes']),'total':e['total']}}
+                                 for e in self.events],
+                 'displayTimeUnit': 'ms'}
+        with open_text(fname,'w') as f:
+            _json.dump(trace,f)
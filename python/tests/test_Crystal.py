@@ -5,6 +5,7 @@ from pathlib import Path
 import damask
 from damask import Crystal
 from damask import util
+from damask import _crystal
 
 class TestCrystal:
 
@@ -46,6 +47,44 @@ class TestCrystal:
         with pytest.raises(KeyError):
             Crystal(family='cubic').basis_real
 
+    @pytest.mark.parametrize('family',['cubic','hexagonal','tetragonal','orthorhombic','monoclinic','triclinic'])
+    def test_cached_symmetry(self,family):
+        a,b = Crystal(family=family),Crystal(family=family)
+        a.symmetry_operations.quaternion[...] = 0.
+        assert np.allclose(np.linalg.norm(b.symmetry_operations.quaternion,axis=-1),1.)
+        if a.standard_triangle is not None:
+            a.standard_triangle['proper'][...] = 0.
+            assert np.any(b.standard_triangle['proper'] != 0.)
+
+    def test_cached_basis(self):
+        a,b = Crystal(lattice='tI',a=1.,c=1.2),Crystal(lattice='tI',a=1.,c=1.3)
+        assert not np.allclose(a.basis_real,b.basis_real) and not np.allclose(a.basis_reciprocal,b.basis_reciprocal)
+        basis = a.basis_real
+        basis *= 2.
+        assert np.allclose(Crystal(lattice='tI',a=1.,c=1.2).basis_real*2.,basis)
+
+    def test_cache_size(self,monkeypatch):
+        monkeypatch.setattr(_crystal,'_cache',{})
+        monkeypatch.setattr(_crystal,'_cache_size',3)
+        for c in np.linspace(1.,2.,10):
+            assert np.isclose(Crystal(lattice='tP',a=1.,c=c).basis_real[2,2],c)
+        assert len(_crystal._cache) == 3
+
+    def test_cached_kinematics(self):
+        k = Crystal(lattice='cF').kinematics('slip')
+        k['direction'].pop()
+        assert len(Crystal(lattice='cF').kinematics('slip')['direction']) == 2
+        k['plane'][0] *= 2
+        assert (Crystal(lattice='cF').kinematics('slip')['plane'][0]*2 == k['plane'][0]).all()
+
+    def test_cached_relation(self):
+        a = Crystal(lattice='cF').relation_operations('KS')[1]
+        b = Crystal(lattice='cF').relation_operations('KS')[1]
+        assert (a == b).all()
+        a.quaternion[...] = 0.
+        assert np.allclose(np.linalg.norm(Crystal(lattice='cF').relation_operations('KS')[1].quaternion,axis=-1),1.)
+        assert not (Crystal(lattice='cF').relation_operations('KS',Crystal(lattice='cI',a=1.1))[1] == a).all()
+
     def test_basis_real(self):
         for gamma in np.random.random(2**8)*np.pi:
             basis = np.tril(np.random.random((3,3))+1e-6)
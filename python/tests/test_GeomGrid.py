@@ -8,6 +8,7 @@ from damask import VTK
 from damask import GeomGrid
 from damask import Table
 from damask import Rotation
+from damask import Orientation
 from damask import Colormap
 from damask import ConfigMaterial
 from damask import util
@@ -481,11 +482,36 @@ class TestGeomGrid:
         reference = VTK.load(res_path/f'get_grain_boundaries_8g12x15x20_{"".join(direction)}_{periodic}.vtu')
         assert current.__repr__() == reference.__repr__()
 
-    @pytest.mark.parametrize('directions',[(1,2,'y'),('a','b','x'),[1]])
+    @pytest.mark.parametrize('directions',[(1,2,'y'),('a','b','x'),[1],'',[]])
     def test_get_grain_boundaries_invalid(self,default,directions):
         with pytest.raises(ValueError):
             default.get_grain_boundaries(directions=directions)
 
+    @pytest.mark.parametrize('periodic',[True,False])
+    @pytest.mark.parametrize('directions',['x','yz','xyz'])
+    def test_get_grain_neighbors(self,random,periodic,directions):
+        O = Orientation.from_random(shape=random.N_materials,lattice='hP')
+        n = random.get_grain_neighbors(O,periodic,directions)
+        dA = np.prod(random.size/random.cells)/(random.size/random.cells)
+        area = {}
+        for i,d in enumerate('xyz'):
+            if d not in directions: continue
+            a,b = random.material,np.roll(random.material,1,i)
+            for idx in np.argwhere(a != b):
+                if not periodic and idx[i] == 0: continue
+                pair = tuple(sorted((a[tuple(idx)],b[tuple(idx)])))
+                area[pair] = area.get(pair,0.) + dA[i]
+        assert sorted(area) == [tuple(p) for p in n.get('material')]
+        assert np.allclose([area[tuple(p)] for p in n.get('material')],n.get('area').flatten())
+        m = n.get('material')
+        assert np.allclose(O[m[:,0]].disorientation_angle(O[m[:,1]]),n.get('omega').flatten())
+
+    def test_get_grain_neighbors_invalid(self,default):
+        with pytest.raises(ValueError):
+            default.get_grain_neighbors(Orientation.from_random(shape=default.N_materials-1,lattice='cI'))
+        with pytest.raises(ValueError):
+            default.get_grain_neighbors(directions='')
+
     def test_load_DREAM3D(self,res_path):
         """
         For synthetic microstructures (no in-grain scatter), check that:
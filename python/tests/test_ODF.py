@@ -0,0 +1,87 @@
+import pytest
+import numpy as np
+
+from damask import Rotation
+from damask import Orientation
+from damask import ODF
+from damask import _odf
+
+
+class TestODF:
+
+    def test_repr(self):
+        print(ODF(family='cubic'))
+
+    @pytest.mark.parametrize('grid,cells',[('Euler',(72,36,72)),('cubochoric',(48,48,48))])
+    def test_cells(self,grid,cells):
+        odf = ODF(grid=grid)
+        assert odf.cells == cells and odf.phi.shape == (np.prod(cells),3)
+
+    @pytest.mark.parametrize('kwargs',[{'grid':'Rodrigues'},{'cells':(3,3)},{'cells':(3,0,3)}])
+    def test_invalid(self,kwargs):
+        with pytest.raises(ValueError):
+            ODF(**kwargs)
+
+    @pytest.mark.parametrize('grid',['Euler','cubochoric'])
+    def test_volume(self,grid):
+        assert np.isclose(np.sum(ODF(grid=grid,cells=(12,6,12))._volume),1.)
+
+    @pytest.mark.parametrize('grid',['Euler','cubochoric'])
+    @pytest.mark.parametrize('family',[None,'cubic','hexagonal'])
+    def test_update_chunked(self,monkeypatch,grid,family):
+        r = Rotation.from_random(1000)
+        w = np.random.rand(1000)
+        a = ODF(family,grid=grid)
+        a.update(r,w)
+        monkeypatch.setattr(_odf,'_chunk_size',64)
+        b = ODF(family,grid=grid)
+        for s in [slice(0,300),slice(300,1000)]:
+            b.update(r[s],w[s])
+        assert np.allclose(a.weight,b.weight) and np.isclose(np.sum(a.weight),np.sum(w))
+
+    def test_update_reduced(self):
+        o = Orientation.from_random(shape=500,family='cubic')
+        a,b = ODF('cubic'),ODF('cubic')
+        a.update(o)
+        b.update(o.reduced)
+        assert np.allclose(a.weight,b.weight)
+
+    def test_update_invalid(self):
+        with pytest.raises(ValueError):
+            ODF('cubic').update(Orientation.from_random(shape=5,family='hexagonal'))
+
+    def test_merge(self):
+        r = Rotation.from_random(100)
+        a,b,c = ODF(),ODF(),ODF()
+        a.update(r[:40])
+        b.update(r[40:])
+        c.update(r)
+        assert np.allclose(a.merge(b).weight,c.weight)
+        with pytest.raises(ValueError):
+            a.merge(ODF(grid='cubochoric'))
+
+    @pytest.mark.parametrize('grid',['Euler','cubochoric'])
+    @pytest.mark.parametrize('sigma',[None,5.])
+    def test_from_ODF(self,grid,sigma):
+        center = Orientation.from_random(family='cubic')
+        o = Orientation.from_spherical_component(center=center,sigma=3.,shape=2000,degrees=True,family='cubic')
+        odf = ODF('cubic',grid=grid)
+        odf.update(o)
+        f = odf.result(sigma,degrees=True)
+        assert np.isclose(np.sum(f),1.)
+        sample = Orientation.from_ODF(weights=f,phi=odf.phi,shape=500,family='cubic')
+        omega = np.degrees(sample.disorientation_angle(center))
+        assert np.median(omega) < 10. and np.max(omega) < 40.
+
+    def test_smoothing_narrow(self):
+        odf = ODF()
+        odf.update(Rotation.from_random(1000))
+        assert np.allclose(odf.result(1e-3,degrees=True),odf.result())
+
+    def test_result_invalid(self):
+        with pytest.raises(ValueError):
+            ODF().result()
+        odf = ODF()
+        odf.update(Rotation())
+        with pytest.raises(ValueError):
+            odf.result(sigma=0.)
@@ -10,6 +10,7 @@ from damask import Table
 from damask import util
 from damask import grid_filters
 from damask import _crystal
+from damask import _orientation
 
 crystal_families = set(_crystal.lattice_symmetries.values())
 
@@ -216,6 +217,16 @@ class TestOrientation:
         avg_angle = o.average().as_axis_angle(degrees=True,pair=True)[1]
         assert np.isclose(avg_angle,10+(angle-10)/2.)
 
+    @pytest.mark.parametrize('family',crystal_families)
+    def test_average_by(self,family):
+        o = Orientation.from_random(family=family,shape=(10,20))
+        labels = np.random.randint(7,10,size=o.shape)
+        weights = np.random.rand(*o.shape)
+        avg = o.average_by(labels,weights)
+        assert isinstance(avg,Orientation) and avg.family == family
+        for a,l in zip(avg,np.unique(labels)):
+            assert np.isclose(a.disorientation_angle(o[labels==l].average(weights[labels==l])),0.,atol=1.e-7)
+
     @pytest.mark.parametrize('family',crystal_families)
     def test_reduced_equivalent(self,family):
         i = Orientation(family=family)
@@ -233,6 +244,22 @@ class TestOrientation:
         evenly_distributed = Orientation.from_cubochoric(x=grid,family=family)
         assert evenly_distributed.shape == evenly_distributed.reduced.shape
 
+    @pytest.mark.parametrize('family',crystal_families)
+    def test_reduced_chunked(self,monkeypatch,family):
+        """Compare to first symmetrically equivalent orientation in FZ, including orientations on FZ boundaries."""
+        size = np.ones(3)*np.pi**(2./3.)
+        grid = grid_filters.coordinates0_node([9,9,9],size,-size*.5)
+        o = Orientation.from_cubochoric(x=grid,family=family)
+        eq = o.equivalent
+        FZ = np.argmax(eq.in_FZ,axis=0)
+        monkeypatch.setattr(_orientation,'_chunk_size',50)
+        assert (o.reduced.quaternion == np.take_along_axis(eq.quaternion,FZ[np.newaxis,...,np.newaxis],0)[0]).all()
+
+    @pytest.mark.parametrize('family',crystal_families)
+    def test_reduced_nan(self,family):
+        q = Orientation(np.array([[np.nan,0.,0.,0.],[1.,0.,0.,0.]]),family=family).reduced.quaternion
+        assert np.isnan(q[0]).all() and np.allclose(q[1],[1.,0.,0.,0.])
+
     @pytest.mark.parametrize('family',crystal_families)
     @pytest.mark.parametrize('N',[1,8,32])
     def test_disorientation(self,family,N):
@@ -251,6 +278,33 @@ class TestOrientation:
                                       .misorientation(p[n].equivalent[ops[n][1]])
                                       .as_quaternion())
 
+    @pytest.mark.parametrize('family',crystal_families)
+    @pytest.mark.parametrize('partner',['random','equivalent','twin'])
+    def test_disorientation_chunked(self,monkeypatch,family,partner):
+        """Compare to evaluation of all pairs of symmetrically equivalent orientations."""
+        o = Orientation.from_random(family=family,shape=(10,3))
+        p = Orientation.from_random(family=family,shape=3) if partner == 'random' else \
+            o[0].equivalent[-1] if partner == 'equivalent' else \
+            o[0].copy(rotation=Rotation.from_axis_angle([1,1,1,60],degrees=True,normalize=True)*o[0])
+        r_ = o.equivalent[:,np.newaxis].misorientation(p.broadcast_to(o.shape).equivalent[np.newaxis,:])
+        ok = r_.in_disorientation_FZ | (~r_).in_disorientation_FZ
+        ops = np.stack(np.unravel_index(np.argmax(ok.reshape(-1,*o.shape),axis=0),ok.shape[:2]),axis=-1)
+        r = r_[ops[...,0],ops[...,1],np.arange(10)[:,np.newaxis],np.arange(3)]
+        r = Rotation(np.where(r.in_disorientation_FZ[...,np.newaxis],r.quaternion,(~r).quaternion))
+
+        monkeypatch.setattr(_orientation,'_chunk_size',7)
+        d,ops_ = o.disorientation(p,return_operators=True)
+        assert (ops_ == ops).all() and (d.quaternion == r.quaternion).all()
+
+    @pytest.mark.parametrize('family',crystal_families)
+    def test_disorientation_single_precision(self,family):
+        o = Orientation.from_random(family=family,shape=200)
+        p = Orientation.from_random(family=family,shape=200)
+        d = o.astype(np.float32).disorientation(p.astype(np.float32))
+        assert d.dtype == o.astype(np.float32).reduced.dtype == np.float32
+        assert np.allclose(d.as_axis_angle(pair=True)[1],o.disorientation(p).as_axis_angle(pair=True)[1],
+                           rtol=0.,atol=1.e-5)
+
     @pytest.mark.parametrize('family',crystal_families)
     def test_disorientation360(self,family):
         o_1 = Orientation(Rotation(),family=family)
@@ -267,7 +321,7 @@ class TestOrientation:
         o_2 = Orientation.from_random(shape=shapes[1],family=family)
         angle = o_1.disorientation_angle(o_2)
         full = o_1.disorientation(o_2).as_axis_angle(pair=True)[1]
-        assert np.allclose(angle,full,atol=1e-13,rtol=0)
+        assert np.allclose(np.cos(angle*.5),np.cos(full*.5),atol=1e-14,rtol=0)                      # arccos ill-conditioned for small angles
 
     @pytest.mark.parametrize('shapes',[[None,None,()],
                                       [[2,3,4],[2,3,4],(2,3,4)],
@@ -293,6 +347,12 @@ class TestOrientation:
         with pytest.raises(NotImplementedError):
             o_1.disorientation_angle(o_2)
 
+    @pytest.mark.parametrize('family',crystal_families)
+    def test_disorientation_nan(self,family):
+        o = Orientation(np.array([[np.nan,0.,0.,0.],[1.,0.,0.,0.]]),family=family)
+        with pytest.raises(ValueError):
+            o.disorientation(Orientation.from_random(family=family))
+
     @pytest.mark.parametrize('family',crystal_families)
     def test_disorientation_zero(self,set_of_quaternions,family):
         o = Orientation.from_quaternion(q=set_of_quaternions,family=family)
@@ -317,6 +377,88 @@ class TestOrientation:
         color = o.IPF_color(vector=direction,proper=proper)
         assert np.allclose(np.broadcast_to(color[0,...],color.shape),color)
 
+    @pytest.mark.parametrize('family',crystal_families)
+    @pytest.mark.parametrize('proper',[True,False])
+    def test_IPF_color_chunked(self,monkeypatch,family,proper):
+        o = Orientation.from_random(family=family,shape=(30,4))
+        v = np.random.random((4,3))
+        color = o.IPF_color(v,proper=proper)
+        poles,ops = o.to_SST(v,proper=proper,return_operators=True)
+        monkeypatch.setattr(_orientation,'_chunk_size',7)
+        rgb = o.IPF_color(v,proper=proper,out=np.empty((30,4,3),np.uint8))
+        assert (rgb == (color*255).astype(np.uint8)).all()
+        assert np.allclose(poles,o.equivalent[ops,np.arange(30)[:,np.newaxis],np.arange(4)] @ v)
+        assert (o.to_SST(v,proper=proper,return_operators=True)[1] == ops).all()
+
+    @pytest.mark.parametrize('shape',[(3,),(2,4,3)])
+    def test_IPF_color_invalid_out(self,shape):
+        with pytest.raises(ValueError):
+            Orientation.from_random(family='cubic',shape=(2,4)).IPF_color([0,0,1],out=np.empty(shape)[::-1])
+
+    @pytest.mark.parametrize('family',['cubic','hexagonal','tetragonal','orthorhombic'])
+    @pytest.mark.parametrize('proper',[True,False])
+    @pytest.mark.parametrize('projection',['equal_area','equal_angle'])
+    def test_inverse_pole_figure_density_random(self,family,proper,projection):
+        o = Orientation.from_random(family=family,shape=20000,rng_seed=20000)
+        density,extent = o.inverse_pole_figure_density([0,0,1],bins=16,sigma=10.,degrees=True,
+                                                       proper=proper,projection=projection)
+        assert density.shape == (16,16) and np.all(np.abs(extent) <= 1.)
+        assert np.allclose(density[~np.isnan(density)],1.,atol=.1)
+
+    def test_inverse_pole_figure_density_cube(self):
+        density,extent = Orientation(family='cubic').inverse_pole_figure_density([0,0,1],bins=8)
+        assert np.nansum(density[1:,1:]) == 0. and density[0,0] > 1.
+
+    def test_inverse_pole_figure_density_chunked(self,monkeypatch):
+        o = Orientation.from_random(family='hexagonal',shape=(20,5))
+        v = np.random.random((5,3))
+        w = np.random.rand(20,5)
+        density = o.inverse_pole_figure_density(v,w,bins=10,sigma=.1)[0]
+        monkeypatch.setattr(_orientation,'_chunk_size',7)
+        assert np.allclose(o.inverse_pole_figure_density(v,w,bins=10,sigma=.1)[0],density,equal_nan=True)
+
+    @pytest.mark.parametrize('projection',['equal_area','equal_angle'])
+    @pytest.mark.parametrize('sigma',[None,10.])
+    def test_pole_figure_density_random(self,projection,sigma):
+        o = Orientation.from_random(lattice='cF',shape=20000,rng_seed=20000)
+        density,extent = o.pole_figure_density(hkl=[1,1,1],bins=16,sigma=sigma,degrees=True,projection=projection)
+        rho = np.linalg.norm(np.stack(np.meshgrid(*[np.linspace(-1.,1.,17)[:-1]+1./16.]*2),axis=-1),axis=-1)
+        assert np.isnan(density[rho > 1.+np.sqrt(2.)/16.]).all() and (extent == [-1,1,-1,1]).all()
+        assert np.allclose(density[~np.isnan(density) if sigma else rho < 1.-np.sqrt(2.)/16.],1.,
+                           atol=.1 if sigma else .3)
+
+    @pytest.mark.parametrize('direction',['x','y','z'])
+    def test_pole_figure_density_cube(self,direction):
+        density = Orientation(lattice='cI').pole_figure_density(uvw=[1,0,0],bins=9,direction=direction)[0]
+        assert density[4,4] == np.nanmax(density) and np.isclose(np.nansum(density[3:6,3:6]),np.nansum(density[4,4]))
+
+    @pytest.mark.parametrize('direction',['x','y','z'])
+    def test_pole_figure_density_single(self,direction):
+        o = Orientation.from_Euler_angles(phi=[10,30,20],degrees=True,lattice='cF')
+        density = o.pole_figure_density(hkl=[1,1,1],bins=9,direction=direction)[0]
+        p = (~Rotation(o)).broadcast_to(4) @ np.array([[1,1,1],[-1,1,1],[1,-1,1],[1,1,-1]])/np.sqrt(3.)
+        p *= np.where(p[:,'xyz'.index(direction),np.newaxis] < 0.,-1.,1.)
+        xy = util.project_equal_area(p,direction)
+        expected = np.histogram2d(xy[:,0],xy[:,1],bins=9,range=[[-1,1],[-1,1]])[0] > 0
+        assert (np.nan_to_num(density) > 0).tolist() == expected.tolist()
+        if direction == 'z':
+            assert sorted(map(tuple,np.argwhere(expected))) == [(1,4),(3,0),(5,5),(7,2)]
+
+    def test_pole_figure_density_weights(self,monkeypatch):
+        o = Orientation.from_random(lattice='hP',c=1.6,shape=(6,5))
+        w = np.random.randint(1,3,(6,5))
+        density = o.pole_figure_density(hkil=[1,0,-1,0],weights=w,bins=12,sigma=.2)[0]
+        monkeypatch.setattr(_orientation,'_chunk_size',4)
+        repeated = Orientation(np.repeat(o.quaternion.reshape(-1,4),w.reshape(-1),axis=0),lattice='hP',c=1.6)
+        assert np.allclose(repeated.pole_figure_density(hkil=[1,0,-1,0],bins=12,sigma=.2)[0],density,equal_nan=True)
+
+    @pytest.mark.parametrize('kwargs',[{'hkl':[[1,1,1],[1,0,0]]},
+                                       {'hkl':[1,1,1],'projection':'Lambert'},
+                                       {'hkl':[1,1,1],'sigma':0.}])
+    def test_pole_figure_density_invalid(self,kwargs):
+        with pytest.raises(ValueError):
+            Orientation.from_random(lattice='cF',shape=10).pole_figure_density(**kwargs)
+
     @pytest.mark.parametrize('relation',[None,'Peter','Paul'])
     def test_unknown_relation(self,relation):
         with pytest.raises(KeyError):
@@ -421,6 +563,21 @@ class TestOrientation:
                 Table({'Schmid':(3,3,)},P.reshape(-1,9)).save(reference)
             assert np.allclose(P,Table.load(reference).get('Schmid'))
 
+    @pytest.mark.parametrize('lattice',['hP','cI','cF','tI'])
+    @pytest.mark.parametrize('sigma_shape',[(),(3,),(5,3)])
+    def test_resolved_shear_stress(self,monkeypatch,lattice,sigma_shape):
+        O = Orientation.from_random(shape=(4,5),lattice=lattice,c=1.2 if lattice == 'tI' else None)
+        sigma = np.random.random(sigma_shape+(3,3))
+        P = O.Schmid(N_slip='*')
+        blend = util.shapeblender(O.shape,sigma_shape)
+        tau = np.einsum('...ij,n...ij->...n',
+                        np.broadcast_to(sigma.reshape(util.shapeshifter(sigma_shape,blend,mode='left')+(3,3)),
+                                        blend+(3,3)),
+                        np.broadcast_to(P.reshape(P.shape[:1]+util.shapeshifter(O.shape,blend,mode='right')+(3,3)),
+                                        P.shape[:1]+blend+(3,3)))
+        monkeypatch.setattr(_orientation,'_chunk_size',3)
+        assert np.allclose(O.resolved_shear_stress(sigma,N_slip='*'),tau)
+
     def test_Schmid_invalid(self):
         with pytest.raises(KeyError):
             Orientation(lattice='fcc').Schmid()
@@ -492,6 +649,24 @@ class TestOrientation:
         for i in range(200):
             assert (r.reshape((-1,200))[:,i] == Orientation(set_of_quaternions[i],lattice=lattice).related(model)).all()
 
+    @pytest.mark.parametrize('lattice,model',[('cF','Bain'),('cF','KS'),('cI','Burgers'),('hP','Burgers')])
+    @pytest.mark.parametrize('shape',[(),(5,),(3,4)])
+    def test_relationship_variant(self,lattice,model,shape):
+        o = Orientation.from_random(shape=shape,lattice=lattice)
+        r = o.related(model)
+        v = np.random.randint(r.shape[0],size=shape)
+        assert np.allclose(o.related(model,variant=v).quaternion,
+                           np.take_along_axis(r.quaternion,v[np.newaxis,...,np.newaxis],0)[0])
+        assert np.allclose(o.related(model,variant=1).quaternion,r[1].quaternion)
+        assert o.related(model,variant=1).lattice == r.lattice
+        assert np.all(o.related(model,variant='random',rng_seed=1).quaternion
+                      == o.related(model,variant='random',rng_seed=1).quaternion)
+
+    @pytest.mark.parametrize('variant',[-1,24,'Random','all'])
+    def test_relationship_variant_invalid(self,variant):
+        with pytest.raises(ValueError):
+            Orientation.from_random(shape=3,lattice='cF').related('KS',variant=variant)
+
 ### blending tests ###
 
     @pytest.mark.parametrize('family',crystal_families)
@@ -1,4 +1,5 @@
 import bz2
+import json
 import pickle
 import time
 import shutil
@@ -20,6 +21,7 @@ import h5py
 import numpy as np
 
 from damask import Result
+from damask import _result
 from damask import Orientation
 from damask import VTK
 from damask import tensor
@@ -172,6 +174,26 @@ class TestResult:
         in_file   = default.place('x')
         assert np.allclose(in_memory,in_file)
 
+    def test_add_calculation_special_names(self,default):
+        default.add_absolute('F')
+        _result._compile_formula.cache_clear()
+        default.add_calculation('mechanics.stress_Cauchy(#P#,#|F|#)+#P#*0','x')
+        assert _result._compile_formula.cache_info().misses == 1
+        assert np.allclose(default.place('x'),mechanics.stress_Cauchy(default.place('P'),np.abs(default.place('F'))))
+
+    @pytest.mark.parametrize('formula,elementwise',[('2.0*np.abs(#F#)-np.pi',True),
+                                                    ('np.where(#F#>0,#F#,-#F#)',False),
+                                                    ('#F#/np.max(#F#)',False),
+                                                    ('np.sum(#F#,axis=1)',False),
+                                                    ('#F#-#F#[0]',False),
+                                                    ('np.sqrt(#F#**2+#P#**2)>1e5',True)])
+    def test_add_calculation_chunked(self,monkeypatch,default,formula,elementwise):
+        assert _result._compile_formula(formula)[2] == elementwise
+        default.add_calculation(formula,'full')
+        monkeypatch.setattr(_result,'chunk_size',90)
+        default.add_calculation(formula,'chunked')
+        assert (default.place('full') == default.place('chunked')).all()
+
     def test_add_calculation_invalid(self,default):
         default.add_calculation('np.linalg.norm(#F#,axis=0)','wrong_dim')
         assert default.get('wrong_dim') is None
@@ -220,6 +242,30 @@ class TestResult:
         in_file = default.place('IPFcolor_({} {} {})'.format(*d))
         assert np.allclose(in_memory,in_file)
 
+    @pytest.mark.parametrize('phase',['pheno_bcc','pheno_fcc'])
+    @pytest.mark.parametrize('mode',['slip','twin'])
+    def test_add_resolved_shear_stress(self,default,phase,mode):
+        r = default.view(phases=phase)
+        r.add_stress_Cauchy('P','F')
+        r.add_resolved_shear_stress(**{f'N_{mode}':'*'})
+        qu = r.place('O')
+        P = Orientation(rotation=qu,lattice=qu.dtype.metadata['lattice']).Schmid(**{f'N_{mode}':'*'})
+        in_memory = np.einsum('...ij,n...ij->...n',r.place('sigma'),P)
+        in_file = r.place(f'tau_{mode[:2]}(sigma)')
+        assert np.allclose(in_memory,in_file)
+
+    @pytest.mark.parametrize('phase',['pheno_bcc','pheno_fcc'])
+    @pytest.mark.parametrize('l',[[1,0,0],[0,1,1]])
+    def test_add_Schmid_factor(self,default,phase,l):
+        r = default.view(phases=phase)
+        r.add_Schmid_factor(l,N_slip=[12])
+        qu = r.place('O')
+        P = Orientation(rotation=qu,lattice=qu.dtype.metadata['lattice']).Schmid(N_slip=[12])
+        l_ = np.array(l)/np.linalg.norm(l)
+        in_memory = np.einsum('i,n...ij,j->...n',l_,P,l_)
+        in_file = r.place('m_sl_({} {} {})'.format(*l))
+        assert np.allclose(in_memory,in_file) and np.all(np.abs(in_file) <= .5)
+
     def test_add_maximum_shear(self,default):
         default.add_stress_Cauchy('P','F')
         default.add_maximum_shear('sigma')
@@ -459,6 +505,51 @@ class TestResult:
         os.chdir(tmp_path)
         single_phase.export_VTK(mode=mode)
 
+    def test_profiling(self,tmp_path,default):
+        profiler = default.enable_profiling()
+        default.view(increments=-1).export_VTK(target_dir=tmp_path,parallel=False)
+        default.add_absolute('F')
+        report = profiler.report()
+        assert {'open','mapping','read','scatter','VTK build','VTK save','compute','write'} <= report.keys()
+        assert report['export_VTK']['calls'] == 1 and report['read']['bytes'] > 0
+        assert report['export_VTK']['total'] and not any(report[p]['total'] for p in ['read','scatter','VTK save'])
+        profiler.save_Chrome_trace(tmp_path/'trace.json')
+        with open(tmp_path/'trace.json') as f:
+            assert len(json.load(f)['traceEvents']) == len(profiler.events)
+
+    def test_profiling_disabled(self,default):
+        profiler = default.enable_profiling()
+        default.disable_profiling()
+        default.get('F')
+        assert profiler.events == []
+
+    @pytest.mark.parametrize('shape,dtype',[((40000,3,3),np.float64),((120001,),np.int32),((50000,4),'>f4')])
+    @pytest.mark.parametrize('fletcher32',[True,False])
+    def test_read_chunks(self,tmp_path,shape,dtype,fletcher32):
+        data = (np.random.rand(*shape)*1000).astype(dtype)
+        with h5py.File(tmp_path/'chunks.hdf5','w') as f:
+            f.create_dataset('data',data=data,chunks=(5000,)+shape[1:],compression='gzip',
+                             shuffle=True,fletcher32=fletcher32)
+        with h5py.File(tmp_path/'chunks.hdf5','r') as f:
+            assert np.array_equal(_result._read_chunks(f['data'],f['data'].dtype,N_threads=4),data)
+
+    def test_read_chunks_unsupported(self,tmp_path):
+        with h5py.File(tmp_path/'chunks.hdf5','w') as f:
+            f.create_dataset('lzf',data=np.ones(20000),chunks=(1000,),compression='lzf')
+            f.create_dataset('uncompressed',data=np.ones(20000),chunks=(1000,))
+            f.create_dataset('unallocated',shape=(20000,),chunks=(1000,),compression='gzip')[:10] = 1
+        with h5py.File(tmp_path/'chunks.hdf5','r') as f:
+            for d in f.values():
+                assert _result._read_chunks(d,d.dtype,N_threads=4) is None
+
+    def test_read_chunks_corrupt(self,tmp_path):
+        with h5py.File(tmp_path/'chunks.hdf5','w') as f:
+            f.create_dataset('data',data=np.random.rand(20000),chunks=(1000,),compression='gzip',fletcher32=True)
+            mask,chunk = f['data'].id.read_direct_chunk((0,))
+            f['data'].id.write_direct_chunk((0,),chunk[:-1]+bytes([chunk[-1]^1]))
+        with h5py.File(tmp_path/'chunks.hdf5','r') as f, pytest.raises(OSError):
+            _result._read_chunks(f['data'],f['data'].dtype,N_threads=4)
+
     def test_vtk_invalid_mode(self,single_phase):
         with pytest.raises(ValueError):
             single_phase.export_VTK(mode='invalid')
@@ -0,0 +1,89 @@
+import shutil
+import os
+
+import pytest
+import numpy as np
+
+from damask import Result
+from damask import ResultCatalog
+
+
+@pytest.fixture
+def res_path(res_path_base):
+    """Directory containing testing resources."""
+    return res_path_base/'Result'
+
+@pytest.fixture
+def catalog(tmp_path,res_path):
+    """Catalog of two Result files in temp location for modification."""
+    for fname in ['12grains6x7x8_tensionY.hdf5','6grains6x7x8_single_phase_tensionY.hdf5']:
+        shutil.copy(res_path/fname,tmp_path)
+    c = ResultCatalog(tmp_path/'catalog.sqlite')
+    c.update(sorted(tmp_path.glob('*.hdf5')))
+    return c
+
+
+class TestResultCatalog:
+
+    def test_repr(self,catalog):
+        print(catalog)
+
+    def test_persistent(self,catalog,tmp_path):
+        assert ResultCatalog(tmp_path/'catalog.sqlite').files == catalog.files
+
+    def test_update_incremental(self,catalog,tmp_path):
+        assert catalog.update(catalog.files) == 0
+        Result(tmp_path/'12grains6x7x8_tensionY.hdf5').view(increments=0).add_absolute('F')
+        assert catalog.update(catalog.files) == 1
+        assert len(catalog) == 2
+        assert list(catalog.query(dataset='|F|')) == [tmp_path/'12grains6x7x8_tensionY.hdf5']
+
+    def test_prune(self,catalog,tmp_path):
+        os.remove(tmp_path/'12grains6x7x8_tensionY.hdf5')
+        assert catalog.prune() == 1
+        assert catalog.files == [tmp_path/'6grains6x7x8_single_phase_tensionY.hdf5']
+
+    @pytest.mark.parametrize('t_min,t_max',[(None,None),(10.,None),(None,20.),(8.,32.)])
+    def test_query_time(self,catalog,t_min,t_max):
+        for fname,increments in catalog.query(dataset='F',t_min=t_min,t_max=t_max).items():
+            r = Result(fname)
+            times = r.view(increments=increments).times
+            assert times == [t for t in r.times if (t_min is None or t >= t_min) and (t_max is None or t <= t_max)]
+
+    def test_query_phase(self,catalog):
+        matches = catalog.query(phase='pheno_bcc',dataset='xi_sl')
+        assert [f.name for f in matches] == ['12grains6x7x8_tensionY.hdf5']
+
+    def test_query_wildcard(self,catalog):
+        assert len(catalog.query(phase='pheno_*',field='mech*')) == 2
+        assert catalog.query(phase='ferrite') == {}
+
+    def test_results(self,catalog):
+        r, = catalog.results(phase='pheno_bcc',dataset='xi_sl',t_min=10.)
+        assert r.phases == ['pheno_bcc'] and r.homogenizations == [] and min(r.times) >= 10.
+        assert r.get('xi_sl') is not None
+
+    def test_statistics(self,tmp_path,res_path):
+        shutil.copy(res_path/'12grains6x7x8_tensionY.hdf5',tmp_path)
+        c = ResultCatalog()
+        c.update(tmp_path/'12grains6x7x8_tensionY.hdf5',statistics=True)
+        r = Result(tmp_path/'12grains6x7x8_tensionY.hdf5').view(increments=-1,phases='pheno_fcc')
+        info, = [i for i in c.statistics('P') if i['label'] == 'pheno_fcc' and i['time'] == r.times[-1]]
+        P = r.get('P')
+        assert np.isclose(info['maximum'],P.max()) and np.isclose(info['mean'],P.mean()) and info['unit'] == 'Pa'
+
+    def test_query_phase_homogenization(self,catalog):
+        assert catalog.query(phase='pheno_bcc',homogenization='SX') == {}
+        catalog._db.execute("INSERT INTO datasets (file,increment,type,label,field,name,shape,dtype) "
+                            "SELECT file,increment,'homogenization','SX','mechanical','F','[3, 3]','float64' "
+                            "FROM increments WHERE increment = 0")
+        assert [f.name for f in catalog.query(homogenization='SX')] == [f.name for f in catalog.files]
+        matches = catalog.query(phase='pheno_bcc',homogenization='SX')
+        assert [(f.name,i) for f,i in matches.items()] == [('12grains6x7x8_tensionY.hdf5',[0])]
+
+    def test_query_time_only(self,catalog,tmp_path):
+        with ResultCatalog(tmp_path/'catalog.sqlite') as c:
+            c._db.execute('DELETE FROM datasets')
+            assert catalog.query(dataset='*') != {}
+            assert c.query(dataset='*') == {}
+            assert [len(i) for i in c.query(t_min=0.).values()] == [len(Result(f).increments) for f in c.files]
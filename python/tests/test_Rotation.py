@@ -7,6 +7,7 @@ from damask import Table
 from damask import _rotation
 from damask import grid_filters
 from damask import tensor
+from damask import util
 
 n = 1000
 atol=1.e-4
@@ -688,6 +689,24 @@ class TestRotation:
         for u,c in zip(cu,co):
             assert np.allclose(single(u),c) and np.allclose(single(u),vectorized(u)), f'{u},{c}'
 
+    @pytest.mark.skipif(not _rotation.nb,reason='numba not available')
+    @pytest.mark.parametrize('conversion,representation',[('_qu2om','as_quaternion'),
+                                                           ('_qu2eu','as_quaternion'),
+                                                           ('_qu2ho','as_quaternion'),
+                                                           ('_om2qu','as_matrix'),
+                                                           ('_ho2ax','as_homochoric'),
+                                                           ('_ho2cu','as_homochoric'),
+                                                           ('_cu2ho','as_cubochoric')])
+    def test_compiled(self,monkeypatch,set_of_rotations,conversion,representation):
+        """Check compiled conversion kernels against numpy implementation."""
+        x = np.array([getattr(rot,representation)() for rot in set_of_rotations])
+        x = np.block([[x],[np.zeros_like(x[:2])]]) if representation != 'as_matrix' else x
+        compiled = getattr(Rotation,conversion)(x.reshape((2,-1)+x.shape[1:]))
+        monkeypatch.setattr(_rotation,'nb',False)
+        assert np.allclose(compiled,getattr(Rotation,conversion)(x.reshape((2,-1)+x.shape[1:])),
+                           rtol=0.,atol=1.e-11 if conversion == '_ho2ax' else 1.e-14,               # arccos ill-conditioned at ω → 0
+                           equal_nan=True)
+
     @pytest.mark.parametrize('func',[Rotation.from_axis_angle])
     def test_normalization_vectorization(self,func):
         """Check vectorized implementation normalization."""
@@ -1041,6 +1060,27 @@ class TestRotation:
         print(R,data)
         assert np.allclose(data,R@data)
 
+    @pytest.mark.parametrize('shape',[(),(5,),(2,5)])
+    def test_rotate_minor_symmetric(self,shape):
+        C = np.random.rand(5,3,3,3,3)
+        C = C + C.swapaxes(-4,-3)
+        C = C + C.swapaxes(-2,-1)
+        R = Rotation.from_random(shape)
+        for c in [C,C[0]]:
+            R_ = R.broadcast_to(util.shapeblender(R.shape,c.shape[:-4],False)).as_matrix()
+            assert np.allclose(R@c,np.einsum('...im,...jn,...ko,...lp,...mnop',R_,R_,R_,R_,c))
+
+    @pytest.mark.parametrize('data',[np.random.rand(3),
+                                     np.random.rand(3,3),
+                                     np.random.rand(3,3,3,3)])
+    def test_apply_unique(self,data):
+        R = Rotation.from_random(4)[np.random.randint(4,size=(3,10))]
+        assert np.allclose(R.apply(data,unique=True),R@data)
+
+    def test_apply_unique_invalid(self):
+        with pytest.raises(ValueError):
+            Rotation.from_random(4).apply(np.random.rand(4,3),unique=True)
+
     @pytest.mark.parametrize('data',[np.random.rand(3),
                                      np.random.rand(3,3),
                                      np.random.rand(3,3,3,3)])
@@ -1135,6 +1175,84 @@ class TestRotation:
         with pytest.raises(TypeError):
             Rotation()*np.ones(3)
 
+    @pytest.mark.parametrize('backend',['numba','numpy'])
+    def test_compose(self,monkeypatch,backend):
+        if backend == 'numpy': monkeypatch.setattr(_rotation,'nb',False)
+        a,b = Rotation.from_random(20),Rotation.from_random(20)
+        q = _rotation._compose(a.quaternion,b.quaternion)
+        for a_,b_,q_ in zip(a,b,q):
+            assert np.allclose(mul(a_,b_).quaternion,q_)
+        out = a.quaternion.copy()
+        assert _rotation._compose(out,b.quaternion,out=out) is out and np.allclose(out,q)
+        assert np.allclose(_rotation._compose(a[0].quaternion,b[0].quaternion),q[0])
+
+    @pytest.mark.parametrize('dtype',[np.float32,np.float64])
+    def test_compose_backends(self,monkeypatch,dtype):
+        a,b = Rotation.from_random(100).quaternion.astype(dtype),Rotation.from_random(100).quaternion.astype(dtype)
+        q = _rotation._compose(a,b)
+        monkeypatch.setattr(_rotation,'nb',False)
+        assert q.dtype == dtype and (q == _rotation._compose(a,b)).all()
+
+    @pytest.mark.parametrize('backend',['numba','numpy'])
+    def test_composition_inplace(self,monkeypatch,backend):
+        if backend == 'numpy': monkeypatch.setattr(_rotation,'nb',False)
+        a,b = Rotation.from_random((3,4)),Rotation.from_random(4)
+        c,q = a.copy(),a.quaternion
+        a *= b
+        assert a.quaternion is q and a.isclose(c*b).all()
+        a /= b
+        assert a.quaternion is q and a.isclose(c).all()
+        a *= a
+        assert a.quaternion is q and a.isclose(c*c).all()
+        a *= Rotation.from_random((4,2))
+        assert a.shape == (3,4,2)
+
+    @pytest.mark.parametrize('representation',['Euler_angles','axis_angle','matrix',
+                                                'Rodrigues_vector','homochoric','cubochoric'])
+    def test_single_precision(self,representation):
+        r = Rotation.from_random(100)
+        r_32 = getattr(Rotation,f'from_{representation}')(getattr(r,f'as_{representation}')().astype(np.float32))
+        assert r_32.dtype == getattr(r_32,f'as_{representation}')().dtype == np.float32
+        assert r_32.isclose(r,rtol=0.,atol=1.e-6).all()
+
+    def test_single_precision_arithmetic(self):
+        a,b = Rotation.from_random(1000),Rotation.from_random(1000)
+        a_32,b_32 = a.astype(np.float32),b.astype(np.float32)
+        assert (a_32*b_32).dtype == (a_32/b_32).dtype == (~a_32).dtype == np.float32
+        assert (a_32*b_32).isclose(a*b,rtol=0.,atol=1.e-6).all()
+        assert (a_32@np.ones(3,np.float32)).dtype == np.float32
+        assert (a_32*a).dtype == np.float64
+        c_32 = a_32
+        for _ in range(100): c_32 = c_32*a_32
+        assert np.allclose(np.linalg.norm(c_32.quaternion,axis=-1),1.,rtol=0.,atol=1.e-6)
+
+    @pytest.mark.parametrize('representation',['Euler_angles','axis_angle','matrix',
+                                                'Rodrigues_vector','homochoric','cubochoric'])
+    def test_cache(self,monkeypatch,representation):
+        monkeypatch.setattr(_rotation,'nb',False)
+        r = Rotation.from_random((10,3))
+        as_representation = getattr(Rotation,f'as_{representation}')
+        x = as_representation(r)
+        x[...] = 0.
+        assert np.allclose(as_representation(r),as_representation(r.copy()))
+        v = r[2:4]
+        v *= Rotation.from_random()
+        assert np.allclose(as_representation(r),as_representation(r.copy()))
+        r *= Rotation.from_random(3)
+        assert np.allclose(as_representation(r),as_representation(r.copy()))
+        r.quaternion[0,0] = [1.,0.,0.,0.]
+        assert np.allclose(as_representation(r)[0,0],as_representation(Rotation()))
+
+    def test_cache_limit(self,monkeypatch):
+        monkeypatch.setattr(_rotation,'_cache_limit',0)
+        r = Rotation.from_random(5)
+        r.as_Euler_angles()
+        assert getattr(r,'_cache',None) is None
+
+    def test_astype_invalid(self):
+        with pytest.raises(ValueError):
+            Rotation().astype(int)
+
     @pytest.mark.parametrize('shapes',[[None,None,()],
                                       [[2,3,4],[2,3,4],(2,3,4)],
                                       [[3,4],[4,5],(3,4,5)],
@@ -1185,6 +1303,46 @@ class TestRotation:
         avg_angle = R.average().as_axis_angle(degrees=True,pair=True)[1]
         assert np.isclose(avg_angle,10+(angle-10)/2.)
 
+    @pytest.mark.parametrize('weighted',[True,False])
+    def test_average_by(self,weighted):
+        r = Rotation.from_random((10,20))
+        labels = np.random.randint(-3,3,size=r.shape)
+        weights = np.random.rand(*r.shape) if weighted else None
+        avg = r.average_by(labels,weights)
+        assert avg.shape == np.unique(labels).shape
+        for a,l in zip(avg,np.unique(labels)):
+            assert a.isclose(r[labels==l].average(None if weights is None else weights[labels==l]))
+
+    def test_average_by_invalid(self):
+        with pytest.raises(ValueError):
+            Rotation.from_random(3).average_by([1,2])
+
+    @pytest.mark.parametrize('shape',[(),(3,)])
+    def test_average_chunked(self,shape):
+        q = Rotation.from_spherical_component(Rotation.from_random(),10.,(100,)+shape,degrees=True).quaternion
+        w = np.random.rand(100,*shape)
+        avg = Rotation(np.moveaxis(q,0,-2)).average(np.moveaxis(w,0,-1))
+        assert Rotation.average_chunked(q,w,chunk_size=7).isclose(avg).all()
+
+    @pytest.mark.parametrize('chunk_size',[1,33,1000])
+    def test_map_chunked(self,tmp_path,chunk_size):
+        r = Rotation.from_random((100,2))
+        q = np.lib.format.open_memmap(tmp_path/'q.npy',mode='w+',shape=r.shape+(4,))
+        q[:] = r.quaternion
+        eu = np.lib.format.open_memmap(tmp_path/'eu.npy',mode='w+',shape=r.shape+(3,))
+        assert Rotation.map_chunked(q,lambda r_: r_.as_Euler_angles(),out=eu,chunk_size=chunk_size) is eu
+        assert np.allclose(eu,r.as_Euler_angles())
+        o = Rotation.from_random(r.shape)
+        assert np.allclose(Rotation.map_chunked(q,lambda r_,o_: r_.misorientation(o_),o,chunk_size=chunk_size),
+                           r.misorientation(o).quaternion)
+
+    def test_map_chunked_invalid(self):
+        q = Rotation.from_random(10).quaternion
+        with pytest.raises(ValueError):
+            Rotation.map_chunked(q,lambda r: r.as_matrix(),q[:5])
+        with pytest.raises(ValueError):
+            Rotation.map_chunked(q,lambda r: r.as_matrix(),out=np.empty((10,3)))
+
 
     @pytest.mark.parametrize('sigma',[5,10,15,20])
     @pytest.mark.parametrize('shape',[1000,10000,100000,(10,100)])
@@ -1281,6 +1439,22 @@ class TestRotation:
 
         assert np.sqrt(((weights_r - weights) ** 2).mean()) < 5
 
+    @pytest.mark.parametrize('integer_approximation',[True,False])
+    def test_ODF_sampler(self,res_path,integer_approximation):
+        steps = np.array([144,36,36])
+        limits = np.array([360.,90.,90.])
+        weights = Table.load(res_path/'ODF_experimental_cell.txt').get('intensity').flatten()
+        Eulers = grid_filters.coordinates0_point(steps,limits).reshape(-1,3,order='F')
+
+        sample = Rotation.ODF_sampler(weights,Eulers,degrees=True)
+        assert (sample(100,20191102,integer_approximation) ==
+                Rotation.from_ODF(weights,Eulers,100,True,rng_seed=20191102,
+                                  integer_approximation=integer_approximation)).all()
+        Eulers_r = sample(2**15,integer_approximation=integer_approximation).as_Euler_angles(True)
+        weights_r = np.histogramdd(Eulers_r,steps,tuple(zip(np.zeros(3),limits)))[0].flatten(order='F')/2**15 \
+                  * np.sum(weights)
+        assert np.sqrt(((weights_r - weights) ** 2).mean()) < (4 if integer_approximation else 10)
+
     def test_mul_invalid(self):
         with pytest.raises(TypeError):
             Rotation.from_random()*np.ones(3)
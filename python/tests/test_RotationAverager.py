@@ -0,0 +1,68 @@
+import pytest
+import numpy as np
+
+from damask import Rotation
+from damask import RotationAverager
+
+
+class TestRotationAverager:
+
+    def test_repr(self):
+        print(RotationAverager((3,4)))
+
+    @pytest.mark.parametrize('shape',[None,5,(2,3)])
+    def test_shape(self,shape):
+        assert RotationAverager(shape).shape == (() if shape is None else np.empty(shape).shape)
+
+    @pytest.mark.parametrize('shape',[(),(5,),(2,3)])
+    @pytest.mark.parametrize('weighted',[True,False])
+    def test_update(self,shape,weighted):
+        r = Rotation.from_spherical_component(Rotation.from_random(),10.,(10,)+shape,degrees=True)
+        w = np.random.rand(*r.shape) if weighted else None
+        avg = RotationAverager(shape)
+        for s in [slice(0,3),slice(3,4),slice(4,10)]:
+            avg.update(r[s],None if w is None else w[s])
+        reference = Rotation(np.moveaxis(r.quaternion,0,-2)).average(None if w is None else np.moveaxis(w,0,-1))
+        assert avg.result().isclose(reference).all()
+
+    def test_merge(self):
+        r = Rotation.from_spherical_component(Rotation.from_random(),10.,(20,3),degrees=True)
+        a,b = RotationAverager(3),RotationAverager(3)
+        a.update(r[:12])
+        b.update(r[12:])
+        merged = a.merge(b)
+        assert merged.result().isclose(Rotation(r.quaternion.swapaxes(0,1)).average()).all()
+        assert np.allclose(a.weight,12.) and np.allclose(merged.weight,20.)
+
+    @pytest.mark.parametrize('weighted',[True,False])
+    def test_update_labels(self,weighted):
+        r = Rotation.from_spherical_component(Rotation.from_random(),10.,(6,5),degrees=True)
+        w = np.random.rand(*r.shape) if weighted else None
+        labels = np.random.permutation(np.arange(r.size)%3).reshape(r.shape)
+        avg = RotationAverager(3)
+        avg.update(r,w,labels)
+        for l in range(3):
+            reference = RotationAverager()
+            reference.update(r[labels==l],None if w is None else w[labels==l])
+            assert avg.result()[l].isclose(reference.result())
+
+    def test_single_precision(self):
+        r = Rotation.from_spherical_component(Rotation.from_random(),10.,100,degrees=True)
+        a,b = RotationAverager(),RotationAverager()
+        a.update(r)
+        b.update(r.astype(np.float32))
+        assert a.result().isclose(b.result(),atol=1.e-6)
+
+    def test_invalid_shape(self):
+        with pytest.raises(ValueError):
+            RotationAverager(3).update(Rotation.from_random(4))
+        with pytest.raises(ValueError):
+            RotationAverager(3).merge(RotationAverager(4))
+        with pytest.raises(ValueError):
+            RotationAverager(3).update(Rotation.from_random(4),labels=[0,1,2])
+        with pytest.raises(ValueError):
+            RotationAverager(3).update(Rotation.from_random(4),labels=[0,1,2,3])
+
+    def test_empty(self):
+        with pytest.raises(ValueError):
+            RotationAverager().result()
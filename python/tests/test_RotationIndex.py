@@ -0,0 +1,70 @@
+import pytest
+import numpy as np
+
+from damask import Rotation
+from damask import Orientation
+from damask import RotationIndex
+
+
+class TestRotationIndex:
+
+    def test_repr(self):
+        print(RotationIndex(Rotation.from_random(10)))
+
+    def test_len(self):
+        assert len(RotationIndex(Rotation.from_random((3,4)))) == 12
+
+    @pytest.mark.parametrize('shape',[(),(5,),(3,4)])
+    @pytest.mark.parametrize('k',[1,4])
+    def test_query(self,shape,k):
+        reference = Rotation.from_random(300)
+        rotations = Rotation.from_random(shape)
+        omega = rotations[...,np.newaxis].misorientation_angle(reference)
+        omega_,ID = RotationIndex(reference).query(rotations,k)
+        if k == 1:
+            assert np.allclose(omega_,omega.min(axis=-1)) and (ID == omega.argmin(axis=-1)).all()
+        else:
+            assert np.allclose(omega_,np.sort(omega,axis=-1)[...,:k])
+            assert np.allclose(np.take_along_axis(omega,ID,-1),omega_)
+
+    @pytest.mark.parametrize('family',['cubic','hexagonal','tetragonal','orthorhombic','monoclinic','triclinic'])
+    @pytest.mark.parametrize('k',[1,3])
+    def test_query_orientation(self,family,k):
+        reference = Orientation.from_random(shape=200,family=family)
+        orientations = Orientation.from_random(shape=20,family=family)
+        omega = orientations[:,np.newaxis].disorientation_angle(reference[np.newaxis,:])
+        omega_,ID = RotationIndex(reference).query(orientations,k,degrees=True)
+        assert np.allclose(omega_,np.degrees(np.sort(omega,axis=-1)[:,:k]).squeeze())
+        assert np.allclose(np.take_along_axis(omega,ID.reshape(20,k),-1),np.radians(omega_).reshape(20,k))
+
+    def test_query_missing(self):
+        omega,ID = RotationIndex(Rotation.from_random(2)).query(Rotation.from_random(),k=3)
+        assert np.isinf(omega[2]) and ID[2] == 2 and (np.sort(ID[:2]) == [0,1]).all()
+
+    def test_query_identical(self):
+        reference = Rotation.from_random(50)
+        omega,ID = RotationIndex(reference).query(reference)
+        assert np.allclose(omega,0.) and (ID == np.arange(50)).all()
+
+    def test_query_invalid(self):
+        with pytest.raises(ValueError):
+            RotationIndex(Rotation.from_random(2)).query(Rotation(),k=0)
+
+    @pytest.mark.parametrize('omega',[1.,20.,180.])
+    def test_query_within(self,omega):
+        reference = Rotation.from_random(300)
+        rotations = Rotation.from_random((2,5))
+        omega_ = np.degrees(rotations[...,np.newaxis].misorientation_angle(reference))
+        IDs = RotationIndex(reference).query_within(rotations,omega,degrees=True)
+        assert IDs.shape == rotations.shape
+        for i,j in np.ndindex(rotations.shape):
+            assert (IDs[i,j] == np.flatnonzero(omega_[i,j] <= omega)).all()
+
+    @pytest.mark.parametrize('omega',[.1,.5])
+    def test_query_within_orientation(self,omega):
+        reference = Orientation.from_random(shape=300,lattice='cI')
+        orientations = Orientation.from_random(shape=10,lattice='cI')
+        omega_ = orientations[:,np.newaxis].disorientation_angle(reference[np.newaxis,:])
+        IDs = RotationIndex(reference).query_within(orientations,omega)
+        for i in range(10):
+            assert (IDs[i] == np.flatnonzero(omega_[i] <= omega)).all()
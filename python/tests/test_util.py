@@ -1,4 +1,5 @@
 import sys
+import copy
 import random
 import pydoc
 
@@ -570,3 +571,23 @@ p2 : str, optional
 
         assert pydoc.render_doc(testfunction_outer, renderer=pydoc.plaintext).split("\n")[-2] ==\
               'testfunction_outer(*, a=None, b=None, c=None, d=None) -> int'
+
+    def test_profiler(self):
+        p = util.Profiler()
+        for i in range(3):
+            with p.record('a',2) as event:
+                event['bytes'] += i
+        with copy.deepcopy(p).record('b'):
+            pass
+        r = p.report()
+        assert r['a']['calls'] == 3 and r['a']['bytes'] == 9 and r['b']['calls'] == 1
+        assert r['a']['time/s'] >= 0.0 and 'phase' in repr(p)
+
+    def test_profiler_total(self):
+        p = util.Profiler()
+        with p.record('outer',total=True):
+            with p.record('inner'):
+                pass
+        r = p.report()
+        assert r['outer']['total'] and not r['inner']['total']
+        assert repr(p).index('totals:') < repr(p).index('outer')